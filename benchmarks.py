@@ -0,0 +1,550 @@
+#
+# Benchmarks for the catalog layer of template pilot. A synthetic
+# ROOT/domain/context/project/bundle/vNNN tree is published into a
+# temp folder and the catalog operations were timed over it.
+# Runs outside houdini.
+#
+#   python benchmarks.py metadata --bundles 100 500 --versions 5 --latency 2
+#   python benchmarks.py codec --bundles 2000 --versions 5
+#   python benchmarks.py search --names 100000
+#   python benchmarks.py publish --publishers 8 --publishes 25
+#   python benchmarks.py memory --versions 100000
+#   python benchmarks.py server --clients 200 --requests 20
+#   python benchmarks.py served-publish --bundles 8
+#
+import os
+import sys
+import time
+import json
+import shutil
+import random
+import argparse
+import tempfile
+import threading
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+import yaml
+os.environ.setdefault('HOUDINI_INTERNAL_PACKAGE_DIR', tempfile.gettempdir())
+from helpers import (FileOperations,
+                     json_loads,
+                     orjson,
+                     ConfigFormat,
+                     InfoFormat,
+                     CONFIG_FILE,
+                     INFO_FILE,
+                     MODULE_SAVE_FORMAT,
+                     VersionOperations,
+                     BundleVersion,
+                     reserve_version_folder)
+from catalog import CatalogSnapshot
+from journal import PublishJournal
+from search import TrigramIndex
+
+DOMAINS = ['Magical', 'Volumetrics', 'Water', 'Destruction']
+CONTEXTS = ['Obj', 'Sop', 'Dop', 'Vop']
+PROJECTS = ['aln', 'bk', 'grd', 'mnk']
+
+
+def make_catalog_tree(root_path: str,
+                      bundles: int,
+                      versions: int) -> None:
+    """
+    Publish a synthetic catalog with the same layout and
+    file formats as the Saver.
+
+    Args:
+        root_path (str): Root folder of the bundles
+        bundles (int): Number of bundles
+        versions (int): Number of versions per bundle
+    """
+
+    for bundle_no in range(bundles):
+        domain = DOMAINS[bundle_no % len(DOMAINS)]
+        context = CONTEXTS[bundle_no // len(DOMAINS) % len(CONTEXTS)]
+        project = PROJECTS[bundle_no % len(PROJECTS)]
+        bundle_name = f"bundle_{bundle_no}"
+        config_path = os.path.join(root_path, domain, context, project, bundle_name)
+        os.makedirs(config_path)
+        config = ConfigFormat(bundle_name, project, domain, context,
+                              'Module', config_path)
+        with open(os.path.join(config_path, CONFIG_FILE), 'w') as config_file:
+            config_file.write(json.dumps(config.data(), indent=4))
+        for version in range(1, versions + 1):
+            version_folder = os.path.join(config_path, f"v{str(version).zfill(3)}")
+            os.makedirs(version_folder)
+            info = InfoFormat('artist', context, version, 12, 'Module',
+                              os.path.join(version_folder,
+                                           f"{bundle_name}{MODULE_SAVE_FORMAT}"),
+                              '0.03Mb', '01-12-2023 22:12',
+                              f"version {version} of {bundle_name}")
+            with open(os.path.join(version_folder, INFO_FILE), 'w') as info_file:
+                info_file.write(json.dumps(info.data(), indent=4))
+
+
+def simulate_latency(latency: float) -> None:
+
+    """
+    Mimic the round trip of the network share. Every file open
+    waits the given latency before reading.
+
+    Args:
+        latency (float): seconds per open
+    """
+
+    load_file_datas = FileOperations.__dict__['load_file_datas'].__func__
+
+    def slow_load_file_datas(file_path):
+        time.sleep(latency)
+        return load_file_datas(file_path)
+
+    FileOperations.load_file_datas = staticmethod(slow_load_file_datas)
+
+
+def benchmark_metadata(args) -> None:
+
+    """Time a full catalog build for each worker count"""
+
+    if args.latency:
+        simulate_latency(args.latency / 1000.0)
+    print(f"{'bundles':>8} {'versions':>9} {'files':>7} "
+          f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    for bundles in args.bundles:
+        for versions in args.versions:
+            root_path = tempfile.mkdtemp(prefix='template_pilot_')
+            try:
+                make_catalog_tree(root_path, bundles, versions)
+                serial_time = None
+                for workers in args.workers:
+                    snapshot = CatalogSnapshot(max_workers=workers)
+                    start = time.perf_counter()
+                    snapshot.build(root_path)
+                    elapsed = time.perf_counter() - start
+                    serial_time = serial_time or elapsed
+                    print(f"{bundles:>8} {versions:>9} "
+                          f"{bundles * (versions + 1):>7} {workers:>8} "
+                          f"{elapsed:>9.3f} {serial_time / elapsed:>7.1f}x")
+            finally:
+                shutil.rmtree(root_path)
+
+
+def benchmark_codec(args) -> None:
+
+    """
+    Time the parse of every config.json and info.json of the catalog
+    with yaml.safe_load and the json codec. The file contents were read
+    up front, so only the parsers were compared.
+    """
+
+    root_path = tempfile.mkdtemp(prefix='template_pilot_')
+    try:
+        make_catalog_tree(root_path, args.bundles, args.versions)
+        contents = []
+        for root, _, files in os.walk(root_path):
+            for file_name in files:
+                with open(os.path.join(root, file_name), 'rb') as read_file:
+                    contents.append(read_file.read())
+    finally:
+        shutil.rmtree(root_path)
+
+    codecs = [('yaml.safe_load', yaml.safe_load),
+              ('json_loads', json_loads)]
+    if getattr(yaml, 'CSafeLoader', None):
+        codecs.insert(1, ('yaml CSafeLoader',
+                          lambda datas: yaml.load(datas, Loader=yaml.CSafeLoader)))
+    print(f"{len(contents)} files, json backend: "
+          f"{'orjson' if orjson is not None else 'json'}")
+    print(f"{'codec':>18} {'seconds':>9} {'per file us':>12} {'speedup':>8}")
+    baseline = None
+    for name, codec in codecs:
+        start = time.perf_counter()
+        for datas in contents:
+            codec(datas)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{name:>18} {elapsed:>9.3f} "
+              f"{elapsed / len(contents) * 1e6:>12.1f} {baseline / elapsed:>7.1f}x")
+
+
+def benchmark_search(args) -> None:
+
+    """
+    Time substring queries of the trigram index against the 
+    linear 'in' scan over the bundle names.
+    """
+
+    words = ['fog', 'rig', 'water', 'splash', 'fire', 'smoke', 'debris',
+             'crowd', 'ocean', 'rbd', 'pyro', 'grass', 'lava', 'dust']
+    rng = random.Random(7)
+    names = [f"{rng.choice(words)}_{rng.choice(words)}_{number}"
+             for number in range(args.names)]
+    trigram_index = TrigramIndex()
+    start = time.perf_counter()
+    for number, name in enumerate(names):
+        trigram_index.add(number, name)
+    print(f"{args.names} names indexed in {time.perf_counter() - start:.2f}s")
+
+    print(f"{'query':>14} {'matches':>8} {'linear ms':>10} "
+          f"{'trigram ms':>11} {'speedup':>8}")
+    for query in args.queries:
+        start = time.perf_counter()
+        linear = {number for number, name in enumerate(names) if query in name}
+        linear_time = time.perf_counter() - start
+        start = time.perf_counter()
+        matches = trigram_index.search(query)
+        index_time = time.perf_counter() - start
+        assert matches == linear
+        print(f"{query:>14} {len(matches):>8} {linear_time * 1000:>10.3f} "
+              f"{index_time * 1000:>11.3f} {linear_time / index_time:>7.1f}x")
+
+
+def publish_worker(bundle_folder_path: str,
+                   publishes: int) -> list:
+    """
+    One publisher process. Reserves versions of the bundle and 
+    journals each one, like the Saver does.
+
+    Args:
+        bundle_folder_path (str): Bundle folder shared by all publishers
+        publishes (int): Number of versions to publish
+
+    Returns:
+        list: reserved version numbers
+    """
+
+    publish_journal = PublishJournal(os.path.dirname(bundle_folder_path))
+    versions = []
+    for _ in range(publishes):
+        version = reserve_version_folder(bundle_folder_path)
+        publish_journal.publish_version(bundle_folder_path,
+                                        {'version': version, 'pid': os.getpid()})
+        versions.append(version)
+    return versions
+
+
+def benchmark_publish(args) -> None:
+
+    """
+    Stress the version allocation with many processes publishing
+    the same bundle at once. Every version must be reserved exactly 
+    once and journaled exactly once.
+    """
+
+    root_path = tempfile.mkdtemp(prefix='template_pilot_')
+    try:
+        bundle_folder_path = os.path.join(root_path, 'bundle')
+        os.makedirs(bundle_folder_path)
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.publishers) as pool:
+            results = pool.starmap(publish_worker,
+                                   [(bundle_folder_path, args.publishes)] 
+                                   * args.publishers)
+        elapsed = time.perf_counter() - start
+
+        versions = sorted(version for result in results for version in result)
+        total = args.publishers * args.publishes
+        publish_journal = PublishJournal(root_path)
+        with open(publish_journal.journal_path, 'rb') as journal_file:
+            records = [json_loads(line) for line in journal_file.read().splitlines()[1:]]
+        folders = sorted(os.listdir(bundle_folder_path))
+        print(f"{args.publishers} publishers x {args.publishes} publishes "
+              f"in {elapsed:.2f}s, {total / elapsed:.0f} versions/s")
+        assert versions == list(range(1, total + 1)), "duplicate or missing versions"
+        assert sorted(record['info']['version'] for record in records) == versions, \
+            "journal lost or duplicated records"
+        assert folders == [f"v{str(version).zfill(3)}" for version in versions], \
+            "unexpected version folders"
+        print(f"{total} distinct versions, {len(records)} journal records: ok")
+    finally:
+        shutil.rmtree(root_path)
+
+
+def dict_bundle_entity(config: dict,
+                       info: dict) -> dict:
+    """
+    Bundle entity as the dict built by the importer before
+    BundleVersion, for comparison.
+
+    Args:
+        config (dict): config.json datas of the bundle
+        info (dict): info.json datas of the version
+
+    Returns:
+        dict: bundle entity of the version
+    """
+
+    return dict(bundle_name=config['name'],
+                project_name=config['project'],
+                user_name=info['user_name'],
+                node_count=info['node_count'],
+                domain=config['domain'],
+                context=config['context'],
+                bundle_type=info['type'],
+                file_size=info['file_size'],
+                created_on=info['Created On'],
+                version=VersionOperations(info['version']).pad_version_identifier_to_number(),
+                module_path=info['module_path'],
+                config_path=config['config_path'],
+                comments=info['comments'])
+
+
+def benchmark_memory(args) -> None:
+
+    """
+    Trace the memory held by the bundle entities of a catalog, built 
+    as dicts and as BundleVersion records. The config.json and info.json
+    datas were decoded one by one like the catalog reads, so no string
+    is shared between versions unless interned.
+    """
+
+    rng = random.Random(7)
+    users = [f"artist_{number}" for number in range(args.users)]
+    datas = []
+    for version_no in range(args.versions):
+        bundle_no = version_no // args.versions_per_bundle
+        bundle_name = f"bundle_{bundle_no}"
+        context = CONTEXTS[bundle_no % len(CONTEXTS)]
+        config_path = os.path.join('R:', DOMAINS[bundle_no % len(DOMAINS)],
+                                   context, PROJECTS[bundle_no % len(PROJECTS)],
+                                   bundle_name)
+        version = version_no % args.versions_per_bundle + 1
+        config = ConfigFormat(bundle_name, PROJECTS[bundle_no % len(PROJECTS)],
+                              DOMAINS[bundle_no % len(DOMAINS)], context,
+                              'Module', config_path)
+        info = InfoFormat(rng.choice(users), context, version, rng.randint(1, 400),
+                          'Module',
+                          os.path.join(config_path, f"v{str(version).zfill(3)}",
+                                       f"{bundle_name}{MODULE_SAVE_FORMAT}"),
+                          '0.03Mb', '01-12-2023 22:12',
+                          f"version {version} of {bundle_name}")
+        datas.append((json_loads(json.dumps(config.data())),
+                      json_loads(json.dumps(info.data()))))
+
+    print(f"{args.versions} versions, {args.versions // args.versions_per_bundle} "
+          f"bundles, {args.users} users")
+    print(f"{'entity':>14} {'MB':>8} {'bytes/version':>14} {'MB per 100k':>12}")
+    baseline = None
+    for name, make_entity in [('dict', dict_bundle_entity),
+                              ('BundleVersion', BundleVersion.from_datas)]:
+        tracemalloc.start()
+        entities = [make_entity(config, info) for config, info in datas]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del entities
+        baseline = baseline or size
+        print(f"{name:>14} {size / 1024**2:>8.1f} {size / args.versions:>14.0f} "
+              f"{size / args.versions * 100000 / 1024**2:>12.1f}")
+    print(f"saved {(baseline - size) / args.versions * 100000 / 1024**2:.1f}MB "
+          f"per 100k versions, {baseline / size:.1f}x less")
+
+
+def benchmark_server(args) -> None:
+
+    """
+    Load test of the catalog service. Hundreds of clients on
+    localhost send a mix of the importer and saver queries at once,
+    the latency percentiles and the throughput reported.
+    """
+
+    from model import Templates
+    from catalog_server import CatalogService, CatalogServer
+    from catalog_client import CatalogClient
+
+    root_path = tempfile.mkdtemp(prefix='template_pilot_')
+    try:
+        make_catalog_tree(root_path, args.bundles, args.versions)
+        templates = Templates(root_path=root_path,
+                              index_path=os.path.join(root_path, 'catalog.db'),
+                              server_url='')
+        service = CatalogService(templates)
+        server = CatalogServer(('127.0.0.1', 0), service)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        server_url = f"http://127.0.0.1:{server.server_address[1]}"
+        queries = [
+            ('get_all_bundles', {}),
+            ('get_all_bundles', {'matching_text': '_1'}),
+            ('get_all_bundles', {'project_name': 'aln', 'all_mode': False}),
+            ('list_all_bundle_entity', {'project_name': 'bk'}),
+            ('list_all_bundle_entity', {'bundle_name': 'bundle_7'}),
+            ('search_comments', {'text': 'version 3'}),
+            ('bundle_name_conflict', {'bundle_name': 'bundle_5', 'project_name': 'aln'}),
+            ('snapshot', {}),
+        ]
+
+        def client(client_no: int) -> list:
+            catalog_client = CatalogClient(server_url, timeout=60)
+            latencies = []
+            for request_no in range(args.requests):
+                name, params = queries[(client_no + request_no) % len(queries)]
+                start = time.perf_counter()
+                getattr(catalog_client, name)(**params)
+                latencies.append(time.perf_counter() - start)
+            return latencies
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as pool:
+            results = list(pool.map(client, range(args.clients)))
+        elapsed = time.perf_counter() - start
+        server.shutdown()
+        server.server_close()
+
+        latencies = sorted(latency for result in results for latency in result)
+
+        def percentile(fraction):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+        print(f"{args.bundles} bundles x {args.versions} versions, "
+              f"{args.clients} clients x {args.requests} requests")
+        print(f"{len(latencies)} requests in {elapsed:.2f}s, "
+              f"{len(latencies) / elapsed:.0f} requests/s")
+        print(f"latency ms  p50 {percentile(0.5):.1f}  p95 {percentile(0.95):.1f}  "
+              f"p99 {percentile(0.99):.1f}  max {latencies[-1] * 1000:.1f}")
+    finally:
+        shutil.rmtree(root_path)
+
+
+def benchmark_served_publish(args) -> None:
+
+    """
+    Publish from a workstation served by the catalog service, like
+    the Saver does, then validate bundle names. The refreshed catalog
+    must still hold every served bundle, so the names of the other
+    projects keep conflicting.
+    """
+
+    from model import Templates, BundleOpearations
+    from catalog_server import CatalogService, CatalogServer
+
+    root_path = tempfile.mkdtemp(prefix='template_pilot_')
+    try:
+        make_catalog_tree(root_path, args.bundles, 2)
+        service = CatalogService(Templates(root_path=root_path,
+                                           index_path=os.path.join(root_path, 'service.db'),
+                                           server_url=''))
+        server = CatalogServer(('127.0.0.1', 0), service)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        templates = Templates(root_path=root_path,
+                              index_path=os.path.join(root_path, 'workstation.db'),
+                              server_url=f"http://127.0.0.1:{server.server_address[1]}")
+        assert templates.served_generation, "catalog not served"
+
+        bundle_folder_path = os.path.join(root_path, 'Magical', 'Obj', 'aln', 'served_bundle')
+        bundle_operations = BundleOpearations(bundle_folder_path, 1,
+                                              templates.catalog_index,
+                                              templates.journal)
+        bundle_operations.make_config_file_path_directory()
+        bundle_operations.generate_info_file(
+            ConfigFormat('served_bundle', 'aln', 'Magical', 'Obj', 'Module',
+                         bundle_folder_path).data(),
+            file_type=CONFIG_FILE
+        )
+        bundle_operations = BundleOpearations.allocate_version(bundle_folder_path,
+                                                               templates.catalog_index,
+                                                               templates.journal)
+        bundle_operations.generate_info_file(
+            InfoFormat('artist', 'Obj', bundle_operations.version, 12, 'Module',
+                       os.path.join(bundle_operations.folder_path,
+                                    f"served_bundle{MODULE_SAVE_FORMAT}"),
+                       '0.03Mb', '01-12-2023 22:12', 'served publish').data(),
+            file_type=INFO_FILE
+        )
+        templates.bump_generation()
+        templates.refresh()
+        if templates.journal.needs_compaction():
+            templates.compact_journal()
+        server.shutdown()
+        server.server_close()
+
+        bundle_names = sorted(config['name'] for config in templates.snapshot.bundles.values())
+        print(f"{len(bundle_names)} bundles after the publish, "
+              f"served generation {templates.served_generation}")
+        assert len(bundle_names) == args.bundles + 1, "served catalog lost on refresh"
+        assert 'served_bundle' in bundle_names, "published bundle missing"
+        for bundle_no in range(args.bundles):
+            project = PROJECTS[bundle_no % len(PROJECTS)]
+            other_project = PROJECTS[(bundle_no + 1) % len(PROJECTS)]
+            assert templates.bundle_name_conflict(f"bundle_{bundle_no}", other_project) == project, \
+                f"bundle_{bundle_no} of {project} not seen as a conflict"
+        assert templates.bundle_name_conflict('served_bundle', 'bk') == 'aln', \
+            "published bundle not seen as a conflict"
+        print(f"{args.bundles + 1} bundle names conflicting with the other projects: ok")
+    finally:
+        shutil.rmtree(root_path)
+
+
+def main(argv: list) -> None:
+
+    """Parse the command line and run the requested benchmark"""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    benchmarks = parser.add_subparsers(dest='benchmark', required=True)
+
+    metadata = benchmarks.add_parser(
+        'metadata',
+        help='parallel config.json/info.json reads against catalog size'
+    )
+    metadata.add_argument('--bundles', type=int, nargs='+', default=[100, 500])
+    metadata.add_argument('--versions', type=int, nargs='+', default=[1, 5])
+    metadata.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16, 32])
+    metadata.add_argument('--latency', type=float, default=2.0,
+                          help='simulated share round trip per open in ms')
+    metadata.set_defaults(run=benchmark_metadata)
+
+    codec = benchmarks.add_parser(
+        'codec',
+        help='yaml.safe_load against the json codec on catalog files'
+    )
+    codec.add_argument('--bundles', type=int, default=2000)
+    codec.add_argument('--versions', type=int, default=5)
+    codec.set_defaults(run=benchmark_codec)
+
+    search = benchmarks.add_parser(
+        'search',
+        help='trigram index against linear scan of bundle names'
+    )
+    search.add_argument('--names', type=int, default=100000)
+    search.add_argument('--queries', nargs='+',
+                        default=['lava_dust', 'splash_9', 'x', '_99', 'rbd_pyro_12'])
+    search.set_defaults(run=benchmark_search)
+
+    publish = benchmarks.add_parser(
+        'publish',
+        help='concurrent publishers of one bundle, stress of the version allocation'
+    )
+    publish.add_argument('--publishers', type=int, default=8)
+    publish.add_argument('--publishes', type=int, default=25)
+    publish.set_defaults(run=benchmark_publish)
+
+    memory = benchmarks.add_parser(
+        'memory',
+        help='tracemalloc of the bundle entities, dicts against BundleVersion records'
+    )
+    memory.add_argument('--versions', type=int, default=100000)
+    memory.add_argument('--versions-per-bundle', type=int, default=5)
+    memory.add_argument('--users', type=int, default=40)
+    memory.set_defaults(run=benchmark_memory)
+
+    server = benchmarks.add_parser(
+        'server',
+        help='concurrent localhost clients of the catalog service'
+    )
+    server.add_argument('--bundles', type=int, default=500)
+    server.add_argument('--versions', type=int, default=5)
+    server.add_argument('--clients', type=int, default=200)
+    server.add_argument('--requests', type=int, default=20)
+    server.set_defaults(run=benchmark_server)
+
+    served_publish = benchmarks.add_parser(
+        'served-publish',
+        help='publish with the catalog service configured, then validate bundle names'
+    )
+    served_publish.add_argument('--bundles', type=int, default=8)
+    served_publish.set_defaults(run=benchmark_served_publish)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == '__main__':
+
+    main(sys.argv[1:])
@@ -0,0 +1,913 @@
+#
+# Persistent catalog index for template pilot. Every published bundle
+# and its versions were registered into a local sqlite file, so the
+# importer and saver queries are answered without walking the
+# network share. A full rescan of ROOT_TEMPLATE_PATH only happens
+# on demand. The CatalogSnapshot is the in-memory view loaded from
+# the index or built by a single walk of the tree.
+#
+import os
+import sys
+import json
+import sqlite3
+from contextlib import contextmanager
+from search import TrigramIndex
+from helpers import (FileOperations,
+                     json_loads,
+                     ROOT_TEMPLATE_PATH,
+                     CONFIG_FILE,
+                     INFO_FILE,
+                     VERSIONS_FILE,
+                     CATALOG_CACHE_DIR,
+                     CATALOG_INDEX_FILE,
+                     METADATA_READ_WORKERS,
+                     VERSION_FOLDER,
+                     typed_info_datas)
+
+# Depth of the bundle folders. ROOT/domain/context/project/bundle
+BUNDLE_DEPTH = 4
+# info.json values repeated over the catalog, one shared string each
+INTERNED_INFO_KEYS = ('user_name', 'context', 'type')
+
+
+class CatalogSnapshot(FileOperations):
+
+    """
+    In-memory view of the whole catalog. Built by one walk of the
+    ROOT_TEMPLATE_PATH or loaded from the catalog index. All the
+    Templates queries were answered from this object without touching
+    the file system.
+
+    bundles holds config.json datas keyed by config path and versions
+    holds info.json datas keyed by config path and version number.
+    The trigram index of the bundle names, and of the comments once
+    searched, were kept up to date with every change. name_projects
+    maps every bundle name to the projects using it for the saver
+    validation.
+    """
+
+    def __init__(self,
+                 max_workers: int = METADATA_READ_WORKERS) -> None:
+        """Initialize empty bundles, versions and directory states
+
+        Args:
+            max_workers (int, optional): Number of parallel metadata reads.
+                                        Defaults to METADATA_READ_WORKERS.
+        """
+
+        super().__init__()
+        self.max_workers = max_workers
+        self.bundles = {}
+        self.versions = {}
+        self.name_index = TrigramIndex()
+        # bundle name -> {project name: bundle count}
+        self.name_projects = {}
+        # Built on the first comment search
+        self.comment_index = None
+        # directory path -> (mtime of last scan, sub directory paths)
+        self.directories = {}
+        # bundle directory path -> config path of the bundle
+        self.locations = {}
+        # bundle directory path, mtime, config path, new version folders,
+        # versions.json exist
+        self.pending_reads = []
+        self.relisted = 0
+
+    def build(self,
+              root_path: str = ROOT_TEMPLATE_PATH) -> None:
+        """
+        Walk the root path once, read every config.json and the
+        info.json of its version folders.
+
+        Args:
+            root_path (str, optional): Root folder of the published bundles.
+                                        Defaults to ROOT_TEMPLATE_PATH.
+        """
+
+        self.clear()
+        self.directories = {}
+        self.locations = {}
+        self.update(root_path)
+
+    def clear(self) -> None:
+
+        """Remove all the bundles and versions"""
+
+        self.bundles = {}
+        self.versions = {}
+        self.name_index = TrigramIndex()
+        self.name_projects = {}
+        self.comment_index = None
+
+    def update(self,
+               root_path: str = ROOT_TEMPLATE_PATH) -> int:
+        """
+        Incrementally merge the changes of the file system into the
+        snapshot. The layout is fixed by the Saver as
+        ROOT/domain/context/project/bundle/vNNN, so the scanner never
+        looks below the version folders.
+
+        The domain, context and project folders were listed with
+        os.scandir, which hands back the mtime of the folders beneath
+        without an extra stat call per folder on windows shares. Only the
+        bundle folders whose mtime changed since the last scan were listed
+        again. config.json and versions.json (or info.json of legacy bundles)
+        were read only for the changed bundles, all of them at once with
+        the thread pool after the directories were visited.
+
+        Args:
+            root_path (str, optional): Root folder of the published bundles.
+                                        Defaults to ROOT_TEMPLATE_PATH.
+
+        Returns:
+            int: number of bundle directories listed again
+        """
+
+        self.relisted = 0
+        self.pending_reads = []
+        # Share not reachable. Keep the last known catalog.
+        if not os.path.isdir(root_path):
+            return self.relisted
+        self.update_layout_directory(root_path, 0)
+        self.load_pending_reads()
+        return self.relisted
+
+    def update_layout_directory(self,
+                                path: str,
+                                depth: int) -> None:
+        """
+        List a root, domain, context or project folder and recurse
+        down to the bundle folders. Folders disappeared since the last
+        scan were dropped with the bundles beneath.
+
+        Args:
+            path (str): directory path
+            depth (int): level below the root. ROOT/domain/context/project
+        """
+
+        try:
+            with os.scandir(path) as entries:
+                # Hidden folders are removed bundles waiting for deletion
+                children = {entry.path: entry.stat().st_mtime
+                            for entry in entries 
+                            if entry.is_dir() and not entry.name.startswith('.')}
+        except OSError:
+            self.drop_directory(path)
+            return
+
+        known = self.directories.get(path)
+        for child in set(known[1] if known else []) - set(children):
+            self.drop_directory(child)
+        self.directories[path] = (None, sorted(children))
+
+        for child, mtime in sorted(children.items()):
+            if depth + 1 == BUNDLE_DEPTH:
+                self.update_bundle_directory(child, mtime)
+            else:
+                self.update_layout_directory(child, depth + 1)
+
+    def update_bundle_directory(self,
+                                path: str,
+                                mtime: float) -> None:
+        """
+        Compare the bundle folder mtime with the last scan. If changed,
+        queue the config.json of a new bundle and the new version folders
+        for reading. Versions whose folder disappeared were removed.
+
+        Args:
+            path (str): bundle directory path
+            mtime (float): modified time of the bundle directory
+        """
+
+        known = self.directories.get(path)
+        if known and known[0] == mtime:
+            return
+        self.relisted += 1
+
+        try:
+            with os.scandir(path) as entries:
+                entries = list(entries)
+        except OSError:
+            self.drop_directory(path)
+            return
+
+        # Half published folders were listed again on next update
+        self.directories[path] = (None, [])
+        files = {entry.name for entry in entries if entry.is_file()}
+        if CONFIG_FILE not in files:
+            return
+
+        config_path = self.locations.get(path)
+        if config_path not in self.bundles:
+            config_path = None
+
+        listed_versions = {
+            int(entry.name[1:]): entry.path for entry in entries
+            if VERSION_FOLDER.match(entry.name) and entry.is_dir()
+        }
+        known_versions = self.versions.get(config_path, {})
+        for version in set(known_versions) - set(listed_versions):
+            self.remove_version(config_path, version)
+
+        new_versions = {version: version_folder 
+                        for version, version_folder in listed_versions.items()
+                        if version not in known_versions}
+        if config_path is None or new_versions:
+            self.pending_reads.append((path, mtime, config_path, new_versions,
+                                       VERSIONS_FILE in files))
+        else:
+            self.directories[path] = (mtime, [])
+
+    def load_pending_reads(self) -> None:
+
+        """
+        Read every queued config.json and versions.json concurrently
+        and merge them into the snapshot. Version folders missing
+        from the manifest (legacy bundles) fall back to their info.json,
+        read concurrently in a second pass.
+        """
+
+        file_paths = []
+        for path, _, config_path, _, has_manifest in self.pending_reads:
+            if config_path is None:
+                file_paths.append(os.path.join(path, CONFIG_FILE))
+            if has_manifest:
+                file_paths.append(os.path.join(path, VERSIONS_FILE))
+        datas = iter(self.read_files_datas(file_paths, self.max_workers))
+
+        fallbacks = []
+        for path, mtime, config_path, new_versions, has_manifest in self.pending_reads:
+            if config_path is None:
+                config = next(datas)
+                self.add_bundle(config)
+                config_path = config['config_path']
+                self.locations[path] = config_path
+            manifest = {}
+            if has_manifest:
+                manifest = {int(info['version']): info 
+                            for info in next(datas)['versions']}
+            complete = True
+            for version, version_folder in sorted(new_versions.items()):
+                info_file_path = os.path.join(version_folder, INFO_FILE)
+                if version in manifest:
+                    self.add_version(config_path, manifest[version])
+                elif os.path.isfile(info_file_path):
+                    fallbacks.append((config_path, info_file_path))
+                else:
+                    complete = False
+            # Half published folders were listed again on next update
+            self.directories[path] = (mtime if complete else None, [])
+        self.pending_reads = []
+
+        infos = self.read_files_datas([info_file_path for _, info_file_path in fallbacks],
+                                      self.max_workers)
+        for (config_path, _), info in zip(fallbacks, infos):
+            self.add_version(config_path, info)
+
+    def drop_directory(self,
+                       path: str) -> None:
+        """Forget the directory and every bundle beneath it
+
+        Args:
+            path (str): directory path
+        """
+
+        prefix = path + os.sep
+        for directory in [directory for directory in self.directories
+                          if directory == path or directory.startswith(prefix)]:
+            del self.directories[directory]
+            config_path = self.locations.pop(directory, None)
+            if config_path:
+                self.remove_bundle(config_path)
+
+    def add_bundle(self,
+                   config: dict) -> None:
+        """Add or update a bundle
+
+        Args:
+            config (dict): config.json datas of the bundle
+        """
+
+        if config['config_path'] in self.bundles:
+            self.forget_bundle_name(self.bundles[config['config_path']])
+        self.bundles[config['config_path']] = config
+        self.versions.setdefault(config['config_path'], {})
+        self.name_index.add(config['config_path'], config['name'])
+        projects = self.name_projects.setdefault(config['name'], {})
+        projects[config['project']] = projects.get(config['project'], 0) + 1
+
+    def forget_bundle_name(self,
+                           config: dict) -> None:
+        """Remove the bundle from the name to projects map
+
+        Args:
+            config (dict): config.json datas of the bundle
+        """
+
+        projects = self.name_projects.get(config['name'], {})
+        projects[config['project']] = projects.get(config['project'], 1) - 1
+        if projects[config['project']] <= 0:
+            del projects[config['project']]
+        if not projects:
+            self.name_projects.pop(config['name'], None)
+
+    def add_version(self,
+                    config_path: str,
+                    info: dict) -> None:
+        """Add or update a version of the bundle
+
+        Args:
+            config_path (str): config path of the bundle
+            info (dict): info.json datas of the version
+        """
+
+        typed_info_datas(info)
+        for key in INTERNED_INFO_KEYS:
+            if isinstance(info.get(key), str):
+                info[key] = sys.intern(info[key])
+        self.versions.setdefault(config_path, {})[int(info['version'])] = info
+        if self.comment_index is not None:
+            self.comment_index.add((config_path, int(info['version'])),
+                                   info['comments'].lower())
+
+    def remove_version(self,
+                       config_path: str,
+                       version: int) -> None:
+        """Remove a version of the bundle
+
+        Args:
+            config_path (str): config path of the bundle
+            version (int): numeric version number
+        """
+
+        self.versions.get(config_path, {}).pop(int(version), None)
+        if self.comment_index is not None:
+            self.comment_index.remove((config_path, int(version)))
+
+    def remove_bundle(self,
+                      config_path: str) -> None:
+        """Remove the bundle and all its versions
+
+        Args:
+            config_path (str): config path of the bundle
+        """
+
+        config = self.bundles.pop(config_path, None)
+        if config is not None:
+            self.forget_bundle_name(config)
+        for version in self.versions.pop(config_path, {}):
+            if self.comment_index is not None:
+                self.comment_index.remove((config_path, version))
+        self.name_index.remove(config_path)
+
+    def merge(self,
+              bundles: list,
+              versions: list) -> None:
+        """
+        Merge a whole catalog, like the one served by the catalog 
+        service, into the snapshot. Datas equal to the held ones kept as
+        the same objects, so a diff of the version states reports only 
+        the versions really changed.
+
+        Args:
+            bundles (list): config.json datas of every bundle
+            versions (list): (config path, info.json datas) of every version
+        """
+
+        served_bundles = set()
+        for config in bundles:
+            served_bundles.add(config['config_path'])
+            if self.bundles.get(config['config_path']) != config:
+                self.add_bundle(config)
+        served_versions = set()
+        for config_path, info in versions:
+            typed_info_datas(info)
+            version = int(info['version'])
+            served_versions.add((config_path, version))
+            if self.versions.get(config_path, {}).get(version) != info:
+                self.add_version(config_path, info)
+        for config_path in list(self.bundles):
+            if config_path not in served_bundles:
+                self.remove_bundle(config_path)
+        for config_path, held_versions in list(self.versions.items()):
+            for version in list(held_versions):
+                if (config_path, version) not in served_versions:
+                    self.remove_version(config_path, version)
+
+    def name_used_in_other_project(self,
+                                   bundle_name: str,
+                                   project_name: str) -> str:
+        """
+        Constant time check of the bundle name used by another project.
+        Same bundle name allowed again within its own project.
+
+        Args:
+            bundle_name (str): bundle name to validate
+            project_name (str): project publishing the bundle
+
+        Returns:
+            str: other project using the name, '' if the name is free
+        """
+
+        projects = self.name_projects.get(bundle_name)
+        if not projects or project_name in projects:
+            return ''
+        return min(projects)
+
+    def search_bundles(self,
+                       text: str) -> list:
+        """Bundles whose name contains the text
+
+        Args:
+            text (str): substring of the bundle name
+
+        Returns:
+            list: config.json datas sorted by project and name
+        """
+
+        return sorted((self.bundles[config_path]
+                       for config_path in self.name_index.search(text)),
+                      key=lambda config: (config['project'], config['name']))
+
+    def search_comments(self,
+                        text: str) -> list:
+        """Versions whose comments contain the text, ignoring case
+
+        Args:
+            text (str): substring of the comments
+
+        Returns:
+            list: sorted tuples of config path and version number
+        """
+
+        if self.comment_index is None:
+            self.comment_index = TrigramIndex()
+            for config_path, info in self.iter_versions():
+                self.comment_index.add((config_path, int(info['version'])),
+                                       info['comments'].lower())
+        return sorted(self.comment_index.search(text.lower()))
+
+    def iter_bundles(self):
+
+        """Iterate over the bundles sorted by project and name
+
+        Yields:
+            dict: config.json datas of the bundle
+        """
+
+        yield from sorted(self.bundles.values(),
+                          key=lambda config: (config['project'], config['name']))
+
+    def iter_versions(self,
+                      config_path: str = ''):
+        """Iterate over the versions sorted by version number
+
+        Args:
+            config_path (str, optional): Only the versions of this bundle.
+                                        Defaults to '' for all bundles.
+
+        Yields:
+            tuple: config path and info.json datas of the version
+        """
+
+        if config_path:
+            config_paths = [config_path]
+        else:
+            config_paths = [config['config_path'] for config in self.iter_bundles()]
+        for path in config_paths:
+            versions = self.versions.get(path, {})
+            for version in sorted(versions):
+                yield path, versions[version]
+
+    def version_state(self) -> dict:
+
+        """
+        Every version keyed by (config path, version number) with its
+        config.json and info.json datas. A sync replaces the datas of the
+        changed versions only, the unchanged keep the same objects.
+
+        Returns:
+            dict: version key and (config, info) datas
+        """
+
+        return {(config_path, version): (self.bundles.get(config_path), info)
+                for config_path, versions in self.versions.items()
+                for version, info in versions.items()}
+
+    @staticmethod
+    def diff_version_state(before: dict,
+                           after: dict) -> tuple:
+        """
+        Versions changed between two version states. Compared by
+        identity of the datas, no datas compared field by field.
+
+        Args:
+            before (dict): version state before the sync
+            after (dict): version state after the sync
+
+        Returns:
+            tuple:  keys of the added or changed versions,
+                    keys of the removed versions
+        """
+
+        changed = [key for key, (config, info) in after.items()
+                   if key not in before or
+                   before[key][0] is not config or before[key][1] is not info]
+        removed = [key for key in before if key not in after]
+        return changed, removed
+
+
+class CatalogIndex(FileOperations):
+
+    """
+    Local sqlite index of the bundle catalog. Holds bundles keyed by
+    the config path of the bundle and versions keyed by config path and
+    version number. The raw config.json and info.json datas were stored 
+    as it is, so the readers get back exactly what was published.
+    The directories table holds the mtimes of the last scan for the
+    incremental updates and the state table holds the position of the
+    last publish journal replay.
+    """
+
+    # Bumped on every schema change. Older index files were rebuilt.
+    SCHEMA_VERSION = 5
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS bundles (
+            config_path TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            project TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            context TEXT NOT NULL,
+            bundle_type TEXT,
+            config TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS versions (
+            config_path TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            info TEXT NOT NULL,
+            PRIMARY KEY (config_path, version)
+        );
+        CREATE TABLE IF NOT EXISTS directories (
+            path TEXT PRIMARY KEY,
+            mtime REAL,
+            children TEXT NOT NULL,
+            config_path TEXT
+        );
+        CREATE TABLE IF NOT EXISTS state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE INDEX IF NOT EXISTS bundles_name ON bundles (name);
+        CREATE INDEX IF NOT EXISTS bundles_project ON bundles (project);
+    """
+
+    def __init__(self,
+                 index_path: str = '',
+                 root_path: str = ROOT_TEMPLATE_PATH) -> None:
+        """
+        Initialize the index file path and create the tables
+        if not exist.
+
+        Args:
+            index_path (str, optional): Path of the sqlite file. Defaults to
+                                        catalog.db under the catalog cache dir.
+            root_path (str, optional): Root folder of the published bundles.
+                                        Defaults to ROOT_TEMPLATE_PATH.
+        """
+
+        super().__init__()
+        self.root_path = root_path
+        self.index_path = index_path or os.path.join(CATALOG_CACHE_DIR,
+                                                     CATALOG_INDEX_FILE)
+        index_dir = os.path.dirname(self.index_path)
+        if index_dir and not os.path.exists(index_dir):
+            os.makedirs(index_dir, exist_ok=True)
+        with self.connection() as connection:
+            schema_version, = connection.execute(
+                "PRAGMA user_version"
+            ).fetchone()
+            if schema_version != self.SCHEMA_VERSION:
+                connection.executescript(
+                    "DROP TABLE IF EXISTS bundles;"
+                    "DROP TABLE IF EXISTS versions;"
+                    "DROP TABLE IF EXISTS directories;"
+                    "DROP TABLE IF EXISTS state;"
+                )
+                connection.execute(
+                    f"PRAGMA user_version = {self.SCHEMA_VERSION}"
+                )
+            connection.executescript(self.SCHEMA)
+
+    @contextmanager
+    def connection(self,
+                   connection: sqlite3.Connection = None):
+        """Open a short lived sqlite connection. Changes were
+        committed when the block exits without error.
+
+        Args:
+            connection (sqlite3.Connection, optional): connection of an 
+                                        outer block, used as it is and 
+                                        committed by that block. 
+                                        Defaults to None.
+
+        Yields:
+            sqlite3.Connection: connection to the index file
+        """
+
+        if connection is not None:
+            yield connection
+            return
+        connection = sqlite3.connect(self.index_path)
+        try:
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    def is_empty(self) -> bool:
+
+        """Check any bundle registered in the index
+
+        Returns:
+            bool: True if no bundle found in the index
+        """
+
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM bundles LIMIT 1"
+            ).fetchone()
+        return row is None
+
+    def get_state(self,
+                  key: str,
+                  default: str = '') -> str:
+        """Read a value of the state table
+
+        Args:
+            key (str): state name
+            default (str, optional): value if not stored. Defaults to ''.
+
+        Returns:
+            str: stored value
+        """
+
+        with self.connection() as connection:
+            row = connection.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else default
+
+    def set_state(self,
+                  key: str,
+                  value: str) -> None:
+        """Store a value in the state table
+
+        Args:
+            key (str): state name
+            value (str): value to store
+        """
+
+        with self.connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO state VALUES (?, ?)", (key, str(value))
+            )
+
+    def rescan(self) -> CatalogSnapshot:
+
+        """
+        Walk the whole ROOT_TEMPLATE_PATH once and rebuild the index
+        from the config.json and info.json files. Costly on the network
+        share, so only called on demand.
+
+        Returns:
+            CatalogSnapshot: snapshot built from the walk
+        """
+
+        snapshot = CatalogSnapshot()
+        snapshot.build(self.root_path)
+        self.store(snapshot)
+        return snapshot
+
+    def store(self,
+              snapshot: CatalogSnapshot) -> None:
+        """Replace the index contents with the given snapshot
+
+        Args:
+            snapshot (CatalogSnapshot): catalog snapshot to store
+        """
+
+        with self.connection() as connection:
+            connection.execute("DELETE FROM versions")
+            connection.execute("DELETE FROM bundles")
+            connection.execute("DELETE FROM directories")
+            connection.executemany(
+                "INSERT INTO directories VALUES (?, ?, ?, ?)",
+                [(path, mtime, json.dumps(children), snapshot.locations.get(path))
+                 for path, (mtime, children) in snapshot.directories.items()]
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO bundles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self.bundle_row(config) for config in snapshot.iter_bundles()]
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?, ?)",
+                [self.version_row(config_path, info)
+                 for config_path, info in snapshot.iter_versions()]
+            )
+
+    def snapshot(self) -> CatalogSnapshot:
+
+        """Load the whole index into a catalog snapshot
+
+        Returns:
+            CatalogSnapshot: snapshot of the indexed catalog
+        """
+
+        snapshot = CatalogSnapshot()
+        for config in self.bundles():
+            snapshot.add_bundle(config)
+        for config_path, info in self.versions():
+            snapshot.add_version(config_path, info)
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT path, mtime, children, config_path FROM directories"
+            ).fetchall()
+        for path, mtime, children, config_path in rows:
+            snapshot.directories[path] = (mtime, json_loads(children))
+            if config_path:
+                snapshot.locations[path] = config_path
+        return snapshot
+
+    def update(self,
+               snapshot: CatalogSnapshot) -> CatalogSnapshot:
+        """
+        Merge the file system changes since the last scan into
+        the snapshot and store it back when anything changed.
+
+        Args:
+            snapshot (CatalogSnapshot): snapshot loaded from this index
+
+        Returns:
+            CatalogSnapshot: the updated snapshot
+        """
+
+        if snapshot.update(self.root_path):
+            self.store(snapshot)
+        return snapshot
+
+    @staticmethod
+    def bundle_row(config: dict) -> tuple:
+
+        """Convert config.json datas into bundles table row
+
+        Args:
+            config (dict): config.json datas
+
+        Returns:
+            tuple: bundles table row
+        """
+
+        return (config['config_path'],
+                config['name'],
+                config['project'],
+                config['domain'],
+                config['context'],
+                config.get('bundle_type', ''),
+                json.dumps(config))
+
+    @staticmethod
+    def version_row(config_path: str,
+                    info: dict) -> tuple:
+        """Convert info.json datas into versions table row
+
+        Args:
+            config_path (str): config path of the bundle holds the version
+            info (dict): info.json datas
+
+        Returns:
+            tuple: versions table row
+        """
+
+        return (config_path,
+                int(info['version']),
+                json.dumps(info))
+
+    def register_bundle(self,
+                        config: dict,
+                        connection: sqlite3.Connection = None) -> None:
+        """Add or update a bundle in the index
+
+        Args:
+            config (dict): config.json datas of the bundle
+            connection (sqlite3.Connection, optional): connection of an 
+                                        outer transaction. Defaults to None.
+        """
+
+        with self.connection(connection) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO bundles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self.bundle_row(config)
+            )
+
+    def register_version(self,
+                         config_path: str,
+                         info: dict,
+                         connection: sqlite3.Connection = None) -> None:
+        """Add or update a version of the bundle in the index
+
+        Args:
+            config_path (str): config path of the bundle
+            info (dict): info.json datas of the version
+            connection (sqlite3.Connection, optional): connection of an 
+                                        outer transaction. Defaults to None.
+        """
+
+        with self.connection(connection) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?, ?)",
+                self.version_row(config_path, info)
+            )
+
+    def unregister_version(self,
+                           config_path: str,
+                           version: int,
+                           connection: sqlite3.Connection = None) -> None:
+        """Remove a version of the bundle from the index
+
+        Args:
+            config_path (str): config path of the bundle
+            version (int): numeric version number
+            connection (sqlite3.Connection, optional): connection of an 
+                                        outer transaction. Defaults to None.
+        """
+
+        with self.connection(connection) as connection:
+            connection.execute(
+                "DELETE FROM versions WHERE config_path = ? AND version = ?",
+                (config_path, int(version))
+            )
+
+    def unregister_bundle(self,
+                          config_path: str,
+                          connection: sqlite3.Connection = None) -> None:
+        """Remove the bundle and all its versions from the index
+
+        Args:
+            config_path (str): config path of the bundle
+            connection (sqlite3.Connection, optional): connection of an 
+                                        outer transaction. Defaults to None.
+        """
+
+        with self.connection(connection) as connection:
+            connection.execute(
+                "DELETE FROM versions WHERE config_path = ?",
+                (config_path,)
+            )
+            connection.execute(
+                "DELETE FROM bundles WHERE config_path = ?",
+                (config_path,)
+            )
+
+    def bundles(self) -> list:
+
+        """All registered bundles
+
+        Returns:
+            list: config.json datas of each bundle
+        """
+
+        with self.connection() as connection:
+            rows = connection.execute(
+                "SELECT config FROM bundles ORDER BY project, name"
+            ).fetchall()
+        return [json_loads(config) for config, in rows]
+
+    def versions(self,
+                 config_path: str = '') -> list:
+        """Registered versions of the bundles.
+
+        Args:
+            config_path (str, optional): Only the versions of this bundle
+                                        returned. Defaults to '' for all bundles.
+
+        Returns:
+            list: tuple of config path and info.json datas of each version
+        """
+
+        query = "SELECT config_path, info FROM versions"
+        params = ()
+        if config_path:
+            query += " WHERE config_path = ?"
+            params = (config_path,)
+        query += " ORDER BY config_path, version"
+        with self.connection() as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [(path, json_loads(info)) for path, info in rows]
+
+
+if __name__ == '__main__':
+
+    catalog_index = CatalogIndex()
+    snapshot = catalog_index.rescan()
+    print(list(snapshot.iter_bundles()))
+    print(catalog_index.snapshot().versions)
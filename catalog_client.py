@@ -0,0 +1,149 @@
+#
+# Client of the catalog query service of template pilot. Talks json
+# over http to catalog_server.py running on one host of the studio.
+# Every call raises CatalogServerError when the service is unreachable,
+# the callers fall back to reading the network share.
+#
+from urllib.parse import urlencode
+from urllib.request import urlopen
+from urllib.error import URLError
+from helpers import (json_loads,
+                     CATALOG_SERVER_URL,
+                     CATALOG_SERVER_TIMEOUT)
+
+
+class CatalogServerError(Exception):
+
+    """Catalog service unreachable or failed to answer"""
+
+
+class CatalogClient:
+
+    """
+    Queries of the catalog service. Named after the Templates
+    methods they answer, the bundle entities come back as dicts.
+
+    Example:
+        client = CatalogClient('http://catalog-host:8765')
+        client.get_all_bundles(matching_text='fog')
+    """
+
+    def __init__(self,
+                 server_url: str = CATALOG_SERVER_URL,
+                 timeout: float = CATALOG_SERVER_TIMEOUT) -> None:
+        """
+        Initialize the service url
+
+        Args:
+            server_url (str, optional): http url of the service.
+                                        Defaults to CATALOG_SERVER_URL.
+            timeout (float, optional): seconds to wait for an answer.
+                                        Defaults to CATALOG_SERVER_TIMEOUT.
+        """
+
+        self.server_url = server_url.rstrip('/')
+        self.timeout = timeout
+
+    def request(self,
+                path: str,
+                **params) -> object:
+        """Send a query to the service and decode the answer
+
+        Args:
+            path (str): query path. Example: /bundles
+            params: query parameters, empty values left out
+
+        Raises:
+            CatalogServerError: service unreachable or failed
+
+        Returns:
+            object: decoded json answer
+        """
+
+        params = {key: int(value) if isinstance(value, bool) else value
+                  for key, value in params.items() if value not in (None, '')}
+        url = self.server_url + path
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        try:
+            with urlopen(url, timeout=self.timeout) as response:
+                return json_loads(response.read())
+        except (URLError, OSError, ValueError) as error:
+            raise CatalogServerError(f"{url}: {error}") from error
+
+    def snapshot(self,
+                 generation: str = '') -> dict:
+        """
+        Bundles and versions of the whole catalog
+
+        Args:
+            generation (str, optional): generation of the snapshot held
+                                        by the client. Defaults to ''.
+
+        Returns:
+            dict:   'generation' of the service, 'bundles' config.json
+                    datas and 'versions' (config path, info.json datas)
+                    pairs. Only the generation and 'unchanged' returned
+                    if the client is up to date.
+        """
+
+        return self.request('/snapshot', generation=generation)
+
+    def get_all_bundles(self,
+                        matching_text: str = '',
+                        project_name: str = '',
+                        all_mode: bool = True,
+                        return_with_project_name: bool = False) -> list | dict:
+        """Templates.get_all_bundles answered by the service"""
+
+        return self.request('/bundles',
+                            matching_text=matching_text,
+                            project_name=project_name,
+                            all_mode=all_mode,
+                            return_with_project_name=return_with_project_name)
+
+    def list_all_bundle_entity(self,
+                               bundle_name: str = '',
+                               project_name: str = '') -> dict:
+        """Templates.list_all_bundle_entity answered by the service"""
+
+        return self.request('/entities',
+                            bundle_name=bundle_name,
+                            project_name=project_name)
+
+    def list_all_bundle_config(self) -> list:
+
+        """Templates.list_all_bundle_config answered by the service"""
+
+        return self.request('/configs')
+
+    def search_comments(self,
+                        text: str) -> list:
+        """Templates.search_comments answered by the service"""
+
+        return self.request('/comments', text=text)
+
+    def query(self,
+              project: str = '',
+              domain: str = '',
+              context: str = '',
+              bundle: str = '',
+              text: str = '',
+              user: str = '',
+              since: int = None,
+              limit: int = None,
+              offset: int = 0) -> list:
+        """Templates.query answered by the service, one page per call"""
+
+        return self.request('/query', project=project, domain=domain, 
+                            context=context, bundle=bundle, text=text, 
+                            user=user, since=since, limit=limit, offset=offset)
+
+    def bundle_name_conflict(self,
+                             bundle_name: str,
+                             project_name: str) -> str:
+        """Templates.bundle_name_conflict answered by the service"""
+
+        return self.request('/conflict',
+                            bundle_name=bundle_name,
+                            project_name=project_name)['project']
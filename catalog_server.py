@@ -0,0 +1,322 @@
+#
+# Optional catalog query service for template pilot. One host keeps
+# the catalog warm in memory and answers the catalog queries of every
+# workstation over http, instead of each houdini session reading the
+# local index and the journal of the network share. The service checks
+# the generation stamp of the share and syncs only when it moved.
+# Workstations point TEMPLATE_PILOT_CATALOG_SERVER to it, an unreachable
+# service falls back to the share. Runs outside houdini.
+#
+#   python catalog_server.py --port 8765
+#   set TEMPLATE_PILOT_CATALOG_SERVER=http://catalog-host:8765
+#
+import sys
+import json
+import uuid
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qsl
+from model import Templates
+from catalog import CatalogSnapshot
+from helpers import CATALOG_SERVER_PORT, CATALOG_SERVER_POLL
+
+
+def encode(datas) -> bytes:
+
+    """Encode the answer datas as compact json"""
+
+    return json.dumps(datas, separators=(',', ':')).encode('utf-8')
+
+
+class CatalogService:
+
+    """
+    Templates model shared by the request threads. The queries and
+    the syncs serialized by one lock, every query is an in-memory
+    lookup. The whole snapshot answer encoded once per generation
+    and served as it is to every client loading the catalog.
+    """
+
+    def __init__(self,
+                 templates: Templates,
+                 poll_interval: float = CATALOG_SERVER_POLL) -> None:
+        """
+        Initialize the service over a loaded Templates model
+
+        Args:
+            templates (Templates): loaded catalog model
+            poll_interval (float, optional): seconds between two generation
+                                            stamp checks. Defaults to
+                                            CATALOG_SERVER_POLL.
+        """
+
+        self.templates = templates
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        # Bumped whenever a sync changed the catalog. Prefixed with
+        # an id of this run, a restarted service never matches the 
+        # generation a client got from the previous run
+        self.run_id = uuid.uuid4().hex[:12]
+        self.generation = 1
+        self.encoded_snapshot = None
+        self.queries = {
+            '/generation': self.query_generation,
+            '/snapshot': self.query_snapshot,
+            '/bundles': self.query_bundles,
+            '/entities': self.query_entities,
+            '/configs': self.query_configs,
+            '/comments': self.query_comments,
+            '/conflict': self.query_conflict,
+            '/query': self.query_versions,
+        }
+
+    def generation_id(self) -> str:
+
+        """Generation of the served catalog sent to the clients"""
+
+        return f"{self.run_id}.{self.generation}"
+
+    def revalidate(self) -> bool:
+
+        """Sync the catalog if the generation stamp of the share moved
+
+        Returns:
+            bool: True if any version changed
+        """
+
+        with self.lock:
+            if not self.templates.catalog_changed():
+                return False
+            changed, removed = self.templates.revalidate()
+            if changed or removed:
+                self.generation += 1
+                self.encoded_snapshot = None
+            return bool(changed or removed)
+
+    def compact_journal(self) -> None:
+
+        """
+        Compact the publish journal once it grew too long. The clients 
+        of the service hold no walked catalog, the service compacts for 
+        them.
+        """
+
+        with self.lock:
+            if not self.templates.journal.needs_compaction():
+                return
+            before = self.templates.snapshot.version_state()
+            self.templates.compact_journal()
+            changed, removed = CatalogSnapshot.diff_version_state(
+                before, self.templates.snapshot.version_state())
+            if changed or removed:
+                self.generation += 1
+                self.encoded_snapshot = None
+
+    def poll(self) -> None:
+
+        """Revalidate and compact every poll interval until stopped"""
+
+        while not self.stopped.wait(self.poll_interval):
+            try:
+                self.revalidate()
+                self.compact_journal()
+            except OSError:
+                # Share unreachable for a moment, tried again next poll
+                continue
+
+    def start(self) -> threading.Thread:
+
+        """Start polling the share in a daemon thread
+
+        Returns:
+            threading.Thread: polling thread
+        """
+
+        poll_thread = threading.Thread(target=self.poll, daemon=True)
+        poll_thread.start()
+        return poll_thread
+
+    def stop(self) -> None:
+
+        """Stop polling the share"""
+
+        self.stopped.set()
+
+    def respond(self,
+                path: str,
+                params: dict) -> bytes:
+        """Answer a query
+
+        Args:
+            path (str): query path. Example: /bundles
+            params (dict): query parameters
+
+        Returns:
+            bytes: encoded json answer
+        """
+
+        query = self.queries[path]
+        # One stat of the stamp, a client fetching the snapshot right
+        # after its own publish gets it without waiting for the poll
+        if path == '/snapshot':
+            self.revalidate()
+        with self.lock:
+            return query(params)
+
+    def query_generation(self, params: dict) -> bytes:
+
+        return encode({'generation': self.generation_id()})
+
+    def query_snapshot(self, params: dict) -> bytes:
+
+        generation = self.generation_id()
+        if params.get('generation') == generation:
+            return encode({'generation': generation, 'unchanged': True})
+        if self.encoded_snapshot is None:
+            snapshot = self.templates.snapshot
+            self.encoded_snapshot = encode({
+                'generation': generation,
+                'bundles': list(snapshot.iter_bundles()),
+                'versions': list(snapshot.iter_versions()),
+            })
+        return self.encoded_snapshot
+
+    def query_bundles(self, params: dict) -> bytes:
+
+        return encode(self.templates.get_all_bundles(
+            matching_text=params.get('matching_text', ''),
+            project_name=params.get('project_name', ''),
+            all_mode=params.get('all_mode', '1') == '1',
+            return_with_project_name=params.get('return_with_project_name') == '1'
+        ))
+
+    def query_entities(self, params: dict) -> bytes:
+
+        all_projects_entities = self.templates.list_all_bundle_entity(
+            bundle_name=params.get('bundle_name', ''),
+            project_name=params.get('project_name', '')
+        )
+        return encode({project: [dict(entity.items()) for entity in entities]
+                       for project, entities in all_projects_entities.items()})
+
+    def query_configs(self, params: dict) -> bytes:
+
+        return encode(self.templates.list_all_bundle_config())
+
+    def query_comments(self, params: dict) -> bytes:
+
+        return encode([dict(entity.items()) for entity in
+                       self.templates.search_comments(params.get('text', ''))])
+
+    def query_conflict(self, params: dict) -> bytes:
+
+        return encode({'project': self.templates.bundle_name_conflict(
+            params.get('bundle_name', ''),
+            params.get('project_name', '')
+        )})
+
+    def query_versions(self, params: dict) -> bytes:
+
+        filters = {key: params[key] for key in 
+                   ('project', 'domain', 'context', 'bundle', 'text', 'user')
+                   if key in params}
+        for key in ('since', 'limit'):
+            if key in params:
+                filters[key] = int(params[key])
+        return encode([dict(entity.items()) for entity in
+                       self.templates.query(offset=int(params.get('offset', 0)), 
+                                            **filters)])
+
+
+class CatalogRequestHandler(BaseHTTPRequestHandler):
+
+    """GET queries of the catalog service answered in json"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+
+        url = urlparse(self.path)
+        service = self.server.service
+        if url.path not in service.queries:
+            body = encode({'error': f"unknown query {url.path}"})
+            status = 404
+        else:
+            try:
+                body = service.respond(url.path, dict(parse_qsl(url.query)))
+                status = 200
+            except Exception as error:
+                body = encode({'error': str(error)})
+                status = 500
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CatalogServer(ThreadingHTTPServer):
+
+    """
+    Threaded http server of the catalog service. The listen backlog
+    raised so hundreds of workstations connecting at once, like
+    everyone opening the importer after a publish, were not refused.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self,
+                 server_address: tuple,
+                 service: CatalogService,
+                 verbose: bool = False) -> None:
+        """
+        Bind the server
+
+        Args:
+            server_address (tuple): host and port. Port 0 picks a free port
+            service (CatalogService): service answering the queries
+            verbose (bool, optional): log every request. Defaults to False.
+        """
+
+        self.service = service
+        self.verbose = verbose
+        super().__init__(server_address, CatalogRequestHandler)
+
+
+def main(argv: list) -> None:
+
+    """Load the catalog and serve it until interrupted"""
+
+    parser = argparse.ArgumentParser(description='template pilot catalog service')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=CATALOG_SERVER_PORT)
+    parser.add_argument('--poll', type=float, default=CATALOG_SERVER_POLL,
+                        help='seconds between two generation stamp checks')
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    # The service reads the share itself, never another service
+    service = CatalogService(Templates(server_url=''), args.poll)
+    service.start()
+    server = CatalogServer((args.host, args.port), service, args.verbose)
+    print(f"catalog service on {args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+
+
+if __name__ == '__main__':
+
+    main(sys.argv[1:])
@@ -0,0 +1,154 @@
+#
+# Watcher of the catalog files of the share for template pilot. Tells
+# the open tools a publish or removal landed, so the catalog merged
+# without the artist clicking reload. The change events of the share
+# used if watchdog is installed, the generation stamp and the journal
+# polled otherwise. Either way only a moved stat signature of the
+# stamp or the journal reported as a change.
+#
+import os
+import threading
+from helpers import (ROOT_TEMPLATE_PATH,
+                     GENERATION_FILE,
+                     JOURNAL_FILE,
+                     JOURNAL_SNAPSHOT_FILE,
+                     WATCH_POLL_INTERVAL)
+try:
+    # Optional change events of the share
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+# Files rewritten by every publish, removal and journal compaction
+WATCHED_FILES = (GENERATION_FILE, JOURNAL_FILE, JOURNAL_SNAPSHOT_FILE)
+
+
+class ShareWatcher:
+
+    """
+    Wait for the catalog files of the share to change. A change event
+    of a watched file wakes the waiter right away, else it wakes every
+    poll interval. Events of a network share may get lost, so the poll
+    keeps going with watchdog too.
+
+    Example:
+        share_watcher = ShareWatcher()
+        share_watcher.start()
+        signature = share_watcher.signature()
+        while True:
+            share_watcher.wait()
+            if share_watcher.signature() != signature:
+                ...
+    """
+
+    def __init__(self,
+                 root_path: str = ROOT_TEMPLATE_PATH,
+                 poll_interval: float = WATCH_POLL_INTERVAL) -> None:
+        """
+        Initialize the watched root
+
+        Args:
+            root_path (str, optional): Root folder of the bundles holding the
+                                        journal and the stamp. Defaults to
+                                        ROOT_TEMPLATE_PATH.
+            poll_interval (float, optional): seconds between two wake ups
+                                            without event. Defaults to
+                                            WATCH_POLL_INTERVAL.
+        """
+
+        self.root_path = root_path
+        self.poll_interval = poll_interval
+        self.woken = threading.Event()
+        self.observer = None
+
+    def start(self) -> bool:
+
+        """Subscribe to the change events of the root folder
+
+        Returns:
+            bool: False if polled only, watchdog missing or the share
+                  refused the subscription
+        """
+
+        if Observer is None:
+            return False
+        try:
+            observer = Observer()
+            observer.schedule(self, self.root_path, recursive=False)
+            observer.start()
+        except (OSError, RuntimeError):
+            return False
+        self.observer = observer
+        return True
+
+    def stop(self) -> None:
+
+        """Unsubscribe and release the waiter"""
+
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+        self.wake()
+
+    def dispatch(self,
+                 event) -> None:
+        """
+        Watchdog event handler. Wakes the waiter for the events of
+        the watched files only.
+
+        Args:
+            event (watchdog.events.FileSystemEvent): change event
+        """
+
+        for path in (event.src_path, getattr(event, 'dest_path', '')):
+            if path and os.path.basename(path) in WATCHED_FILES:
+                self.wake()
+                return
+
+    def wake(self) -> None:
+
+        """Release the waiter now"""
+
+        self.woken.set()
+
+    def wait(self) -> None:
+
+        """Block until a change event, a wake() or the poll interval"""
+
+        self.woken.wait(self.poll_interval)
+        self.woken.clear()
+
+    def signature(self) -> tuple:
+
+        """Stat signatures of the watched files, one stat per file
+
+        Returns:
+            tuple: file id, modified time and size per watched file,
+                   None for a missing file
+        """
+
+        signatures = []
+        for file_name in WATCHED_FILES:
+            try:
+                stat = os.stat(os.path.join(self.root_path, file_name))
+            except OSError:
+                signatures.append(None)
+                continue
+            signatures.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        return tuple(signatures)
+
+
+if __name__ == '__main__':
+
+    share_watcher = ShareWatcher()
+    print('change events' if share_watcher.start() else 'polling', share_watcher.root_path)
+    signature = share_watcher.signature()
+    try:
+        while True:
+            share_watcher.wait()
+            if share_watcher.signature() != signature:
+                signature = share_watcher.signature()
+                print('catalog changed', signature)
+    except KeyboardInterrupt:
+        share_watcher.stop()
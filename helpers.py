@@ -4,7 +4,18 @@
 import os
 import sys
 import re
+import json
+import time
+import uuid
+import socket
 import yaml
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+try:
+    # Optional faster json backend
+    import orjson
+except ImportError:
+    orjson = None
 
 ROOT_DEFAULT_PATH = os.path.join(
         os.environ['HOUDINI_INTERNAL_PACKAGE_DIR'], 
@@ -13,8 +24,68 @@ ROOT_DEFAULT_PATH = os.path.join(
 ROOT_TEMPLATE_PATH = r"R:\templates\bundles"
 CONFIG_FILE = 'config.json'
 INFO_FILE = 'info.json'
+VERSIONS_FILE = 'versions.json'
 MODULE_SAVE_FORMAT = '.uti'
 HIP_EXTENSION = '.hip'
+CATALOG_CACHE_DIR = os.path.join(
+        os.environ.get('HOUDINI_USER_PREF_DIR', os.path.expanduser('~')),
+        "template_pilot"
+)
+CATALOG_INDEX_FILE = 'catalog.db'
+# Publish journal and its compacted snapshot at the ROOT_TEMPLATE_PATH
+JOURNAL_FILE = 'catalog.journal'
+JOURNAL_SNAPSHOT_FILE = 'catalog.snapshot.json'
+JOURNAL_COMPACT_SIZE = 4 * 1024**2
+# Stamp rewritten on every publish and removal. Clients stat it to 
+# know whether the catalog changed
+GENERATION_FILE = 'catalog.generation'
+VERSION_FOLDER = re.compile(r'^v\d+$')
+# Create-exclusive lock files serializing the publishers on the share
+PUBLISH_LOCK_FILE = '.publish.lock'
+JOURNAL_LOCK_FILE = 'catalog.journal.lock'
+LOCK_TIMEOUT = 30.0
+# Lock of a crashed publisher broken after this many seconds
+LOCK_STALE_AGE = 120.0
+# Parallel reads of config.json and info.json over the network share
+METADATA_READ_WORKERS = int(os.environ.get('TEMPLATE_PILOT_READ_WORKERS', 16))
+# Optional catalog query service (catalog_server.py). Empty url reads 
+# the share directly. Unreachable service falls back to the share
+CATALOG_SERVER_URL = os.environ.get('TEMPLATE_PILOT_CATALOG_SERVER', '')
+CATALOG_SERVER_PORT = 8765
+CATALOG_SERVER_TIMEOUT = 2.0
+# Seconds between two generation stamp checks of the service
+CATALOG_SERVER_POLL = 2.0
+# Seconds between two polls of the share by the catalog watcher,
+# also the fallback when the change events of the share were dropped
+WATCH_POLL_INTERVAL = 5.0
+# Display formats of the info.json 'Created On' and 'file_size' values
+CREATED_ON_FORMAT = '%d-%m-%Y %H:%M'
+FILE_SIZE_UNITS = {'b': 1, 'kb': 1024, 'mb': 1024**2, 'gb': 1024**3}
+FILE_SIZE_TEXT = re.compile(r'^\s*([\d.]+)\s*([a-zA-Z]*)\s*$')
+
+def json_loads(datas: bytes) -> dict:
+    
+    """Decode json datas with orjson if installed, else with
+    the C accelerated json module of the standard library.
+
+    Args:
+        datas (bytes): json file contents
+
+    Returns:
+        dict: decoded datas
+    """
+    if orjson is not None:
+        return orjson.loads(datas)
+    return json.loads(datas)
+
+# Parser for each file extension. config.json and info.json read
+# thousands of times per importer load. yaml kept for the defaults only.
+FILE_CODECS = {
+    '.json': json_loads,
+    '.yml': yaml.safe_load,
+    '.yaml': yaml.safe_load,
+}
+
 
 class FileOperations:
     
@@ -50,10 +121,52 @@ class FileOperations:
         self.read_file = os.path.join(
             self.dir_path, file_name
         )
+        return self.load_file_datas(self.read_file)
+    
+    @staticmethod
+    def load_file_datas(file_path: str) -> list:
+        
+        """
+        Open the file of the given path and read the data.
+        The parser picked from the file extension, yaml for 
+        unknown extensions. Holds no state, so safe to call 
+        from many threads.
+
+        Args:
+            file_path (str): Path of the file 
+
+        Returns:
+            list: list items readed from the file 
+        """
         
-        with open(self.read_file, 'r') as read_file:
-            datas = yaml.safe_load(read_file)
+        codec = FILE_CODECS.get(os.path.splitext(file_path)[1].lower(),
+                                yaml.safe_load)
+        with open(file_path, 'rb') as read_file:
+            datas = codec(read_file.read())
         return datas
+    
+    def read_files_datas(self,
+                         file_paths: list,
+                         max_workers: int = METADATA_READ_WORKERS) -> list:
+        """
+        Read many files concurrently with a bounded thread pool.
+        Over the network share every open is a round trip, the pool 
+        overlaps those waits. 
+
+        Args:
+            file_paths (list): Path of the files
+            max_workers (int, optional): Number of parallel reads. 
+                                        Defaults to METADATA_READ_WORKERS.
+
+        Returns:
+            list: datas of each file in the same order of file_paths
+        """
+        
+        if max_workers <= 1 or len(file_paths) <= 1:
+            return [self.load_file_datas(file_path) for file_path in file_paths]
+        with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(file_paths))) as executor:
+            return list(executor.map(self.load_file_datas, file_paths))
 
     def write_file_datas(self, 
                          file_name: str, 
@@ -69,7 +182,188 @@ class FileOperations:
         )
         with open(self.write_file, 'w') as write_file:
             write_file.write(datas)
+    
+    def replace_file_datas(self, 
+                           file_name: str, 
+                           datas: str) -> None:
+        """Atomically write the data to the file. The datas written 
+        into a temporary file of the same folder and renamed over 
+        the file, readers never see a half written file.
+
+        Args:
+            file_name (str): name of the file 
+            datas (str): file contents
+        """
+        self.write_file = os.path.join(
+            self.dir_path, file_name
+        )
+        temp_file = f"{self.write_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w') as write_file:
+            write_file.write(datas)
+        os.replace(temp_file, self.write_file)
+
+
+class ShareLock:
+    
+    """
+    Inter process lock over the network share. The lock file created 
+    with O_CREAT | O_EXCL, only one publisher of any workstation 
+    succeeds, the others wait and retry. The lock file holds the host,
+    process and a unique token of the owner. A lock older than 
+    LOCK_STALE_AGE was left by a crashed publisher and broken.
+    
+    Example:
+        with ShareLock(os.path.join(bundle_folder_path, PUBLISH_LOCK_FILE)):
+            ...
+    """
+    
+    def __init__(self,
+                 lock_path: str,
+                 timeout: float = LOCK_TIMEOUT,
+                 stale_age: float = LOCK_STALE_AGE) -> None:
+        """Initialize the lock file path and the wait limits
+
+        Args:
+            lock_path (str): path of the lock file
+            timeout (float, optional): seconds to wait for the lock. 
+                                        Defaults to LOCK_TIMEOUT.
+            stale_age (float, optional): seconds after a lock is broken. 
+                                        Defaults to LOCK_STALE_AGE.
+        """
+        
+        self.lock_path = lock_path
+        self.timeout = timeout
+        self.stale_age = stale_age
+        # Written into the lock file by acquire()
+        self.token = ''
+    
+    @staticmethod
+    def read_token(lock_path: str) -> str:
+        
+        """Owner token written in a lock file
+
+        Args:
+            lock_path (str): path of the lock file
+
+        Returns:
+            str: owner token, '' if the file is gone
+        """
+        
+        try:
+            with open(lock_path) as lock_file:
+                return lock_file.read()
+        except OSError:
+            return ''
+    
+    def break_stale_lock(self) -> None:
+        
+        """
+        Break the lock file if its owner stopped holding it longer than
+        the stale age. The lock renamed to a unique name first, only one 
+        waiter succeeds. If the renamed lock is not the stale one, another
+        waiter broke it and a new owner took it in between, it is put back.
+        """
         
+        try:
+            if time.time() - os.path.getmtime(self.lock_path) <= self.stale_age:
+                return
+            stale_token = self.read_token(self.lock_path)
+            broken_path = f"{self.lock_path}.broken.{uuid.uuid4().hex}"
+            os.rename(self.lock_path, broken_path)
+        except OSError:
+            return
+        if self.read_token(broken_path) != stale_token:
+            try:
+                os.rename(broken_path, self.lock_path)
+                return
+            except OSError:
+                pass
+        try:
+            os.remove(broken_path)
+        except OSError:
+            pass
+    
+    def acquire(self) -> None:
+        
+        """
+        Create the lock file exclusively, retrying until the timeout
+
+        Raises:
+            TimeoutError: lock held by another publisher past the timeout
+        """
+        
+        deadline = time.monotonic() + self.timeout
+        delay = 0.005
+        while True:
+            try:
+                descriptor = os.open(self.lock_path,
+                                     os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self.break_stale_lock()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Lock {self.lock_path} held by other publisher")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.25)
+                continue
+            self.token = f"{socket.gethostname()} {os.getpid()} {uuid.uuid4().hex}"
+            with os.fdopen(descriptor, 'w') as lock_file:
+                lock_file.write(self.token)
+            return
+    
+    def release(self) -> None:
+        
+        """Remove the lock file if still owned. A lock broken as stale 
+        and taken by another publisher left to its new owner"""
+        
+        if self.read_token(self.lock_path) != self.token:
+            return
+        try:
+            os.remove(self.lock_path)
+        except FileNotFoundError:
+            pass
+    
+    def __enter__(self):
+        
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        
+        self.release()
+        
+
+
+def reserve_version_folder(bundle_folder_path: str) -> int:
+    
+    """
+    Reserve the next version folder of the bundle. The vNNN folders
+    listed once, no info.json read. The folder created with mkdir under
+    the publish lock of the bundle, concurrent publishers of any 
+    workstation always get distinct versions.
+
+    Args:
+        bundle_folder_path (str): Bundle folder path
+
+    Returns:
+        int: numeric version number of the created folder
+    """
+    
+    with ShareLock(os.path.join(bundle_folder_path, PUBLISH_LOCK_FILE)):
+        with os.scandir(bundle_folder_path) as entries:
+            versions = [int(entry.name[1:]) for entry in entries
+                        if VERSION_FOLDER.match(entry.name) and entry.is_dir()]
+        version = max(versions, default=0) + 1
+        while True:
+            version_folder = os.path.join(
+                bundle_folder_path,
+                VersionOperations(version).pad_version_identifier_to_number()
+            )
+            try:
+                os.mkdir(version_folder)
+            except FileExistsError:
+                version += 1
+                continue
+            return version
 
 
 class VersionOperations:
@@ -160,12 +454,77 @@ class Defaults(FileOperations):
         return self.get_defaults("bundle_type.yml")['list']
 
 
+def parse_file_size(text: str) -> int:
+    
+    """Bytes of a file size text of the info.json
+
+    Args:
+        text (str): file size text. Example: '0.03Mb'
+
+    Returns:
+        int: bytes, 0 if not readable
+    """
+    
+    matched = FILE_SIZE_TEXT.match(str(text))
+    if not matched:
+        return 0
+    number, unit = matched.groups()
+    try:
+        return int(float(number) * FILE_SIZE_UNITS.get(unit.lower() or 'b', 1))
+    except ValueError:
+        return 0
+
+
+def parse_created_on(text: str) -> int:
+    
+    """Epoch seconds of a 'Created On' text of the info.json
+
+    Args:
+        text (str): creation time text. Example: '01-12-2023 22:12'
+
+    Returns:
+        int: epoch seconds, 0 if not readable
+    """
+    
+    try:
+        return int(datetime.strptime(str(text), CREATED_ON_FORMAT).timestamp())
+    except ValueError:
+        return 0
+
+
+def typed_info_datas(info: dict) -> dict:
+    
+    """
+    Read shim of the info.json datas. The numeric fields were made 
+    numbers and the raw bytes and epoch seconds of legacy files, 
+    written before those were stored, computed from the display texts.
+    The datas updated in place.
+
+    Args:
+        info (dict): info.json datas
+
+    Returns:
+        dict: the same info.json datas
+    """
+    
+    if 'file_bytes' not in info:
+        info['file_bytes'] = parse_file_size(info.get('file_size', ''))
+    if 'created_epoch' not in info:
+        info['created_epoch'] = parse_created_on(info.get('Created On', ''))
+    for key in ('version', 'node_count'):
+        if isinstance(info.get(key), str):
+            info[key] = int(info[key]) if info[key].isdigit() else 0
+    return info
+
+
 class InfoFormat:
 
     """
     For each published bundle name info.json file created
     Holds all the necessary information to show to the user. 
     It makes up the dictionary to save in the info.json file.
+    The file size and creation time stored both as display texts
+    and as raw bytes and epoch seconds for sorting.
     """
     def __init__(self,
                  user_name,
@@ -176,7 +535,9 @@ class InfoFormat:
                  module_path,
                  file_size,
                  date_now,
-                 comments) -> None:
+                 comments,
+                 file_bytes=None,
+                 created_epoch=None) -> None:
 
         self.user_name = user_name
         self.context = context
@@ -187,6 +548,8 @@ class InfoFormat:
         self.file_size = file_size
         self.date_now = date_now
         self.comments = comments
+        self.file_bytes = file_bytes
+        self.created_epoch = created_epoch
         
     def data(self):
         
@@ -200,6 +563,10 @@ class InfoFormat:
                 "file_size": f"{self.file_size}",
                 "Created On": f"{self.date_now}",
                 "comments": f"{self.comments}",
+                "file_bytes": int(self.file_bytes if self.file_bytes is not None 
+                                  else parse_file_size(self.file_size)),
+                "created_epoch": int(self.created_epoch if self.created_epoch is not None
+                                     else parse_created_on(self.date_now)),
                 }
 
 class ConfigFormat:
@@ -235,6 +602,165 @@ class ConfigFormat:
             "config_path": f"{self.config_path}"
         }
 
+
+class BundleVersion:
+    
+    """
+    Bundle entity of one published version, the config.json and 
+    info.json datas of the version combined. Slotted, no dict per 
+    version. The numeric version, file bytes and creation epoch 
+    were the sort keys of the version, compared without parsing. 
+    The names repeated over the catalog (project, domain, context, 
+    user, bundle type, bundle name and config path) were interned, 
+    every version of the catalog shares one string of each.
+    Read like the entity dict it replaced. The sort keys read by key
+    only, iterating, keys(), values() and items() give the keys of 
+    the entity dict.
+
+    Example:
+        bundle_version['version'] -> 'v001'
+        dict(bundle_version.items())
+    """
+    
+    # Keys of the entity dict
+    ENTITY_KEYS = ('bundle_name',
+                   'project_name',
+                   'user_name',
+                   'node_count',
+                   'domain',
+                   'context',
+                   'bundle_type',
+                   'file_size',
+                   'created_on',
+                   'version',
+                   'module_path',
+                   'config_path',
+                   'comments')
+    SORT_KEYS = ('version_number',
+                 'file_bytes',
+                 'created_epoch')
+    __slots__ = ENTITY_KEYS + SORT_KEYS
+    
+    def __init__(self,
+                 bundle_name,
+                 project_name,
+                 user_name,
+                 node_count,
+                 domain,
+                 context,
+                 bundle_type,
+                 file_size,
+                 created_on,
+                 version,
+                 module_path,
+                 config_path,
+                 comments,
+                 version_number=0,
+                 file_bytes=0,
+                 created_epoch=0) -> None:
+        
+        intern = sys.intern
+        self.bundle_name = intern(bundle_name)
+        self.project_name = intern(project_name)
+        self.user_name = intern(user_name)
+        self.node_count = node_count
+        self.domain = intern(domain)
+        self.context = intern(context)
+        self.bundle_type = intern(bundle_type)
+        self.file_size = file_size
+        self.created_on = created_on
+        self.version = intern(version)
+        self.module_path = module_path
+        self.config_path = intern(config_path)
+        self.comments = comments
+        self.version_number = version_number
+        self.file_bytes = file_bytes
+        self.created_epoch = created_epoch
+    
+    @classmethod
+    def from_datas(cls,
+                   config: dict,
+                   info: dict) -> 'BundleVersion':
+        """Bundle entity from the config.json and info.json datas
+
+        Args:
+            config (dict): config.json datas of the bundle
+            info (dict): info.json datas of the version
+
+        Returns:
+            BundleVersion: bundle entity of the version
+        """
+        
+        typed_info_datas(info)
+        return cls(bundle_name=config['name'],
+                   project_name=config['project'],
+                   user_name=info['user_name'],
+                   node_count=info['node_count'],
+                   domain=config['domain'], 
+                   context=config['context'],
+                   bundle_type=info['type'],
+                   file_size=info['file_size'],
+                   created_on=info['Created On'],
+                   version=VersionOperations(info['version']).pad_version_identifier_to_number(),
+                   module_path=info['module_path'],
+                   config_path=config['config_path'],
+                   comments=info['comments'],
+                   version_number=info['version'],
+                   file_bytes=info['file_bytes'],
+                   created_epoch=info['created_epoch'])
+    
+    def __getitem__(self, key: str):
+        
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, 
+            key: str, 
+            default=None):
+        
+        return getattr(self, key, default) if key in self.__slots__ else default
+    
+    def __contains__(self, key: str) -> bool:
+        
+        return key in self.__slots__
+    
+    def __iter__(self):
+        
+        return iter(self.ENTITY_KEYS)
+    
+    def __len__(self) -> int:
+        
+        return len(self.ENTITY_KEYS)
+    
+    def keys(self) -> tuple:
+        
+        return self.ENTITY_KEYS
+    
+    def values(self) -> list:
+        
+        return [getattr(self, key) for key in self.ENTITY_KEYS]
+    
+    def items(self) -> list:
+        
+        return [(key, getattr(self, key)) for key in self.ENTITY_KEYS]
+    
+    def __eq__(self, other) -> bool:
+        
+        if isinstance(other, BundleVersion):
+            return all(getattr(self, key) == getattr(other, key) 
+                       for key in self.__slots__)
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        
+        return f"BundleVersion({self.config_path!r}, {self.version!r})"
+
+
 if __name__ == '__main__':
     
     
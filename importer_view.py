@@ -15,21 +15,540 @@
 
 import os
 import sys
+import shutil
+from functools import partial
+from operator import attrgetter
 from PySide2.QtUiTools import QUiLoader
 from PySide2 import QtWidgets
-from PySide2.QtGui import (QStandardItemModel, 
-                            QStandardItem, 
-                            QPixmap, 
+from PySide2.QtGui import (QPixmap, 
                             QIcon)
 from PySide2.QtCore import (Qt,
                             QModelIndex,
+                            QAbstractListModel,
                             QSortFilterProxyModel,
-                            QRegExp)
+                            QRegExp,
+                            QThread,
+                            QTimer,
+                            QDate,
+                            QDateTime,
+                            QTime,
+                            Signal)
 from model import (Defaults, 
                    Templates,
                    ThadamDB)
+from helpers import BundleVersion
 from helper_msgboxes import utilMessageBox
+from search import FacetIndex, TrigramIndex
+from catalog_watcher import ShareWatcher
 ALL_PROJECTS_KEY = "all"
+# Bundle entities handed to the views per batch while loading, 
+# with a pause between batches for the ui events
+LOAD_BATCH_SIZE = 500
+LOAD_BATCH_INTERVAL = 10
+# Lazy mode loads the bundle names only, the versions of a bundle 
+# fetched when selected. Set TEMPLATE_PILOT_LAZY_VERSIONS=0 to list
+# every version on the dashboard
+LAZY_VERSIONS = os.environ.get('TEMPLATE_PILOT_LAZY_VERSIONS', '1') != '0'
+# Publishes and removals of the other artists merged into the open 
+# importer as they land. Set TEMPLATE_PILOT_WATCH=0 to reload by hand
+WATCH_CATALOG = os.environ.get('TEMPLATE_PILOT_WATCH', '1') != '0'
+# Entity keys left out of the info widget
+HIDDEN_INFO_KEYS = ('bundle_name', 'bundle_type', 'comments', 
+                    'module_path', 'config_path', 'project_name')
+# Versions rendered into the info and comments widgets at most
+MAX_RENDERED_ENTITIES = 500
+# Milliseconds the search box waits after the last keystroke
+SEARCH_DEBOUNCE_INTERVAL = 250
+# Rows a list view fetches from its model per scroll to the end
+FETCH_BATCH_SIZE = 200
+# Version list orders and the numeric BundleVersion field sorted on,
+# largest first. The catalog order kept for None
+VERSION_SORT_KEYS = {'Catalog': None,
+                     'Date': 'created_epoch',
+                     'Size': 'file_bytes',
+                     'Node Count': 'node_count',
+                     'Version': 'version_number'}
+
+
+def bundle_search_pattern(text: str) -> QRegExp:
+    
+    """
+    Search box text as the pattern of the bundle list filter, a case 
+    sensitive regex as the filter proxy always matched.
+
+    Args:
+        text (str): search box text
+
+    Returns:
+        QRegExp: pattern to match the bundle names against
+    """
+    
+    return QRegExp(text, Qt.CaseSensitive, QRegExp.RegExp)
+
+
+class RemoveFilesTask(QThread):
+    
+    """
+    Remove a bundle or a version in a worker thread. The removal
+    unregistered through the templates model first, the journal sync,
+    the manifest, the journal record, the index and the generation 
+    stamp written over the share, then removed emitted and the folder 
+    deleted. Deleting over the network share takes seconds for big hip
+    files, the importer stays responsive. A failed delete only leaves
+    a hidden folder skipped by the scans.
+    """
+    
+    # removed bundle entity and True if the entire bundle removed
+    removed = Signal(object, bool)
+    # error message, nothing removed
+    failed = Signal(str)
+    
+    def __init__(self, 
+                 templates: Templates,
+                 bundle_entity: BundleVersion,
+                 parent: QtWidgets.QWidget = None) -> None:
+        """Initialize the version to remove
+
+        Args:
+            templates (Templates): loaded templates model
+            bundle_entity (BundleVersion): bundle entity of the version
+            parent (QtWidgets.QWidget, optional): owner widget. Defaults to None.
+        """
+        
+        super().__init__(parent)
+        self.templates = templates
+        self.bundle_entity = bundle_entity
+    
+    def run(self) -> None:
+        
+        try:
+            removed_path, bundle_removed = \
+                        self.templates.unregister_removal(self.bundle_entity)
+        except Exception as error:
+            self.failed.emit(str(error))
+            return
+        self.removed.emit(self.bundle_entity, bundle_removed)
+        shutil.rmtree(removed_path, ignore_errors=True)
+
+
+class CatalogListModel(QAbstractListModel):
+    
+    """
+    List model of the importer list views backed by plain python 
+    lists, one list per column: the display labels, the tool tips and
+    the bundle entities. No item object per row, the entities 
+    referenced as they are, not converted into qt variants.
+    The view fetches the rows in batches of FETCH_BATCH_SIZE while
+    scrolling, a list of 100k versions opens as fast as a list of 200.
+
+    Example:
+        model.set_rows(['v001', 'v002'], records=[entity_1, entity_2])
+        model.data(model.index(1), Qt.UserRole) -> entity_2
+    """
+    
+    def __init__(self,
+                 parent: QtWidgets.QWidget = None) -> None:
+        """Initialize empty columns
+
+        Args:
+            parent (QtWidgets.QWidget, optional): owner widget. Defaults to None.
+        """
+        
+        super().__init__(parent)
+        self.labels = []
+        self.tool_tips = []
+        self.records = []
+        # Rows handed to the view so far
+        self.fetched = 0
+    
+    def rowCount(self, 
+                 parent: QModelIndex = QModelIndex()) -> int:
+        
+        if parent.isValid():
+            return 0
+        return self.fetched
+    
+    def data(self, 
+             index: QModelIndex, 
+             role: int = Qt.DisplayRole):
+        
+        if not index.isValid() or index.row() >= self.fetched:
+            return None
+        if role == Qt.DisplayRole:
+            return self.labels[index.row()]
+        if role == Qt.ToolTipRole and self.tool_tips:
+            return self.tool_tips[index.row()]
+        if role == Qt.UserRole and self.records:
+            return self.records[index.row()]
+        return None
+    
+    def canFetchMore(self, 
+                     parent: QModelIndex = QModelIndex()) -> bool:
+        
+        return not parent.isValid() and self.fetched < len(self.labels)
+    
+    def fetchMore(self, 
+                  parent: QModelIndex = QModelIndex()) -> None:
+        
+        if parent.isValid():
+            return
+        fetch_count = min(FETCH_BATCH_SIZE, len(self.labels) - self.fetched)
+        if fetch_count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.fetched, 
+                             self.fetched + fetch_count - 1)
+        self.fetched += fetch_count
+        self.endInsertRows()
+    
+    def fetch_all(self) -> None:
+        
+        """Hand every row to the view, needed before filtering by
+        a proxy which only sees the fetched rows"""
+        
+        if self.fetched == len(self.labels):
+            return
+        self.beginInsertRows(QModelIndex(), self.fetched, len(self.labels) - 1)
+        self.fetched = len(self.labels)
+        self.endInsertRows()
+    
+    def set_rows(self, 
+                 labels: list, 
+                 tool_tips: list = None, 
+                 records: list = None) -> None:
+        """Replace every row of the model
+
+        Args:
+            labels (list): display labels
+            tool_tips (list, optional): tool tip per row. Defaults to None.
+            records (list, optional): bundle entity per row. Defaults to None.
+        """
+        
+        self.beginResetModel()
+        self.labels = list(labels)
+        self.tool_tips = list(tool_tips or [])
+        self.records = list(records or [])
+        self.fetched = min(FETCH_BATCH_SIZE, len(self.labels))
+        self.endResetModel()
+    
+    def append_rows(self, 
+                    labels: list, 
+                    tool_tips: list = None, 
+                    records: list = None) -> None:
+        """Append rows at the end of the model. Shown right away
+        if the view fetched every row before, else on the next fetch
+
+        Args:
+            labels (list): display labels
+            tool_tips (list, optional): tool tip per row. Defaults to None.
+            records (list, optional): bundle entity per row. Defaults to None.
+        """
+        
+        all_fetched = self.fetched == len(self.labels)
+        self.labels.extend(labels)
+        self.tool_tips.extend(tool_tips or [])
+        self.records.extend(records or [])
+        if all_fetched:
+            self.fetchMore()
+    
+    def remove_row(self, 
+                   row: int) -> None:
+        """Remove a row. A row not fetched yet by the view 
+        dropped without telling the view
+
+        Args:
+            row (int): row number
+        """
+        
+        if not 0 <= row < len(self.labels):
+            return
+        fetched = row < self.fetched
+        if fetched:
+            self.beginRemoveRows(QModelIndex(), row, row)
+        for column in (self.labels, self.tool_tips, self.records):
+            if column:
+                del column[row]
+        if fetched:
+            self.fetched -= 1
+            self.endRemoveRows()
+    
+    def set_row(self, 
+                row: int, 
+                label: str, 
+                tool_tip: str = None, 
+                record: BundleVersion = None) -> None:
+        """Replace the datas of a row in place
+
+        Args:
+            row (int): row number
+            label (str): display label
+            tool_tip (str, optional): tool tip. Defaults to None to keep.
+            record (BundleVersion, optional): bundle entity. Defaults to 
+                                            None to keep.
+        """
+        
+        self.labels[row] = label
+        if tool_tip is not None:
+            self.tool_tips[row] = tool_tip
+        if record is not None:
+            self.records[row] = record
+        if row < self.fetched:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+    
+    def clear(self) -> None:
+        
+        """Remove every row"""
+        
+        self.set_rows([])
+
+
+class BundleFilterProxy(QSortFilterProxyModel):
+    
+    """
+    Long lived filter proxy of the bundle list view. Accepts the 
+    bundle names of the given match set, or every row when no match 
+    set given. The matching itself done by the importer over its 
+    index, the proxy only checks the membership.
+    """
+    
+    def __init__(self,
+                 parent: QtWidgets.QWidget = None) -> None:
+        """Initialize the proxy accepting every row
+
+        Args:
+            parent (QtWidgets.QWidget, optional): owner widget. Defaults to None.
+        """
+        
+        super().__init__(parent)
+        self.matches = None
+    
+    def set_matches(self, 
+                    matches: set = None) -> None:
+        """Show only the given bundle names
+
+        Args:
+            matches (set, optional): bundle names to show. Defaults to 
+                                    None for every bundle.
+        """
+        
+        if matches is None and self.matches is None:
+            return
+        if matches is not None:
+            self.sourceModel().fetch_all()
+        self.matches = matches
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, 
+                         source_row: int, 
+                         source_parent: QModelIndex) -> bool:
+        
+        if self.matches is None:
+            return True
+        source_index = self.sourceModel().index(source_row, 0, source_parent)
+        return self.sourceModel().data(source_index) in self.matches
+
+
+def catalog_changes(templates: Templates,
+                    changed: list,
+                    removed: list) -> dict:
+    """
+    Changes of a revalidation as handed to the importer
+
+    Args:
+        templates (Templates): revalidated templates model
+        changed (list): keys of the added or changed versions
+        removed (list): keys of the removed versions
+
+    Returns:
+        dict:   'changed' and 'removed' version keys, 'entities' 
+                (project name, bundle entity) tuples of the changed 
+                versions and 'removed_bundle_names' names of the 
+                removed bundles no other bundle of any domain or 
+                context is named after
+    """
+    
+    # The bundle folder is named after the bundle
+    snapshot = templates.snapshot
+    removed_bundle_names = {os.path.basename(config_path) for config_path, _ in removed
+                            if config_path not in snapshot.bundles}
+    return {'changed': changed,
+            'removed': removed,
+            'entities': templates.make_bundle_entities(changed),
+            'removed_bundle_names': sorted(bundle_name for bundle_name in removed_bundle_names
+                                           if bundle_name not in snapshot.name_projects)}
+
+
+class CatalogLoader(QThread):
+    
+    """
+    Load the catalog in a worker thread. The given load call of the 
+    templates model (load or sync) runs first, then the bundle 
+    entities were streamed to the importer in batches. In lazy mode 
+    the config.json datas of the bundles streamed instead. The importer
+    keeps away from the templates model until finished emitted.
+    Cancelled with requestInterruption(), checked between batches.
+    
+    Stale while revalidate: with cached set, the catalog cached in the
+    local catalog index streamed first without looking at the share,
+    then revalidated against the share and only the changed versions
+    handed over with revalidated.
+    """
+    
+    # loaded entities and total entities
+    progress = Signal(int, int)
+    # list of (project name, bundle entity or config) tuples
+    batch_loaded = Signal(object)
+    # catalog_changes() dict of the revalidation
+    revalidated = Signal(object)
+    failed = Signal(str)
+    
+    def __init__(self,
+                 templates: Templates,
+                 load,
+                 lazy: bool = False,
+                 cached: bool = False,
+                 parent: QtWidgets.QWidget = None) -> None:
+        """Initialize the templates model and its load call
+
+        Args:
+            templates (Templates): templates model to load
+            load (callable): Templates.load or Templates.sync
+            lazy (bool, optional): stream bundles instead of versions. 
+                                    Defaults to False.
+            cached (bool, optional): stream the cached catalog first and 
+                                    revalidate it after. load called only 
+                                    if nothing cached. Defaults to False.
+            parent (QtWidgets.QWidget, optional): owner widget. Defaults to None.
+        """
+        
+        super().__init__(parent)
+        self.templates = templates
+        self.load = load
+        self.lazy = lazy
+        self.cached = cached
+        self.completed = False
+    
+    def run(self) -> None:
+        
+        try:
+            cached = self.cached and self.templates.load_cached()
+            if not cached:
+                self.load()
+            if self.lazy:
+                entities = [(config['project'], config) 
+                            for config in self.templates.list_all_bundle_config()]
+            else:
+                entities = [(project, bundle_entity) 
+                            for project, bundle_entities in 
+                                self.templates.list_all_bundle_entity().items()
+                            for bundle_entity in bundle_entities]
+        except Exception as error:
+            self.failed.emit(str(error))
+            return
+        
+        self.progress.emit(0, len(entities))
+        for start in range(0, len(entities), LOAD_BATCH_SIZE):
+            if self.isInterruptionRequested():
+                return
+            self.batch_loaded.emit(entities[start:start + LOAD_BATCH_SIZE])
+            self.progress.emit(min(start + LOAD_BATCH_SIZE, len(entities)),
+                               len(entities))
+            self.msleep(LOAD_BATCH_INTERVAL)
+        
+        if cached:
+            if self.isInterruptionRequested():
+                return
+            try:
+                changes = catalog_changes(self.templates, 
+                                          *self.templates.revalidate())
+            except Exception as error:
+                self.failed.emit(str(error))
+                return
+            self.revalidated.emit(changes)
+        self.completed = True
+
+
+class CatalogRevalidator(QThread):
+    
+    """
+    Revalidate the templates model in a worker thread once the
+    catalog watcher saw the share move. The journal replay and the
+    index writes kept off the ui thread, only the catalog_changes() 
+    dict handed back to the importer.
+    """
+    
+    # catalog_changes() dict of the revalidation
+    revalidated = Signal(object)
+    
+    def __init__(self,
+                 templates: Templates,
+                 parent: QtWidgets.QWidget = None) -> None:
+        """Initialize the templates model to revalidate
+
+        Args:
+            templates (Templates): loaded templates model
+            parent (QtWidgets.QWidget, optional): owner widget. Defaults to None.
+        """
+        
+        super().__init__(parent)
+        self.templates = templates
+    
+    def run(self) -> None:
+        
+        try:
+            if not self.templates.catalog_changed():
+                return
+            changes = catalog_changes(self.templates, *self.templates.revalidate())
+        except OSError:
+            # Share unreachable for a moment, merged on the next change
+            return
+        if changes['changed'] or changes['removed']:
+            self.revalidated.emit(changes)
+
+
+class CatalogWatcher(QThread):
+    
+    """
+    Watch the catalog files of the share in a worker thread and emit
+    catalog_moved when a publish or removal landed. Only stats the 
+    files, the templates model left to the importer which merges the
+    changes itself. Stopped with stop().
+    """
+    
+    catalog_moved = Signal()
+    
+    def __init__(self,
+                 root_path: str,
+                 parent: QtWidgets.QWidget = None) -> None:
+        """Initialize the share watcher
+
+        Args:
+            root_path (str): Root folder of the bundles
+            parent (QtWidgets.QWidget, optional): owner widget. Defaults to None.
+        """
+        
+        super().__init__(parent)
+        self.share_watcher = ShareWatcher(root_path)
+    
+    def run(self) -> None:
+        
+        self.share_watcher.start()
+        signature = self.share_watcher.signature()
+        while not self.isInterruptionRequested():
+            self.share_watcher.wait()
+            moved_signature = self.share_watcher.signature()
+            if moved_signature != signature:
+                signature = moved_signature
+                self.catalog_moved.emit()
+        self.share_watcher.stop()
+    
+    def stop(self) -> None:
+        
+        """Stop watching and wait for the thread"""
+        
+        self.requestInterruption()
+        self.share_watcher.wake()
+        self.wait()
 
 
 class Importer(QtWidgets.QWidget):
@@ -122,8 +641,25 @@ class Importer(QtWidgets.QWidget):
         self.contexts = self.defaults.get_defaults_context()
         self.domains = self.defaults.get_default_domain()
         
-        # Initialize to Read Bundle templates in various ways
-        self.templates = Templates()
+        # Initialize to Read Bundle templates in various ways.
+        # The catalog itself loaded in a worker thread
+        self.templates = Templates(load=False)
+        self.catalog_loader = None
+        self.catalog_revalidator = None
+        # Set while a worker thread owns the templates model. The ui
+        # actions reading the model meanwhile deferred until it finished
+        self.catalog_working = False
+        self.deferred_actions = []
+        # Share moved while a worker was busy, revalidated after it
+        self.catalog_push_pending = False
+        self.lazy_versions = LAZY_VERSIONS
+        self.loaded_config_paths = set()
+        self.rendered_fragments = {}
+        # (project, domain, context, bundle) index of the loaded entities
+        self.version_index = FacetIndex()
+        self.version_records = []
+        self.version_index_dirty = True
+        self.all_entities_loaded = not self.lazy_versions
 
         # Initialize thadam DB api to gather the projects      
         self.thadam_db = ThadamDB()
@@ -165,11 +701,19 @@ class Importer(QtWidgets.QWidget):
             QtWidgets.QLineEdit,
             "bundle_ldt"
         )
-        self.filter_bundle_lineedit.textEdited.connect(
-                lambda: self.filter_bundle_to_selected_project(
-                    self.project_combo_box.currentText()
-                )
-        )
+        # Keystrokes restart the debounce timer, the search runs once 
+        # the user paused typing. 
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_INTERVAL)
+        self.search_timer.timeout.connect(self.apply_bundle_search)
+        self.filter_bundle_lineedit.textEdited.connect(self.search_timer.start)
+        
+        # Last plain search text and its matching bundle names. An 
+        # extended plain text narrows down these matches instead of 
+        # every bundle
+        self.search_text = ''
+        self.search_matches = None
         
         # Initialize domain combobox filters and add all
         # the domain list context as items. set current item to nil 
@@ -200,7 +744,20 @@ class Importer(QtWidgets.QWidget):
         # Disabled Editing the items in the list view and the model item to 
         # show it to the view.
         self.bundle_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.bundle_model = QStandardItemModel()
+        # Rows of same height, the view skips measuring every row
+        self.bundle_list.setUniformItemSizes(True)
+        self.bundle_model = CatalogListModel(self)
+        
+        # The bundle list view always shows the model through one proxy.
+        # The search box only changes the names accepted by the proxy
+        self.bundle_filter_proxy = BundleFilterProxy(self)
+        self.bundle_filter_proxy.setSourceModel(self.bundle_model)
+        self.bundle_list.setModel(self.bundle_filter_proxy)
+        # Project of the bundles held by the bundle model, None if the 
+        # model holds a filtered set of bundles
+        self.bundle_model_project = None
+        # Filter proxies of the domain and context list views
+        self.list_filter_proxies = {}
 
         # Call for loading bundles 
         self.load_bundles()
@@ -209,15 +766,6 @@ class Importer(QtWidgets.QWidget):
         # it updates the widgets related to the selected bundle
         self.bundle_list.clicked.connect(self.filter_selected_bundle_items)
 
-        # Search box input text dynamically trigger the filter item method.
-        # Based upon the inputing text lively the bundle and version views updated.
-        self.filter_bundle_lineedit.textEdited.connect(
-                    lambda: self.filter_items(self.bundle_list,
-                                                self.bundle_model,
-                                                self.filter_bundle_lineedit.text(),
-                                                self.bundle_list.objectName())
-        )
-        
         # Initialize domain list view widget. 
         self.domain_list =self.importer_window.findChild(
             QtWidgets.QListView,
@@ -227,7 +775,7 @@ class Importer(QtWidgets.QWidget):
         # taken care by the domain combobox. 
         self.domain_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.domain_list.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.domain_model = QStandardItemModel()
+        self.domain_model = CatalogListModel(self)
 
         # append retrived domain list items to the model of the domain list view
         self.append_items_to_list_view(self.domain_model, 
@@ -261,7 +809,7 @@ class Importer(QtWidgets.QWidget):
         )
         self.context_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.context_list.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.context_model = QStandardItemModel()
+        self.context_model = CatalogListModel(self)
         self.append_items_to_list_view(self.context_model, 
                                   self.context_list, 
                                   self.contexts)
@@ -271,9 +819,6 @@ class Importer(QtWidgets.QWidget):
         self.filter_context_cbx.activated[str].connect(
                 self.filter_version_on_context_by_domain
         )
-        self.filter_context_cbx.activated[str].connect(
-                self.filter_version_on_context_of_all_domain
-        )
         self.filter_context_cbx.activated.connect(
                     lambda: self.filter_items(self.context_list,
                                                 self.context_model,
@@ -310,12 +855,45 @@ class Importer(QtWidgets.QWidget):
             "version_list"
         )
         self.version_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.version_list.setUniformItemSizes(True)
         
         # Initialize the action drop down menus for the version list 
         self.version_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.version_list.customContextMenuRequested.connect(self.action_menus)
         
-        self.version_model = QStandardItemModel()
+        self.version_model = CatalogListModel(self)
+        # Versions given to the version list before the sort and the
+        # creation date filter, (version label, bundle entity) pairs
+        self.listed_versions = []
+        
+        # Sort the versions by a numeric field and filter them by the 
+        # creation date. The fields precomputed in the bundle entities,
+        # nothing parsed per row
+        self.version_sort_cbx = self.importer_window.findChild(
+            QtWidgets.QComboBox,
+            "version_sort_cbx"
+        )
+        self.version_sort_cbx.addItems(list(VERSION_SORT_KEYS))
+        self.version_sort_cbx.activated.connect(self.apply_version_order)
+        
+        self.created_range_chk = self.importer_window.findChild(
+            QtWidgets.QCheckBox,
+            "created_range_chk"
+        )
+        self.created_range_chk.toggled.connect(self.apply_version_order)
+        self.created_from_dte = self.importer_window.findChild(
+            QtWidgets.QDateEdit,
+            "created_from_dte"
+        )
+        self.created_from_dte.setDate(QDate.currentDate().addMonths(-1))
+        self.created_to_dte = self.importer_window.findChild(
+            QtWidgets.QDateEdit,
+            "created_to_dte"
+        )
+        self.created_to_dte.setDate(QDate.currentDate())
+        for date_edit in (self.created_from_dte, self.created_to_dte):
+            date_edit.dateChanged.connect(self.apply_version_order)
+        
         self.load_versions()
         # Signal to change the bundle type
         self.version_list.clicked[QModelIndex].connect(
@@ -370,46 +948,654 @@ class Importer(QtWidgets.QWidget):
         tool_title_icon = os.path.join(dirname, "icons/node_importer.PNG")
         tool_title_pixmap = QPixmap(tool_title_icon)
         self.tool_title_label.setPixmap(tool_title_pixmap.scaled(300,90))
+        
+        # Progress of the catalog loading shown over the bundle type
+        # label with a button to cancel it. Both hidden once loaded
+        self.load_progress_bar = self.importer_window.findChild(
+            QtWidgets.QProgressBar,
+            "load_progress_bar"
+        )
+        self.load_progress_bar.setFormat(
+            "%v / %m bundles" if self.lazy_versions else "%v / %m versions"
+        )
+        self.load_progress_bar.hide()
+        self.cancel_load_btn = self.importer_window.findChild(
+            QtWidgets.QPushButton,
+            "cancel_load_btn"
+        )
+        self.cancel_load_btn.clicked.connect(self.cancel_catalog_loader)
+        self.cancel_load_btn.hide()
+        
+        # Load the catalog without blocking the ui. The catalog cached
+        # on this workstation shown first, then revalidated
+        self.start_catalog_loader(self.templates.load, cached=True)
+        
+        # Publishes and removals of the share pushed into the views
+        self.catalog_watcher = None
+        if WATCH_CATALOG:
+            self.catalog_watcher = CatalogWatcher(self.templates.catalog_index.root_path,
+                                                  parent=self)
+            self.catalog_watcher.catalog_moved.connect(self.push_catalog_changes)
+            self.catalog_watcher.start()
+    
+    def append_items_to_combobox(self, 
+                                combobox: QtWidgets.QComboBox, 
+                                items: list) -> None:
+
+        """Itarate over the items in the list 
+        add it into as combobox items
+
+        Args:
+            combobox (QtWidgets.QComboBox): combobox widget object
+            items (list): List string items.
+        """
+        
+        for item in items:
+            combobox.addItem(item)
+    
+    def switch_util_buttons_state(self, 
+                                  status: bool = False) -> None:
+        """Switch the appearance of the widget to the given status
+
+        Args:
+            status (bool, optional): Determine the On and Off condition
+            to a widget. Defaults to False.
+        """
+        
+        self.reload_btn.setEnabled(status)
+        self.filter_bundle_lineedit.setEnabled(status)
+        self.filter_context_cbx.setEnabled(status)
+        self.filter_domain_cbx.setEnabled(status)
+        
+    
+    def reload(self) -> None:
+
+        """Revert back the GUI into a dashboard state.
+        Changes of the file system merged into the catalog
+        in the worker thread. If the generation stamp of the share
+        not moved, the dashboard rebuilt from the loaded catalog."""
+        
+        self.filter_context_cbx.setCurrentIndex(-1)
+        self.filter_domain_cbx.setCurrentIndex(-1)
+        self.filter_bundle_lineedit.setText('')
+        self.search_timer.stop()
+        if self.catalog_loader is not None and \
+            not self.catalog_busy() and \
+            self.catalog_loader.completed and \
+            not self.templates.catalog_changed():
+            self.filter_bundle_to_selected_project(
+                        self.project_combo_box.currentText()
+            )
+            return
+        self.start_catalog_loader(self.templates.sync)
+    
+    def start_catalog_loader(self, 
+                             load, 
+                             cached: bool = False) -> None:
+        """
+        Empty the bundle and version views and load the catalog
+        in a CatalogLoader thread. The filters and the project 
+        selection disabled until the loading finished.
+
+        Args:
+            load (callable): Templates.load or Templates.sync
+            cached (bool, optional): show the catalog cached on this 
+                                    workstation first and revalidate it 
+                                    against the share. Defaults to False.
+        """
+        
+        if self.catalog_loader is not None:
+            self.catalog_loader.requestInterruption()
+            self.catalog_loader.wait()
+        # A revalidation under way finished and dropped, the loader 
+        # reads the share again anyway
+        if self.catalog_revalidator is not None:
+            self.catalog_revalidator.wait()
+            self.catalog_revalidator = None
+        self.catalog_working = True
+        
+        self.switch_util_buttons_state(status=False)
+        self.project_combo_box.setEnabled(False)
+        self.all_bundle_info_entities = {}
+        self.all_versions = []
+        self.registered_domains = set()
+        self.loaded_bundles = set()
+        self.loaded_config_paths = set()
+        self.all_entities_loaded = not self.lazy_versions
+        self.rendered_fragments = {}
+        self.version_index_dirty = True
+        self.catalog_changed = False
+        self.append_items_to_list_view(self.bundle_model, 
+                                       self.bundle_list, 
+                                       [])
+        self.append_items_to_list_view(self.version_model, 
+                                       self.version_list, 
+                                       [],
+                                       metadata=True)
+        self.info_textedit.clear()
+        self.comments_textedit.clear()
+        
+        # Busy indicator until the total known
+        self.load_progress_bar.setRange(0, 0)
+        self.load_progress_bar.show()
+        self.cancel_load_btn.show()
+        
+        self.catalog_loader = CatalogLoader(self.templates, 
+                                            load, 
+                                            lazy=self.lazy_versions, 
+                                            cached=cached,
+                                            parent=self)
+        self.catalog_loader.progress.connect(self.show_load_progress)
+        if self.lazy_versions:
+            self.catalog_loader.batch_loaded.connect(self.append_loaded_bundles)
+        else:
+            self.catalog_loader.batch_loaded.connect(self.append_loaded_entities)
+        self.catalog_loader.revalidated.connect(self.apply_catalog_changes)
+        self.catalog_loader.failed.connect(self.show_load_failure)
+        self.catalog_loader.finished.connect(self.catalog_loaded)
+        self.catalog_loader.start()
+    
+    def cancel_catalog_loader(self) -> None:
+        
+        """Stop streaming the catalog. Bundles loaded so far stay"""
+        
+        if self.catalog_loader is not None:
+            self.catalog_loader.requestInterruption()
+    
+    def show_load_progress(self, 
+                           loaded: int, 
+                           total: int) -> None:
+        """Update the loading progress bar
+
+        Args:
+            loaded (int): loaded version count
+            total (int): total version count
+        """
+        
+        self.load_progress_bar.setRange(0, total)
+        self.load_progress_bar.setValue(loaded)
+    
+    def show_load_failure(self, 
+                          error: str) -> None:
+        """Warn the catalog could not be loaded
+
+        Args:
+            error (str): error message of the loader
+        """
+        
+        util_messagebox = utilMessageBox('warning',
+                                         f"Bundles Not Loaded!!\n{error}")
+        util_messagebox.show_message()
+    
+    def append_loaded_entities(self, 
+                               entities: list) -> None:
+        """
+        Append a batch of loaded bundle entities into the bundle and 
+        version views, for the selected project only.
+
+        Args:
+            entities (list): (project name, bundle entity) tuples
+        """
+        
+        selected_project = self.project_combo_box.currentText()
+        version_labels = []
+        version_records = []
+        bundle_labels = []
+        for project, bundle_entity in entities:
+            self.all_bundle_info_entities.setdefault(project, []).append(bundle_entity)
+            self.version_index_dirty = True
+            self.registered_domains.add(bundle_entity['domain'])
+            if selected_project != ALL_PROJECTS_KEY and \
+                selected_project != project:
+                continue
+            
+            self.all_versions.append({bundle_entity['version']: bundle_entity})
+            version_labels.append(bundle_entity['version'])
+            version_records.append(bundle_entity)
+            
+            if bundle_entity['bundle_name'] not in self.loaded_bundles:
+                self.loaded_bundles.add(bundle_entity['bundle_name'])
+                bundle_labels.append(bundle_entity['bundle_name'])
+        self.version_model.append_rows(version_labels, records=version_records)
+        self.listed_versions.extend(zip(version_labels, version_records))
+        self.bundle_model.append_rows(bundle_labels)
+    
+    def apply_catalog_changes(self, 
+                              changes: dict) -> None:
+        """
+        Apply the versions changed on the share since the cached 
+        catalog was shown. Only the entities of the changed and removed
+        versions replaced, the views refreshed once loading finished.
+        Lazy mode drops every entity of the changed bundles instead, 
+        fetched again when selected.
+
+        Args:
+            changes (dict): catalog_changes() dict of the revalidation
+        """
+        
+        stale_versions = set(changes['changed']) | set(changes['removed'])
+        if not stale_versions:
+            return
+        stale_config_paths = {config_path for config_path, _ in stale_versions}
+        for project, bundle_entities in self.all_bundle_info_entities.items():
+            self.all_bundle_info_entities[project] = [
+                bundle_entity for bundle_entity in bundle_entities
+                if bundle_entity['config_path'] not in stale_config_paths or
+                not self.lazy_versions and 
+                (bundle_entity['config_path'], 
+                 bundle_entity['version_number']) not in stale_versions
+            ]
+        if not self.lazy_versions:
+            for project, bundle_entity in changes['entities']:
+                self.all_bundle_info_entities.setdefault(project, []).append(bundle_entity)
+        
+        # Lazy mode fetches the versions of the changed bundles again 
+        self.loaded_config_paths -= stale_config_paths
+        self.rendered_fragments = {
+            cache_key: fragments 
+            for cache_key, fragments in self.rendered_fragments.items()
+            if cache_key[0] not in stale_config_paths
+        }
+        self.version_index_dirty = True
+        self.catalog_changed = True
+    
+    def push_catalog_changes(self) -> None:
+        
+        """
+        Revalidate the catalog in a CatalogRevalidator thread once the
+        catalog watcher saw the share move. The ui stays usable, the 
+        actions reading the templates model deferred until the thread
+        finished. A move seen while a worker is busy revalidated once 
+        it finished. A cancelled catalog left to the reload button.
+        """
+        
+        if self.catalog_busy():
+            self.catalog_push_pending = True
+            return
+        self.catalog_push_pending = False
+        if self.catalog_loader is None or not self.catalog_loader.completed:
+            return
+        self.catalog_working = True
+        self.catalog_revalidator = CatalogRevalidator(self.templates, parent=self)
+        self.catalog_revalidator.revalidated.connect(self.apply_pushed_changes)
+        self.catalog_revalidator.finished.connect(self.catalog_revalidated)
+        self.catalog_revalidator.start()
+    
+    def apply_pushed_changes(self, 
+                             changes: dict) -> None:
+        """
+        Merge the changes of a CatalogRevalidator into the loaded 
+        entities and update only the rows of the changed versions and
+        bundles. Changes of a revalidator dropped by a reload ignored.
+
+        Args:
+            changes (dict): catalog_changes() dict of the revalidation
+        """
+        
+        if self.sender() is not self.catalog_revalidator:
+            return
+        self.apply_catalog_changes(changes)
+        self.update_changed_rows(changes)
+    
+    def catalog_revalidated(self) -> None:
+        
+        """Give the templates model back to the ui once the 
+        CatalogRevalidator finished and run the deferred actions"""
+        
+        if self.sender() is not self.catalog_revalidator:
+            return
+        self.catalog_revalidator = None
+        self.release_catalog()
+    
+    def release_catalog(self) -> None:
+        
+        """Give the templates model back to the ui once a worker 
+        finished with it, run the deferred actions and revalidate a
+        share move seen meanwhile"""
+        
+        self.catalog_working = False
+        self.run_deferred_actions()
+        if self.catalog_push_pending:
+            self.push_catalog_changes()
+    
+    def version_row_visible(self, 
+                            project: str, 
+                            bundle_entity: BundleVersion) -> bool:
+        """
+        Check a new version belongs in the version view as it is
+        filtered now. Versions listed without a selected bundle only on
+        the dashboard, no filter or search text chosen.
+
+        Args:
+            project (str): project name of the version
+            bundle_entity (BundleVersion): bundle entity of the version
+
+        Returns:
+            bool: True if the version view lists it
+        """
+        
+        if self.project_combo_box.currentText() not in (ALL_PROJECTS_KEY, project):
+            return False
+        user_filter_domain = self.filter_domain_cbx.currentText()
+        user_filter_context = self.filter_context_cbx.currentText()
+        selected_bundle = self.bundle_list.currentIndex().data()
+        if selected_bundle:
+            if bundle_entity['bundle_name'] != selected_bundle:
+                return False
+        elif self.lazy_versions or user_filter_domain or user_filter_context or \
+            self.filter_bundle_lineedit.text():
+            return False
+        if user_filter_domain and bundle_entity['domain'] != user_filter_domain or \
+            user_filter_context and bundle_entity['context'] != user_filter_context:
+            return False
+        since, until = self.created_range()
+        return since is None or since <= bundle_entity.created_epoch < until
+    
+    def bundle_row_visible(self, 
+                           project: str, 
+                           bundle_entity: BundleVersion) -> bool:
+        """
+        Check the bundle of a new version belongs in the bundle view
+        as it is filtered now. The search text left to the bundle proxy.
+
+        Args:
+            project (str): project name of the version
+            bundle_entity (BundleVersion): bundle entity of the version
+
+        Returns:
+            bool: True if the bundle view lists the bundle
+        """
+        
+        if self.project_combo_box.currentText() not in (ALL_PROJECTS_KEY, project):
+            return False
+        user_filter_domain = self.filter_domain_cbx.currentText()
+        user_filter_context = self.filter_context_cbx.currentText()
+        return not (user_filter_domain and bundle_entity['domain'] != user_filter_domain or
+                    user_filter_context and bundle_entity['context'] != user_filter_context)
+    
+    def update_changed_rows(self, 
+                            changes: dict) -> None:
+        """
+        Update the bundle and version views for the changes of a 
+        revalidation. Rows of the changed versions replaced in place, 
+        rows of the removed versions and bundles dropped, new versions 
+        and bundles appended if the current filters show them.
+
+        Args:
+            changes (dict): catalog_changes() dict of the revalidation
+        """
+        
+        stale_versions = set(changes['changed']) | set(changes['removed'])
+        changed_entities = {(bundle_entity['config_path'], 
+                             bundle_entity['version_number']): (project, bundle_entity)
+                            for project, bundle_entity in changes['entities']}
+        
+        # Version rows in place, the new versions appended at the end
+        new_entities = dict(changed_entities)
+        records = self.version_model.records
+        version_rows_changed = False
+        for row in reversed(range(len(records))):
+            version_key = (records[row]['config_path'], records[row]['version_number'])
+            if version_key not in stale_versions:
+                continue
+            new_entities.pop(version_key, None)
+            version_rows_changed = True
+            if version_key in changed_entities:
+                bundle_entity = changed_entities[version_key][1]
+                self.version_model.set_row(row, bundle_entity['version'], 
+                                           record=bundle_entity)
+            else:
+                self.version_model.remove_row(row)
+        appended_versions = [(bundle_entity['version'], bundle_entity)
+                             for project, bundle_entity in new_entities.values()
+                             if self.version_row_visible(project, bundle_entity)]
+        self.version_model.append_rows([version_label for version_label, _ in appended_versions],
+                                       records=[bundle_entity 
+                                                for _, bundle_entity in appended_versions])
+        version_rows_changed = version_rows_changed or bool(appended_versions)
+        listed_versions = []
+        for version_label, bundle_entity in self.listed_versions:
+            version_key = (bundle_entity['config_path'], bundle_entity['version_number'])
+            if version_key not in stale_versions:
+                listed_versions.append((version_label, bundle_entity))
+            elif version_key in changed_entities:
+                bundle_entity = changed_entities[version_key][1]
+                listed_versions.append((bundle_entity['version'], bundle_entity))
+        self.listed_versions = listed_versions + appended_versions
+        
+        # Bundle rows dropped once no bundle of that name is left
+        for bundle_name in changes['removed_bundle_names']:
+            self.loaded_bundles.discard(bundle_name)
+            if bundle_name in self.bundle_model.labels:
+                self.bundle_model.remove_row(self.bundle_model.labels.index(bundle_name))
+        
+        # Bundles of the new versions appended, with the project tool
+        # tip when all the projects listed
+        listed_bundles = set(self.bundle_model.labels)
+        with_tool_tips = self.project_combo_box.currentText() == ALL_PROJECTS_KEY and \
+                            len(self.bundle_model.tool_tips) == len(self.bundle_model.labels)
+        search_pattern = bundle_search_pattern(self.filter_bundle_lineedit.text())
+        bundle_labels = []
+        tool_tips = []
+        for project, bundle_entity in changed_entities.values():
+            self.registered_domains.add(bundle_entity['domain'])
+            bundle_name = bundle_entity['bundle_name']
+            if bundle_name in listed_bundles or \
+                not self.bundle_row_visible(project, bundle_entity):
+                continue
+            listed_bundles.add(bundle_name)
+            self.loaded_bundles.add(bundle_name)
+            bundle_labels.append(bundle_name)
+            tool_tips.append(project)
+            if self.bundle_filter_proxy.matches is not None and \
+                search_pattern.isValid() and search_pattern.indexIn(bundle_name) != -1:
+                self.bundle_filter_proxy.matches.add(bundle_name)
+        self.bundle_model.append_rows(bundle_labels, 
+                                      tool_tips=tool_tips if with_tool_tips else None)
+        
+        # Infos and comments of the selected bundle rendered again 
+        # if its version rows changed
+        if version_rows_changed and self.bundle_list.currentIndex().data():
+            self.render_comments_and_infos(list(self.version_model.records))
+    
+    def list_loaded_versions(self) -> None:
+        
+        """List the loaded versions of the selected project into
+        the version view, no catalog read"""
+        
+        selected_project = self.project_combo_box.currentText()
+        self.all_versions = [
+            {bundle_entity['version']: bundle_entity}
+            for project, bundle_entities in self.all_bundle_info_entities.items()
+            if selected_project in (ALL_PROJECTS_KEY, project)
+            for bundle_entity in bundle_entities
+        ]
+        self.append_items_to_list_view(self.version_model, 
+                                       self.version_list, 
+                                       self.all_versions,
+                                       metadata=True)
+    
+    def append_loaded_bundles(self, 
+                              configs: list) -> None:
+        """
+        Lazy mode. Append a batch of loaded bundle names into the 
+        bundle view, for the selected project only.
+
+        Args:
+            configs (list): (project name, config.json datas) tuples
+        """
+        
+        selected_project = self.project_combo_box.currentText()
+        bundle_labels = []
+        for project, config in configs:
+            self.registered_domains.add(config['domain'])
+            if selected_project != ALL_PROJECTS_KEY and \
+                selected_project != project:
+                continue
+            if config['name'] not in self.loaded_bundles:
+                self.loaded_bundles.add(config['name'])
+                bundle_labels.append(config['name'])
+        self.bundle_model.append_rows(bundle_labels)
+    
+    def load_bundle_entities(self,
+                             bundle_name: str = '',
+                             project_name: str = '') -> None:
+        """
+        Lazy mode. Fetch the version entities of the bundles with the 
+        given name or of the given project into all_bundle_info_entities.
+        Bundles fetched once were cached until the next reload.
+
+        Args:
+            bundle_name (str, optional): bundle name. Defaults to ''.
+            project_name (str, optional): project name. Defaults to ''.
+        """
+        
+        if self.all_entities_loaded:
+            return
+        fetched_config_paths = set()
+        bundle_entities = self.templates.list_all_bundle_entity(bundle_name=bundle_name,
+                                                                project_name=project_name)
+        for project, entities in bundle_entities.items():
+            for bundle_entity in entities:
+                if bundle_entity['config_path'] not in self.loaded_config_paths:
+                    self.all_bundle_info_entities.setdefault(project, []).append(
+                                bundle_entity
+                    )
+                    fetched_config_paths.add(bundle_entity['config_path'])
+        self.loaded_config_paths |= fetched_config_paths
+        self.version_index_dirty = self.version_index_dirty or bool(fetched_config_paths)
+    
+    def load_all_entities(self) -> None:
+        
+        """
+        Lazy mode. Fetch the version entities of every bundle, needed 
+        once the filters run across the whole catalog.
+        """
+        
+        if self.all_entities_loaded:
+            return
+        self.all_bundle_info_entities = self.templates.list_all_bundle_entity()
+        self.all_entities_loaded = True
+        self.version_index_dirty = True
     
-    def append_items_to_combobox(self, 
-                                combobox: QtWidgets.QComboBox, 
-                                items: list) -> None:
+    def catalog_busy(self) -> bool:
+        
+        """Check a worker thread owns the templates model
 
-        """Itarate over the items in the list 
-        add it into as combobox items
+        Returns:
+            bool: True while loading or revalidating the catalog
+        """
+        
+        return self.catalog_working
+    
+    def defer_while_busy(self, 
+                         action) -> bool:
+        """
+        Keep a ui action reading the templates model for after the 
+        worker thread finished, the worker may be changing the catalog
+        snapshot under it.
 
         Args:
-            combobox (QtWidgets.QComboBox): combobox widget object
-            items (list): List string items.
+            action (callable): ui action to run later
+
+        Returns:
+            bool: True if deferred, the caller returns right away
         """
         
-        for item in items:
-            combobox.addItem(item)
+        if not self.catalog_busy():
+            return False
+        self.deferred_actions.append(action)
+        return True
     
-    def switch_util_buttons_state(self, 
-                                  status: bool = False) -> None:
-        """Switch the appearance of the widget to the given status
+    def run_deferred_actions(self) -> None:
+        
+        """Run the ui actions deferred while the worker was busy,
+        in the order the user made them"""
+        
+        deferred_actions, self.deferred_actions = self.deferred_actions, []
+        for action in deferred_actions:
+            action()
+    
+    def reselect_bundle(self, 
+                        bundle_name: str) -> None:
+        """
+        Select the bundle in the bundle view again and show its 
+        versions. The rows may have been refilled since the click.
 
         Args:
-            status (bool, optional): Determine the On and Off condition
-            to a widget. Defaults to False.
+            bundle_name (str): bundle name clicked
         """
         
-        self.reload_btn.setEnabled(status)
-        self.filter_bundle_lineedit.setEnabled(status)
-        self.filter_context_cbx.setEnabled(status)
-        self.filter_domain_cbx.setEnabled(status)
+        if bundle_name not in self.bundle_model.labels:
+            return
+        self.bundle_model.fetch_all()
+        index = self.bundle_filter_proxy.mapFromSource(
+                    self.bundle_model.index(self.bundle_model.labels.index(bundle_name))
+        )
+        if not index.isValid():
+            return
+        self.bundle_list.setCurrentIndex(index)
+        self.filter_selected_bundle_items(index)
+    
+    def catalog_loaded(self) -> None:
+        
+        """
+        Enable the ui back once the loader thread finished and run 
+        the ui actions deferred meanwhile. The finished signal of a 
+        loader replaced by a reload ignored.
+        """
         
+        if self.sender() is not self.catalog_loader:
+            return
+        self.catalog_working = False
+        self.load_progress_bar.hide()
+        self.cancel_load_btn.hide()
+        self.switch_util_buttons_state(status=True)
+        self.project_combo_box.setEnabled(True)
+        if self.catalog_loader.completed:
+            self.show_loaded_catalog()
+        self.run_deferred_actions()
+        if self.catalog_push_pending:
+            self.push_catalog_changes()
     
-    def reload(self) -> None:
-
-        """Revert back the GUI into a dashboard state"""
+    def show_loaded_catalog(self) -> None:
+        
+        """
+        Fill the views of a completed load. The bundle list sorted with
+        its project tool tips and the infos and comments filled once.
+        """
         
         self.load_bundles()
-        self.load_versions()
-        self.filter_context_cbx.setCurrentIndex(-1)
-        self.filter_domain_cbx.setCurrentIndex(-1)
-        self.filter_bundle_lineedit.setText('')
+        if self.lazy_versions:
+            return
+        # The cached versions shown replaced by the revalidated ones,
+        # else the versions streamed in catalog order sorted
+        if self.catalog_changed:
+            self.list_loaded_versions()
+        elif VERSION_SORT_KEYS[self.version_sort_cbx.currentText()] or \
+            self.created_range_chk.isChecked():
+            self.apply_version_order()
+        if self.project_combo_box.currentText() == ALL_PROJECTS_KEY:
+            self.add_comments_and_infos()
+        else:
+            self.add_comments_and_infos(
+                project_name=self.project_combo_box.currentText()
+            )
+    
+    def closeEvent(self, event) -> None:
+        
+        """Stop the loader and watcher threads before the widget goes away"""
+        
+        if self.catalog_watcher is not None:
+            self.catalog_watcher.stop()
+        if self.catalog_revalidator is not None:
+            self.catalog_revalidator.wait()
+        for remove_files_task in self.findChildren(RemoveFilesTask):
+            remove_files_task.wait()
+        if self.catalog_loader is not None:
+            self.catalog_loader.requestInterruption()
+            self.catalog_loader.wait()
+        super().closeEvent(event)
     
     def load_bundles(self) -> None:
 
@@ -429,28 +1615,28 @@ class Importer(QtWidgets.QWidget):
         # matching with the bundle entity project name
         else:
             self.bundles = []
-            for project, entities in self.templates.list_all_bundle_entity().items():
-                if self.project_combo_box.currentText() == project:
-                    for entity in entities:
-                        self.bundles.append(entity['bundle_name'])
+            for config in self.templates.list_all_bundle_config():
+                if self.project_combo_box.currentText() == config['project']:
+                    self.bundles.append(config['name'])
             
             # sort the bundle name and ingest into the list view
             self.bundles = sorted(set(self.bundles))
             self.append_items_to_list_view(self.bundle_model, 
                                         self.bundle_list, 
                                         self.bundles)
+        self.bundle_model_project = self.project_combo_box.currentText()
         
     def load_versions(self) -> None:
 
         """
-        Collect all the versions strings from the bundle entity dictionary 
+        Collect all the versions strings from the bundle entities 
         add in to the version list view, based upon the project selected by the
         user. also, the comments and user infos.
 
-        For versions the bundle entity dict passed as a meta data. 
-        The qstandarditems in the version list view hold this metadata.
+        For versions the bundle entity passed as a meta data. 
+        The rows of the version list model hold this metadata.
         The version string 'v001', v002, v003 are go for display role. user 
-        can see and interact. for each version string the bundle entity dict 
+        can see and interact. for each version string the bundle entity 
         goes as a user role. it wont visible. it holded as meta data.
         """
         
@@ -462,22 +1648,43 @@ class Importer(QtWidgets.QWidget):
         # Versions to store version key and entity as value dictionary
         self.all_versions = []
         self.registered_domains = set()
+        
+        # Lazy mode lists no version until a bundle selected
+        if self.lazy_versions:
+            self.append_items_to_list_view(self.version_model, 
+                                      self.version_list, 
+                                      [],
+                                      metadata = True)
+            self.append_items_to_list_view(self.domain_model, 
+                                      self.domain_list, 
+                                      self.domains)
+            self.append_items_to_list_view(self.context_model, 
+                                      self.context_list, 
+                                      self.contexts)
+            return
+        
         self.all_bundle_info_entities = self.templates.list_all_bundle_entity()
+        self.version_index_dirty = True
+        render_args = None
         for project, bundle_entities in self.all_bundle_info_entities.items():
             for bundle_entity in bundle_entities:
                 if self.project_combo_box.currentText() == ALL_PROJECTS_KEY:
                     self.all_versions.append(
                                 {bundle_entity['version']: bundle_entity}
                     )
-                    self.add_comments_and_infos()
+                    render_args = {}
                 if self.project_combo_box.currentText() == project:
                     self.all_versions.append(
                                 {bundle_entity['version']: bundle_entity}
                     )
-                    self.add_comments_and_infos(project_name=project)
+                    render_args = dict(project_name=project)
                 # Register the collected domain in the set 
                 self.registered_domains.add(bundle_entity['domain'])
         
+        # Infos and comments rendered once for all the versions
+        if render_args is not None:
+            self.add_comments_and_infos(**render_args)
+        
         # Meta data is enabled. The key of the dict loaded as user
         # viewable items in the list. The value of the dict loaded 
         # as userrole in meta data . 
@@ -493,28 +1700,27 @@ class Importer(QtWidgets.QWidget):
                                   self.contexts)
 
     def append_items_to_list_view(self, 
-                             model: QStandardItemModel, 
+                             model: CatalogListModel, 
                              listview: QtWidgets.QListView, 
                              items: list or dict,
                              include_tool_tip: bool= False,
                              metadata: bool = False) -> None:
         """
-        Iterate over the given list or dict declare each items
-        into the qstandarditem of the model. Embed the model to
-        the given list view. 
+        Replace the rows of the model with the given list or dict 
+        items. Embed the model to the given list view. 
 
         For each bundle name the respective project names were 
         included as tool tip. If user hoever the mouse point over 
         the bundle name, the project name belong to the bundle names 
         showned up. 
 
-        metadata for qstandarditem to hold. version list view 
-        items holds the respective dictionary of a bundle. 
-        metadata goes as UserRole of qstandarditem and others 
+        metadata for the rows to hold. version list view 
+        rows holds the respective dictionary of a bundle. 
+        metadata goes as UserRole of the row and others 
         goes as DisplayRole
 
         Args:
-            model (QStandardItemModel): Model of the list view
+            model (CatalogListModel): Model of the list view
             listview (QtWidgets.QListView): pyqt List view
             items (list | dict): list or dict item to update to the list view
             include_tool_tip (bool, optional): Helps to add the tool tip 
@@ -525,27 +1731,81 @@ class Importer(QtWidgets.QWidget):
 
         
         self.list_model = model
-        self.list_model.clear()
         self.list_model.setObjectName(listview.objectName())
-        listview.setModel(self.list_model)
+        
+        # The bundle list view keeps its proxy, a refilled bundle 
+        # model shows every given bundle
+        if model is self.bundle_model:
+            self.bundle_model_project = None
+            self.bundle_filter_proxy.set_matches(None)
+        elif listview.model() is not self.list_model:
+            listview.setModel(self.list_model)
         if not metadata and not include_tool_tip:
-            for item in items:
-                qstandarditem = QStandardItem(item)
-                self.list_model.appendRow(qstandarditem)
+            self.list_model.set_rows(items)
         elif not metadata and include_tool_tip:
-            for bundle_name, project_name in items.items():
-                qstandarditem = QStandardItem(bundle_name)
-                qstandarditem.setData(project_name, Qt.ToolTipRole)
-                self.list_model.appendRow(qstandarditem)
+            self.list_model.set_rows(items.keys(), tool_tips=items.values())
         else:
-            for item in items:
-                version_label = list(item.keys())[0]
-                versions_metadata = list(item.values())[0]
-                qstandarditem = QStandardItem()
-                qstandarditem.setData(version_label, Qt.DisplayRole)
-                qstandarditem.setData(versions_metadata, Qt.UserRole)
-                
-                self.list_model.appendRow(qstandarditem)
+            self.listed_versions = [(version_label, bundle_entity)
+                                    for item in items 
+                                    for version_label, bundle_entity in item.items()]
+            ordered_versions = self.order_versions(self.listed_versions)
+            self.list_model.set_rows([version_label for version_label, _ in ordered_versions], 
+                                     records=[bundle_entity 
+                                              for _, bundle_entity in ordered_versions])
+    
+    def created_range(self) -> tuple:
+        
+        """Creation epoch range chosen in the date filter
+
+        Returns:
+            tuple:  earliest epoch, 
+                    epoch upper bound excluded. None for both if 
+                    the date filter is off
+        """
+        
+        if not self.created_range_chk.isChecked():
+            return None, None
+        since = QDateTime(self.created_from_dte.date(), QTime(0, 0))
+        until = QDateTime(self.created_to_dte.date().addDays(1), QTime(0, 0))
+        return since.toSecsSinceEpoch(), until.toSecsSinceEpoch()
+    
+    def order_versions(self, 
+                       versions: list) -> list:
+        """
+        Filter the versions to the creation date range and sort them 
+        by the selected sort key. Compares the numeric fields of the
+        bundle entities.
+
+        Args:
+            versions (list): (version label, bundle entity) pairs
+
+        Returns:
+            list: filtered and sorted pairs
+        """
+        
+        since, until = self.created_range()
+        if since is not None:
+            versions = [version for version in versions 
+                        if since <= version[1].created_epoch < until]
+        sort_field = VERSION_SORT_KEYS[self.version_sort_cbx.currentText()]
+        if sort_field:
+            sort_key = attrgetter(sort_field)
+            versions = sorted(versions, key=lambda version: sort_key(version[1]), 
+                              reverse=True)
+        return versions
+    
+    def apply_version_order(self) -> None:
+        
+        """Reorder the listed versions after the sort or the date 
+        filter changed"""
+        
+        if self.defer_while_busy(self.apply_version_order):
+            return
+        self.append_items_to_list_view(self.version_model, 
+                                  self.version_list, 
+                                  [{version_label: bundle_entity} 
+                                   for version_label, bundle_entity in self.listed_versions],
+                                  metadata=True)
                 
     def filter_selected_version_comments(self, 
                                         index: QModelIndex) -> None:
@@ -564,27 +1824,23 @@ class Importer(QtWidgets.QWidget):
         bundle_name = []
         domain =set()
         context = set()
-        for _, bundle_entities in self.all_bundle_info_entities.items():
-            for bundle_entity in bundle_entities:
-                if bundle_entity['version'] == selected_version['version'] and \
-                    bundle_entity['bundle_name'] == selected_version['bundle_name'] and \
-                    bundle_entity['project_name'] == selected_version['project_name'] and \
-                    bundle_entity['domain'] == selected_version['domain'] and \
-                    bundle_entity['context'] == selected_version['context']:
-                        
-                    domain.add(bundle_entity['domain'])
-                    context.add(bundle_entity['context'])
-                    bundle_name.append(bundle_entity['bundle_name'])
-                    
-                    # Call the method to update the comments and infos
-                    # exist for the version used by the user 
-                    self.add_comments_and_infos(
-                        version=bundle_entity['version'],
-                        bundle_name=bundle_entity['bundle_name'],
-                        project_name=bundle_entity['project_name'],
-                        domain=bundle_entity['domain'],
-                        context=bundle_entity['context']
-                        )
+        selected_entities = [
+            bundle_entity for bundle_entity in 
+                self.lookup_entities(project=selected_version['project_name'],
+                                     domain=selected_version['domain'],
+                                     context=selected_version['context'],
+                                     bundle=selected_version['bundle_name'])
+            if bundle_entity['version'] == selected_version['version']
+        ]
+        for bundle_entity in selected_entities:
+            domain.add(bundle_entity['domain'])
+            context.add(bundle_entity['context'])
+            bundle_name.append(bundle_entity['bundle_name'])
+        
+        # Update the comments and infos exist for the 
+        # version used by the user 
+        if selected_entities:
+            self.render_comments_and_infos(selected_entities)
         
         # user selected version bundle name, domain, and conext infos
         # updated into the  respective widgets.
@@ -634,9 +1890,15 @@ class Importer(QtWidgets.QWidget):
         domain =set()
         context = set()
         
+        # Rows stay clickable while the loader revalidates the catalog,
+        # the click replayed once it finished
+        if self.defer_while_busy(partial(self.reselect_bundle, 
+                                         self.bundle_list.model().data(index))):
+            return
         user_filter_domain = self.filter_domain_cbx.currentText()
         user_filter_context = self.filter_context_cbx.currentText()
         self.selected_bundle = self.bundle_list.model().data(index)
+        self.load_bundle_entities(bundle_name=self.selected_bundle)
         
         def update_all_entities():
             """Upadate the items to the data structures"""
@@ -646,42 +1908,22 @@ class Importer(QtWidgets.QWidget):
             domain.add(bundle_entity['domain'])
             context.add(bundle_entity['context'])
         
-        for _, bundle_entities in self.all_bundle_info_entities.items():
-            for bundle_entity in bundle_entities:
-                
-                # Check the retrived bundles list matches with the 
-                # bundle name user selected from the widget
-                if bundle_entity['bundle_name'] == self.selected_bundle:
-
-                    # no domain and context filter selected
-                    if not user_filter_domain and not user_filter_context:
-                        update_all_entities()   
-                        self.filter_domain_cbx.setCurrentIndex(-1)
-                        self.filter_context_cbx.setCurrentIndex(-1)
-                        self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'])
-                    
-                    # domain and context filter selected
-                    elif user_filter_domain == bundle_entity['domain'] and \
-                        user_filter_context == bundle_entity['context']:
-                        update_all_entities() 
-                        self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                    domain=user_filter_domain,
-                                                    context=user_filter_context)
-
-                    # domain selected and  no context filter selected
-                    elif user_filter_domain == bundle_entity['domain'] and \
-                        not user_filter_context:
-                        update_all_entities()
-                        self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                domain=user_filter_domain)
-                    
-                    # no domain and context filter selected
-                    elif not user_filter_domain and \
-                        user_filter_context == bundle_entity['context']:
-                        update_all_entities()
-                        self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                context=user_filter_context)
-
+        # Versions of the selected bundle matching the domain 
+        # and context filters if chosen
+        facets = {'bundle': self.selected_bundle}
+        if user_filter_domain:
+            facets['domain'] = user_filter_domain
+        if user_filter_context:
+            facets['context'] = user_filter_context
+        if not user_filter_domain and not user_filter_context:
+            self.filter_domain_cbx.setCurrentIndex(-1)
+            self.filter_context_cbx.setCurrentIndex(-1)
+        
+        bundle_entities = self.lookup_entities(**facets)
+        for bundle_entity in bundle_entities:
+            update_all_entities()
+        self.render_comments_and_infos(bundle_entities)
+        
         # For a selected combination version , domain
         # context were updated into the respective 
         # qt widgets  
@@ -702,570 +1944,202 @@ class Importer(QtWidgets.QWidget):
                                 domain: str) -> None:
         """
         Filter bundle, context, version, info, comments upon selecting
-        the domain selection. Few cases also taken into consideration
-        
-        1.  The user entered any text in the bundle search box 
-            also taken into account. The matching text filtered bundles with 
-            matching selected domain names filtered. also the all widget contents.
-        2.  If bundle selected and the bundle is exist in more than one
-            domain names then it is also filtered based on the domain name
-            selected
-        3.  Finally, it Works in combination. The context, project, search box text
-            user selection bundle considered with domain filters.
-            Example: If context is selected. all bundles, versions , info and comments
-                    updated and filtered for selected context. now, user select domain 
-                    to filter based on it. This domain filter applied upon the exiting
-                    context filter. 
+        the domain selection. Works in combination with the project,
+        search box text, context filter and the selected bundle.
 
         Args:
             domain (str): User selected Domain name
                         EX: Magical, Volumetrics, etc ..,
         """
         
-        proceed = True 
-        proceed1 = True
-        proceed_clear_for_domain_mismatch = True
-        filtered_version = []
-        filtered_bundles = []
-        filtered_domains = []
-        contexts_of_domains = set()
-        user_selected_bundle = self.bundle_list.currentIndex().data()
-        
-        # For the selected project and domain only retrive and update the 
-        # bundle, domain, context widget content. 
-        # update=False indicates the version list view, info and comments 
-        # were left empty. This is left for user to choose a bundle 
-        # Choosing bundle now shows the info and comments related to that 
-        # bundle 
-        if not user_selected_bundle:
-            self.filter_bundle_to_selected_project(
-                        self.project_combo_box.currentText(),
-                        update_all = False
-            )
-        
-        # Read all the bundles exist in the bundle list view 
-        # add in the set data structure. Using for filtering in later part
-        model = self.bundle_model
-        items = model.findItems(self.filter_bundle_lineedit.text(), 
-                                flags=Qt.MatchContains)
-        filtered_bundled_names1 = set()
-        for index in items:
-            filtered_bundled_names1.add(index.text())
-        
-        for project, bundle_entities in self.all_bundle_info_entities.items():
-            for bundle_entity in bundle_entities:
-                
-                # check selected domain match with collected entity domain 
-                # not with the context
-                if bundle_entity['domain'] == domain and not \
-                            self.filter_context_cbx.currentText():
-
-                    # User selected no bundle and selected project drop down match with
-                    # 'all' or any thadam project and no serachbox text were
-                    # included condition checks        
-                    if not user_selected_bundle and \
-                        (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                         self.project_combo_box.currentText() == project) and \
-                        not self.filter_bundle_lineedit.text():
-
-                        # Collect the bundle names for the condition matched
-                        filtered_bundles.append(
-                                bundle_entity['bundle_name']
-                        )
-                        # Sort it based on the bundles index
-                        filtered_bundles = sorted(
-                                set(filtered_bundles), key=filtered_bundles.index
-                        )
-                        # Collect domain, context of matched condition and sort it 
-                        filtered_domains.append(bundle_entity['domain'])
-                        filtered_domains = sorted(
-                                set(filtered_domains), key=filtered_domains.index
-                        )
-                        contexts_of_domains.add(bundle_entity['context'])
-
-                        # Update the content  in to the respective list views of 
-                        # bundles and domain 
-                        self.append_items_to_list_view(self.bundle_model, 
-                                                self.bundle_list, 
-                                                filtered_bundles)
-                        self.append_items_to_list_view(self.domain_model, 
-                                            self.domain_list, 
-                                            filtered_domains)
-
-                        # Clear the version models of version list view 
-                        self.version_model.clear()
-
-                        # Clear all the comments 
-                        self.add_comments_and_infos(clear=True)
-                        
-                        # Versbose to other condition to not proceed 
-                        # if this block executed 
-                        proceed1 = False
-                        
-                    # User selected no bundle and selected project drop down match with
-                    # 'all' or any thadam project and any serachbox text were
-                    # included then below condition checks        
-                    elif not user_selected_bundle and \
-                        (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                        self.project_combo_box.currentText() == project) and \
-                        self.filter_bundle_lineedit.text():
-                        for filtered_bundled_name in filtered_bundled_names1:
-                            if filtered_bundled_name == bundle_entity['bundle_name']:
-
-                                contexts_of_domains.add(bundle_entity['context'])
-
-                                filtered_bundles.append(
-                                        bundle_entity['bundle_name']
-                                )
-                                filtered_bundles = sorted(
-                                        set(filtered_bundles), key=filtered_bundles.index
-                                )
-                                filtered_domains.append(bundle_entity['domain'])
-                                filtered_domains = sorted(
-                                        set(filtered_domains), key=filtered_domains.index
-                                )
-                                contexts_of_domains.add(bundle_entity['context'])
-                                self.append_items_to_list_view(self.bundle_model, 
-                                                        self.bundle_list, 
-                                                        filtered_bundles)
-                                self.append_items_to_list_view(self.domain_model, 
-                                                    self.domain_list, 
-                                                    filtered_domains)
-                                self.version_model.clear()
-                                self.add_comments_and_infos(clear=True)
-                                proceed1 = False
-
-                    # No context is selected              
-                    if not self.filter_context_cbx.currentText():
-                        # entity bundle name matching with user selected bundles
-                        # collect the context and version
-                        if bundle_entity['bundle_name'] == user_selected_bundle:
-                            contexts_of_domains.add(bundle_entity['context'])
-                            filtered_version.append(
-                                    {bundle_entity['version']: bundle_entity}   
-                            )
-                            # update info and comment section of the bundle name
-                            # and domain 
-                            self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                    domain=domain)
-                            # Make contextcombobox to no selection
-                            self.filter_context_cbx.setCurrentIndex(-1)
-                            proceed_clear_for_domain_mismatch = False
-
-                # No bundle selected by bundle list view                 
-                elif not user_selected_bundle:
-                    
-                    # Clear version, info, comments and bundle model
-                    # nothing to show if domain is not register
-                    if domain not in self.registered_domains:
-                        self.version_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                        self.bundle_model.clear()
-
-                    if bundle_entity['domain'] != domain and \
-                        not self.filter_bundle_lineedit.text() and \
-                        self.project_combo_box.currentText() == project and \
-                        not self.filter_context_cbx.currentText() and \
-                        proceed1:
-                            self.version_model.clear()
-                            self.add_comments_and_infos(clear=True)
-                            self.bundle_model.clear()
-                    
-                    if bundle_entity['domain'] != domain and \
-                        self.filter_bundle_lineedit.text() and \
-                        not self.filter_context_cbx.currentText() and \
-                        proceed1:
-                            self.version_model.clear()
-                            self.add_comments_and_infos(clear=True)
-                            self.bundle_model.clear()
-                    
-                    if self.filter_context_cbx.currentText() == bundle_entity['context'] and \
-                        bundle_entity['domain'] == domain and \
-                        (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                        self.project_combo_box.currentText() == project) and \
-                        not self.filter_bundle_lineedit.text():
-                            filtered_bundles.append(
-                                bundle_entity['bundle_name']
-                            )
-                            filtered_bundles = sorted(
-                                    set(filtered_bundles), key=filtered_bundles.index
-                            )
-                            filtered_domains.append(bundle_entity['domain'])
-                            filtered_domains = sorted(
-                                    set(filtered_domains), key=filtered_domains.index
-                            )
-                            if bundle_entity['context'] == self.filter_context_cbx.currentText():
-                                contexts_of_domains.add(bundle_entity['context'])
-                            self.append_items_to_list_view(self.bundle_model, 
-                                                    self.bundle_list, 
-                                                    filtered_bundles)
-                            self.append_items_to_list_view(self.domain_model, 
-                                                self.domain_list, 
-                                                filtered_domains)
-                            self.version_model.clear()
-                            self.add_comments_and_infos(clear=True)
-                            proceed = False
-                            pass 
-                        
-                    if self.filter_context_cbx.currentText() == bundle_entity['context'] and \
-                        bundle_entity['domain'] == domain and \
-                        (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                        self.project_combo_box.currentText() == project) and \
-                        self.filter_bundle_lineedit.text():
-                        for filtered_bundled_name in filtered_bundled_names1:
-                            if filtered_bundled_name == bundle_entity['bundle_name']:
-                                contexts_of_domains.add(bundle_entity['context'])
-
-                                filtered_bundles.append(
-                                        bundle_entity['bundle_name']
-                                )
-                                filtered_bundles = sorted(
-                                        set(filtered_bundles), key=filtered_bundles.index
-                                )
-                                filtered_domains.append(bundle_entity['domain'])
-                                filtered_domains = sorted(
-                                        set(filtered_domains), key=filtered_domains.index
-                                )
-                                if bundle_entity['context'] == self.filter_context_cbx.currentText():
-                                    contexts_of_domains.add(bundle_entity['context'])
-                                self.append_items_to_list_view(self.bundle_model, 
-                                                        self.bundle_list, 
-                                                        filtered_bundles)
-                                self.append_items_to_list_view(self.domain_model, 
-                                                    self.domain_list, 
-                                                    filtered_domains)
-                                self.version_model.clear()
-                                self.add_comments_and_infos(clear=True)
-                                proceed = False
-                            
-                    elif self.filter_context_cbx.currentText() == bundle_entity['context'] and \
-                        (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                        self.project_combo_box.currentText() == project) and \
-                        proceed: 
-                        self.bundle_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                      
-                elif user_selected_bundle and \
-                    bundle_entity['bundle_name'] == user_selected_bundle and \
-                    bundle_entity['context'] == self.filter_context_cbx.currentText() and \
-                    bundle_entity['domain'] == domain:
-                        filtered_version.append(
-                             {bundle_entity['version']: bundle_entity}   
-                        )
-                        filtered_domains.append(bundle_entity['domain'])
-                        filtered_domains = sorted(
-                                set(filtered_domains), key=filtered_domains.index
-                        )
-                        contexts_of_domains.add(bundle_entity['context'])
-                        self.append_items_to_list_view(self.version_model, 
-                                            self.version_list, 
-                                            filtered_version,
-                                            metadata=True)
-                        self.append_items_to_list_view(self.domain_model, 
-                                                self.domain_list, 
-                                                filtered_domains)
-                        self.add_comments_and_infos(bundle_name=user_selected_bundle,
-                                                    domain=domain,
-                                                    context=self.filter_context_cbx.currentText())
-                        proceed_clear_for_domain_mismatch = False
-                        
-                        
-                elif user_selected_bundle and \
-                    self.filter_domain_cbx.currentText() != bundle_entity['domain'] and \
-                    (self.filter_context_cbx.currentText() !=  bundle_entity['context'] or \
-                    not self.filter_context_cbx.currentText()) and \
-                    proceed_clear_for_domain_mismatch:
-                        self.add_comments_and_infos(clear=True)
-                    
-                if not user_selected_bundle and \
-                    bundle_entity['bundle_name'] == user_selected_bundle and \
-                    self.filter_domain_cbx.currentText() == bundle_entity['domain']:
-                    filtered_domains.append(bundle_entity['domain'])
-                    filtered_domains = sorted(
-                            set(filtered_domains), key=filtered_domains.index
-                    )
-                    self.append_items_to_list_view(self.domain_model, 
-                                            self.domain_list, 
-                                            filtered_domains)
-
-                # User not selected any bundle, domain not exist in bundle entity
-                # contex not exist in bundle entity then clear version, info.
-                # comments and bundles    
-                if proceed:  
-                    if not user_selected_bundle and \
-                        domain not in bundle_entity['domain'] and \
-                        self.filter_context_cbx.currentText() not in bundle_entity['context']:
-                            self.version_model.clear()
-                            self.add_comments_and_infos(clear=True)
-                            self.bundle_model.clear()
-
-            if not user_selected_bundle and \
-                not self.filter_bundle_lineedit.text() and \
-                not self.filter_context_cbx.currentText() and \
-                not self.filter_domain_cbx.currentText():
-                contexts_of_domains = sorted(set(self.contexts), 
-                                            key = self.contexts.index)
-                self.append_items_to_list_view(self.context_model, 
-                                                self.context_list, 
-                                                contexts_of_domains)  
-                        
-            if self.bundle_list.currentIndex().data():
-                self.append_items_to_list_view(self.version_model, 
-                                        self.version_list, 
-                                        filtered_version,
-                                        metadata=True)
-
-            self.append_items_to_list_view(self.context_model, 
-                                    self.context_list, 
-                                    contexts_of_domains)
-        self.bundle_type_label.setText('')
-                
+        self.filter_versions()
+    
     def filter_version_on_context_by_domain(self, 
                                             context: str) -> None:
-        """Method do several filtering operations.
-        Update all the widgets based upon the context 
-        filter
+        """
+        Filter bundle, domain, version, info, comments upon selecting
+        the context selection. Works in combination with the project,
+        search box text, domain filter and the selected bundle.
 
         Args:
             context (str): context keyword paramater
                             vop, sop, dop or rop etc
         """
         
-        context_versions = []
-        filtered_context = set()
-        filtered_bundles = []
-        filtered_domains = []
-        proceed_clear = True
+        self.filter_versions()
+    
+    def filter_versions(self) -> None:
+        
+        """
+        Update all the widgets for the current project, search box text,
+        domain and context filters. Every combination answered by 
+        intersecting the version index postings.
+        
+        1.  No bundle selected. The bundles having a version matching 
+            the filters listed, versions, info and comments were left 
+            empty for user to choose a bundle.
+        2.  Bundle selected. The versions of the bundle matching the 
+            filters listed with their info and comments.
+        
+        Example:
+            'Magical' domain and 'sop' context chosen. Bundle list shows
+            only the bundles published under Magical/sop, the domain and
+            context lists show Magical and sop.
+        """
+        
+        if self.defer_while_busy(self.filter_versions):
+            return
+        self.load_all_entities()
+        facets = {}
+        project_name = self.project_combo_box.currentText()
+        if project_name and project_name != ALL_PROJECTS_KEY:
+            facets['project'] = project_name
+        if self.filter_domain_cbx.currentText():
+            facets['domain'] = self.filter_domain_cbx.currentText()
+        if self.filter_context_cbx.currentText():
+            facets['context'] = self.filter_context_cbx.currentText()
+        
+        bundle_names = None
         user_selected_bundle = self.bundle_list.currentIndex().data()
-        user_selected_domain = self.filter_domain_cbx.currentText()
-        user_selected_project = self.project_combo_box.currentText()
+        if user_selected_bundle:
+            facets['bundle'] = user_selected_bundle
+        elif self.filter_bundle_lineedit.text():
+            bundle_names = self.matching_bundle_names(self.filter_bundle_lineedit.text())
+        bundle_entities = self.lookup_entities(bundle_names, **facets)
         
-        # If user not selected any bundle initially it loads the 
-        # projects based bundles based upon the project choosen
-        if not user_selected_bundle:
-            self.filter_bundle_to_selected_project(
-                        self.project_combo_box.currentText(),
-                        update_all = False
-            )
-        # Get the user entered text in the bundle search text box.
-        # if any matching text exist with bundle list view items save it 
-        # in a set.
-        # 
-        # Reteive the bundle list model 
-        model = self.bundle_model
-        # Find qstandard items matching with the search text box 
-        items = model.findItems(self.filter_bundle_lineedit.text(), 
-                                flags=Qt.MatchContains)
-        # For each qstandard item aquire the text and save it in set
-        filtered_bundled_names1 = set()
-        for index in items:
-            filtered_bundled_names1.add(index.text())
-            
-        for _, bundle_entities in self.all_bundle_info_entities.items():
-            for bundle_entity in bundle_entities:
-                if bundle_entity['context'] == context and \
-                        not self.filter_bundle_lineedit.text():
-                    if bundle_entity['bundle_name'] == user_selected_bundle and \
-                        bundle_entity['domain'] == user_selected_domain:
-                            self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                    domain=user_selected_domain,
-                                                    context=context)
-                            filtered_context.add(
-                                    bundle_entity['context']
-                            )
-                            context_versions.append(
-                                    {bundle_entity['version']: bundle_entity}
-                            )
-                            
-                    elif bundle_entity['context'] == context and \
-                        not user_selected_bundle and not user_selected_domain and \
-                        (user_selected_project == ALL_PROJECTS_KEY or \
-                        user_selected_project == bundle_entity['project_name']) and \
-                        not self.filter_bundle_lineedit.text():
-                        filtered_bundles.append(
-                                bundle_entity['bundle_name']
-                        )
-                        filtered_bundles = sorted(
-                                set(filtered_bundles), key=filtered_bundles.index
-                        )
-                        filtered_context.add(
-                                    bundle_entity['context']
-                        )
-                        filtered_domains.append(
-                            bundle_entity['domain']
-                        )
-                        filtered_domains = sorted(
-                                set(filtered_domains), key=filtered_domains.index
-                        )
-                        self.append_items_to_list_view(self.bundle_model, 
-                                                self.bundle_list, 
-                                                filtered_bundles)
-                        self.append_items_to_list_view(self.domain_model, 
-                                                self.domain_list, 
-                                                filtered_domains)
-                        self.version_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                        proceed_clear = False
-                        
-                            
-                elif bundle_entity['context'] == context and \
-                    not user_selected_bundle and not user_selected_domain and \
-                    (user_selected_project == bundle_entity['project_name'] or \
-                    user_selected_project == ALL_PROJECTS_KEY) and \
-                    self.filter_bundle_lineedit.text():
-                    for filtered_bundled_name in filtered_bundled_names1:
-                        if filtered_bundled_name == bundle_entity['bundle_name']:
-                            filtered_context.add(bundle_entity['context'])
-                            filtered_bundles.append(
-                                        bundle_entity['bundle_name']
-                            )
-                            filtered_bundles = sorted(
-                                    set(filtered_bundles), key=filtered_bundles.index
-                            )
-                            filtered_context.add(
-                                        bundle_entity['context']
-                            )
-                            filtered_domains.append(
-                                bundle_entity['domain']
-                            )
-                            filtered_domains = sorted(
-                                    set(filtered_domains), key=filtered_domains.index
-                            )
-                            self.append_items_to_list_view(self.bundle_model, 
-                                                    self.bundle_list, 
-                                                    filtered_bundles)
-                            self.append_items_to_list_view(self.domain_model, 
-                                                    self.domain_list, 
-                                                    filtered_domains)
-                            self.version_model.clear()
-                            self.add_comments_and_infos(clear=True)
-                            proceed_clear = False
-                
-                elif bundle_entity['context'] != context and \
-                        not user_selected_bundle and not user_selected_domain and \
-                        (user_selected_project == ALL_PROJECTS_KEY or \
-                        user_selected_project == bundle_entity['project_name']):
-                    if proceed_clear:
-                        self.bundle_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                        self.domain_model.clear()
-                          
-                elif not self.bundle_list.currentIndex().data() and \
-                        bundle_entity['context'] != context and \
-                        (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                        self.project_combo_box.currentText() == bundle_entity['project_name']) and \
-                        not user_selected_bundle:
-                        self.bundle_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                
-                elif self.filter_domain_cbx.currentText() and \
-                    bundle_entity['domain'] != user_selected_domain and \
-                    not user_selected_bundle:
-                    self.bundle_model.clear()
-                    self.domain_model.clear()
-
-                else:
-                    if proceed_clear:
-                        self.version_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                
-        self.append_items_to_list_view(self.version_model, 
-                                self.version_list, 
-                                context_versions,
-                                metadata=True)
+        # Domains and contexts in the order of the matched versions
+        self.append_items_to_list_view(self.domain_model, 
+                                self.domain_list, 
+                                list(dict.fromkeys(bundle_entity['domain'] 
+                                                   for bundle_entity in bundle_entities)))
         self.append_items_to_list_view(self.context_model, 
-                                    self.context_list, 
-                                    filtered_context)
-        self.bundle_type_label.setText('')               
-        pass
+                                self.context_list, 
+                                list(dict.fromkeys(bundle_entity['context'] 
+                                                   for bundle_entity in bundle_entities)))
+        if user_selected_bundle:
+            self.append_items_to_list_view(self.version_model, 
+                                    self.version_list, 
+                                    [{bundle_entity['version']: bundle_entity}
+                                     for bundle_entity in bundle_entities],
+                                    metadata=True)
+            self.render_comments_and_infos(bundle_entities)
+        else:
+            self.append_items_to_list_view(self.bundle_model, 
+                                    self.bundle_list, 
+                                    list(dict.fromkeys(bundle_entity['bundle_name'] 
+                                                       for bundle_entity in bundle_entities)))
+            self.version_model.clear()
+            self.render_comments_and_infos([])
+        self.bundle_type_label.setText('')
+    
+    def build_version_index(self) -> None:
+        
+        """
+        Index every loaded bundle entity by project, domain, context
+        and bundle name. The record id is the position of the entity
+        in version_records, so sorted ids keep the catalog order.
+        The bundle names trigram indexed for the search box.
+        """
+        
+        self.version_index = FacetIndex()
+        self.bundle_name_index = TrigramIndex()
+        self.version_records = []
+        for project, bundle_entities in self.all_bundle_info_entities.items():
+            for bundle_entity in bundle_entities:
+                self.version_index.add(len(self.version_records),
+                                       project=project,
+                                       domain=bundle_entity['domain'],
+                                       context=bundle_entity['context'],
+                                       bundle=bundle_entity['bundle_name'])
+                self.bundle_name_index.add(bundle_entity['bundle_name'], 
+                                           bundle_entity['bundle_name'])
+                self.version_records.append(bundle_entity)
+        self.version_index_dirty = False
+        self.search_matches = None
     
-    def filter_version_on_context_of_all_domain(self, context: str) -> None:
+    def lookup_entities(self, 
+                        bundle_names: set = None,
+                        **facets) -> list:
+        """
+        Bundle entities matching every given facet. The index rebuilt
+        first if the loaded entities changed.
+
+        Args:
+            bundle_names (set, optional): Only the entities of these bundles. 
+                                        Defaults to None for any bundle.
+            facets (str): project, domain, context or bundle values
 
-        """Works same as filter_version_on_context_by_domain.
-        Domain filter and othe filter factors seperated as 
-        into this method.
+        Returns:
+            list: matching bundle entities in catalog order
+        """
+        
+        if self.version_index_dirty:
+            self.build_version_index()
+        record_ids = self.version_index.lookup(**facets)
+        if bundle_names is not None:
+            record_ids &= self.version_index.union('bundle', bundle_names)
+        return [self.version_records[record_id] for record_id in sorted(record_ids)]
+    
+    def matching_bundle_names(self, 
+                              text: str) -> set:
+        """Bundle names matching the search box text, a case 
+        sensitive regex as bundle_search_pattern()
 
         Args:
-            context (str): Context name passed by the user selection
+            text (str): search box text
+
+        Returns:
+            set: matching bundle names, none for an invalid regex
         """
         
-        versions = []
-        filtered_context = set()
-        filtered_bundles = []
-        filtered_domains = []
-        proceed = True
-        for project, bundle_entities in self.all_bundle_info_entities.items():
-            for bundle_entity in bundle_entities:
-                if bundle_entity['context'] == context: 
-                    if not self.filter_domain_cbx.currentText():
-                        if bundle_entity['bundle_name'] == self.bundle_list.currentIndex().data():
-                            filtered_context.add(bundle_entity['context'])
-                            versions.append(
-                                    {bundle_entity['version']: bundle_entity}
-                            )
-                            self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                        context=context)
-                            
-                    elif not self.bundle_list.currentIndex().data() and \
-                            bundle_entity['domain'] == self.filter_domain_cbx.currentText() and \
-                            bundle_entity['context'] == context and \
-                            (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                            self.project_combo_box.currentText() == project) and \
-                            self.filter_bundle_lineedit.text() in bundle_entity['bundle_name']:
-                        filtered_context.add(bundle_entity['context'])
-                        filtered_bundles.append(
-                            bundle_entity['bundle_name']
-                        )
-                        filtered_bundles = sorted(
-                                set(filtered_bundles), key=filtered_bundles.index
-                        )
-                        filtered_domains.append(
-                            bundle_entity['domain']
-                        )
-                        filtered_domains = sorted(
-                                set(filtered_domains), key=filtered_domains.index
-                        )
-                        self.append_items_to_list_view(self.bundle_model, 
-                                                self.bundle_list, 
-                                                filtered_bundles)
-                        self.append_items_to_list_view(self.domain_model, 
-                                                self.domain_list, 
-                                                filtered_domains)
-                        self.version_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                        proceed = False
-                          
-                    elif self.filter_domain_cbx.currentText():
-                        if bundle_entity['bundle_name'] == self.bundle_list.currentIndex().data() and \
-                            bundle_entity['context'] == context and \
-                            bundle_entity['domain'] == self.filter_domain_cbx.currentText():
-                                filtered_context.add(bundle_entity['context'])
-                                self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'],
-                                                    domain=self.filter_domain_cbx.currentText(),
-                                                    context=self.filter_context_cbx.currentText())
-                                versions.append(
-                                    {bundle_entity['version']: bundle_entity}
-                                )
-                                
-                elif not self.bundle_list.currentIndex().data() and \
-                    bundle_entity['domain'] == self.filter_domain_cbx.currentText() and \
-                    bundle_entity['context'] != context and \
-                    (self.project_combo_box.currentText() == ALL_PROJECTS_KEY or \
-                    self.project_combo_box.currentText() == project) and \
-                    proceed:
-                        self.bundle_model.clear()
-                        self.add_comments_and_infos(clear=True)
-                                
-           
-        if self.bundle_list.currentIndex().data():
-            self.append_items_to_list_view(self.version_model, 
-                                    self.version_list, 
-                                    versions,
-                                    metadata=True)
-        if filtered_context:
-            self.append_items_to_list_view(self.context_model, 
-                                        self.context_list, 
-                                        filtered_context)
+        if self.version_index_dirty:
+            self.build_version_index()
+        pattern = bundle_search_pattern(text)
+        if not pattern.isValid():
+            self.search_matches = None
+            return set()
+        
+        # A plain text extending the last plain text only narrows down
+        # its matches, any other plain text is a substring answered by
+        # the trigram index. Regex patterns, like 'fog|dust', checked
+        # name by name
+        plain_text = QRegExp.escape(text) == text
+        if plain_text and self.search_matches is not None and self.search_text in text:
+            matches = {bundle_name for bundle_name in self.search_matches
+                       if text in bundle_name}
+        elif plain_text:
+            matches = self.bundle_name_index.search(text)
+        else:
+            matches = {bundle_name for bundle_name in self.bundle_name_index.texts
+                       if pattern.indexIn(bundle_name) != -1}
+        self.search_text = text
+        self.search_matches = matches if plain_text else None
+        return matches
+    
+    def apply_bundle_search(self) -> None:
+        
+        """
+        Debounced search box handler. Filter the bundle list and the
+        related widgets to the search box text. Runs over the loaded 
+        catalog in memory, no file read while typing. Deferred while
+        a worker owns the templates model.
+        """
+        
+        self.filter_bundle_to_selected_project(
+                    self.project_combo_box.currentText()
+        )
+    
+    def loaded_projects(self) -> set:
+        
+        """Projects having a loaded bundle entity
+
+        Returns:
+            set: project names
+        """
+        
+        if self.version_index_dirty:
+            self.build_version_index()
+        return self.version_index.values('project')
 
     def filter_bundle_to_selected_project(self, 
                                           project_name: str,
@@ -1284,34 +2158,27 @@ class Importer(QtWidgets.QWidget):
             update_all (bool, optional): version, info, comments update status
                                         if passed true then it updated. Defaults to True.
         """
+        if self.defer_while_busy(partial(self.filter_bundle_to_selected_project,
+                                         project_name, update_all)):
+            return
         # Get search box text  
         filter_input_text= self.filter_bundle_lineedit.text()
+        
+        # Lazy mode fetch only the versions of the selected project
+        # the search looks over every project
+        if filter_input_text:
+            self.load_all_entities()
+        elif project_name != ALL_PROJECTS_KEY:
+            self.load_bundle_entities(project_name=project_name)
 
         # All project selection and no search box text input
-        # collect all bundles. Collected with various combination
+        # collect all bundles. Collected with various combination.
+        # With search box text the bundles were looked up in the
+        # index below
+        bundles = set()
         if project_name == ALL_PROJECTS_KEY and \
                 not filter_input_text:
              bundles = self.templates.get_all_bundles()
-
-        # project name is 'all' and search box input is exist
-        # get all the project names matching with the text
-        elif project_name == ALL_PROJECTS_KEY and \
-                filter_input_text:
-            # serach box text sended as filter input text
-            bundles = self.templates.get_all_bundles(all_mode=True,
-                                                     matching_text=filter_input_text)
-        
-        # given project name is match with project combobox text and 
-        # filter text exist, then collect only the bundles registered
-        # for that project
-        elif project_name == self.project_combo_box.currentText() and \
-                    filter_input_text:
-            # all_mode set false to not retrive all projects
-            bundles = self.templates.get_all_bundles(
-                project_name=project_name, 
-                all_mode=False, 
-                matching_text=filter_input_text
-            )  
             
         elif not filter_input_text:
 
@@ -1327,16 +2194,16 @@ class Importer(QtWidgets.QWidget):
         available_projects = set()
         available_projects.add(ALL_PROJECTS_KEY)
         versions = []
+        available_projects |= self.loaded_projects()
         if project_name != ALL_PROJECTS_KEY and not \
                     filter_input_text:
-            for project, bundle_entities in self.all_bundle_info_entities.items():
-                available_projects.add(project)
-                for bundle_entity in bundle_entities:
-                    if project == project_name:
-                        domains.add(bundle_entity['domain'])
-                        contexts.add(bundle_entity['context'])
-                        versions.append({bundle_entity['version']: bundle_entity})
-                        self.add_comments_and_infos(project_name=project)
+            bundle_entities = self.lookup_entities(project=project_name)
+            for bundle_entity in bundle_entities:
+                domains.add(bundle_entity['domain'])
+                contexts.add(bundle_entity['context'])
+                versions.append({bundle_entity['version']: bundle_entity})
+            if versions:
+                self.render_comments_and_infos(bundle_entities)
                     
         # no search text and 'all' project selected 
         # assign default bundle, context, domain and versions
@@ -1355,45 +2222,36 @@ class Importer(QtWidgets.QWidget):
         # also updated            
         elif filter_input_text:
             bundles = set()
-            model = self.bundle_model
-            self.append_items_to_list_view(self.bundle_model, 
-                                self.bundle_list, 
-                                self.bundles)
-            items = model.findItems(filter_input_text, flags=Qt.MatchContains)
-            filtered_bundled_names = set()
-            for index in items:
-                filtered_bundled_names.add(index.text())
-
-            for filtered_bundled_name in filtered_bundled_names:
-                for project, bundle_entities in self.all_bundle_info_entities.items():
-                    available_projects.add(project)
-                    for bundle_entity in bundle_entities:
-                        if filtered_bundled_name == bundle_entity['bundle_name']:
-                            
-                            def add_entities():
-                                bundles.add(bundle_entity['bundle_name'])
-                                domains.add(bundle_entity['domain'])
-                                contexts.add(bundle_entity['context'])
-                                versions.append(
-                                    {bundle_entity['version']: bundle_entity}
-                                )
-                                self.add_comments_and_infos(bundle_list=bundles,
-                                                        multi_bundle_append=True)
-                            if project == self.project_combo_box.currentText():
-                                add_entities()
-
-                            if ALL_PROJECTS_KEY == self.project_combo_box.currentText():
-                                add_entities()
-                                
-            if not bundles:
-                self.add_comments_and_infos(clear=True)
+            facets = {}
+            if self.project_combo_box.currentText() != ALL_PROJECTS_KEY:
+                facets['project'] = self.project_combo_box.currentText()
+            bundle_entities = self.lookup_entities(
+                        self.matching_bundle_names(filter_input_text),
+                        **facets
+            )
+            for bundle_entity in bundle_entities:
+                bundles.add(bundle_entity['bundle_name'])
+                domains.add(bundle_entity['domain'])
+                contexts.add(bundle_entity['context'])
+                versions.append(
+                    {bundle_entity['version']: bundle_entity}
+                )
+            self.render_comments_and_infos(bundle_entities)
 
         if self.project_combo_box.currentText() not in available_projects:
             self.add_comments_and_infos(clear=True)   
         
-        self.append_items_to_list_view(self.bundle_model, 
-                                self.bundle_list, 
-                                bundles)
+        # Search text only narrows the bundles of the project 
+        # through the proxy, the bundle model refilled on a 
+        # project change only
+        if filter_input_text:
+            if self.bundle_model_project != self.project_combo_box.currentText():
+                self.load_bundles()
+            self.bundle_filter_proxy.set_matches(bundles)
+        else:
+            self.append_items_to_list_view(self.bundle_model, 
+                                    self.bundle_list, 
+                                    bundles)
 
         # Ensure the context, domain, version, info, comments 
         # widgets wont updated
@@ -1435,7 +2293,9 @@ class Importer(QtWidgets.QWidget):
                                multi_bundle_append: bool = False) -> None:
         """
         Info and comments from bundle entities registered into 
-        info line edit and comments line edit widgets.
+        info line edit and comments line edit widgets. The matching
+        entities collected in a single pass and each widget filled
+        with one setPlainText.
         These widgets Updated with different combinations. 
         In dashboard mode this method retrive all the bundles infos 
         load the addtional infos in the info line edit widget and
@@ -1463,25 +2323,13 @@ class Importer(QtWidgets.QWidget):
         """
         
         
+        # Matched entities collected in one pass, rendered at the end
+        matched_entities = []
         def fill_widgets():
 
-            """
-            Create a textual representation for the info and 
-            comments widgets which is retrived from the bundle 
-            entity. 
-            """
-            self.comments_textedit.append(bundle_entity['comments'])
-            self.comments_textedit.append("-"*75)
-            for key, value in bundle_entity.items():
-                if key != 'bundle_name' and key != 'bundle_type' and \
-                    key != 'comments' and key != 'module_path' and \
-                    key != 'config_path' and key != 'project_name':
-                    self.info_textedit.append(f"{key}:  {value}")
-            self.info_textedit.append("-"*60)
-
-        # For each time the widgets cleared while user actions changed
-        self.info_textedit.clear()
-        self.comments_textedit.clear()
+            """Collect the bundle entity to render"""
+            matched_entities.append(bundle_entity)
+
         for project, bundle_entities in self.all_bundle_info_entities.items():
             for bundle_entity in bundle_entities:
                 if project_name and not version and not bundle_name and \
@@ -1573,11 +2421,37 @@ class Importer(QtWidgets.QWidget):
                             fill_widgets()
                         
                 elif clear:
-                    self.info_textedit.clear()
+                    pass
                     
                 else:
                     fill_widgets()
 
+        self.render_comments_and_infos(matched_entities)
+    
+    def render_comments_and_infos(self, 
+                                  bundle_entities: list) -> None:
+        """
+        Fill the comments and info widgets with the given bundle 
+        entities. One setPlainText per widget. Beyond 
+        MAX_RENDERED_ENTITIES only a count of the remaining versions shown
+
+        Args:
+            bundle_entities (list): bundle entities to show
+        """
+        
+        comments = []
+        infos = []
+        for bundle_entity in bundle_entities[:MAX_RENDERED_ENTITIES]:
+            comments_fragment, infos_fragment = self.render_entity_fragments(bundle_entity)
+            comments.append(comments_fragment)
+            infos.append(infos_fragment)
+        if len(bundle_entities) > MAX_RENDERED_ENTITIES:
+            remaining = f"... {len(bundle_entities) - MAX_RENDERED_ENTITIES} more versions"
+            comments.append(remaining)
+            infos.append(remaining)
+        self.comments_textedit.setPlainText("\n".join(comments))
+        self.info_textedit.setPlainText("\n".join(infos))
+
         # Preserve the scroll bar position into starting point of the
         # line wdit widget. The line edit scroll always goes to bottome
         # after added huge text. Below line ensures always the 
@@ -1590,6 +2464,32 @@ class Importer(QtWidgets.QWidget):
         comments_textedit_cursor.movePosition(comments_textedit_cursor.Start)
         self.comments_textedit.setTextCursor(comments_textedit_cursor)
     
+    def render_entity_fragments(self, 
+                                bundle_entity: BundleVersion) -> tuple:
+        """
+        Textual representation of a bundle entity for the comments 
+        and info widgets. Fragments cached per bundle version, 
+        rendered once until the next reload.
+
+        Args:
+            bundle_entity (BundleVersion): bundle entity of a version
+
+        Returns:
+            tuple: comments text, info text
+        """
+        
+        cache_key = (bundle_entity['config_path'], bundle_entity['version'])
+        fragments = self.rendered_fragments.get(cache_key)
+        if fragments is None:
+            comments_fragment = f"{bundle_entity['comments']}\n{'-'*75}"
+            infos_fragment = "\n".join(
+                [f"{key}:  {value}" for key, value in bundle_entity.items()
+                 if key not in HIDDEN_INFO_KEYS] + ["-"*60]
+            )
+            fragments = self.rendered_fragments[cache_key] = (comments_fragment,
+                                                              infos_fragment)
+        return fragments
+    
     def action_menus(self, position) -> None:
         
         """Version list view enabled with right-click action menus
@@ -1597,10 +2497,9 @@ class Importer(QtWidgets.QWidget):
         in the version list view
         """
 
-        # Get postion of the version list view 
-        mdlIdx = self.version_list.indexAt(position)
-        # retrive item
-        item = self.version_model.itemFromIndex(mdlIdx)
+        # Get postion of the version list view, the index
+        # of the item at the position
+        item = self.version_list.indexAt(position)
         # Create the menu of rigth click
         right_click_menu = QtWidgets.QMenu()
         
@@ -1611,7 +2510,9 @@ class Importer(QtWidgets.QWidget):
         act_add.triggered.connect(
                     lambda: self.remove_bundle(item)
         )
-        if self.bundle_list.currentIndex().data():
+        # The catalog owned by the worker thread while loading
+        if self.bundle_list.currentIndex().data() and \
+            not self.catalog_busy():
             right_click_menu.exec_(self.sender().viewport().mapToGlobal(position))
     
     def remove_bundle(self, item: QModelIndex) -> None:
@@ -1629,34 +2530,7 @@ class Importer(QtWidgets.QWidget):
         
         items = item.data(Qt.UserRole)
         if items['user_name'] == os.environ['USERNAME']:
-            clear_listview_enitities = self.templates.remove_bundle(items)
-
-            if clear_listview_enitities:
-                self.add_comments_and_infos(clear=True)
-                self.version_model.clear()
-                self.domain_model.clear()
-                self.context_model.clear()
-            else:
-
-                project_versions = []
-                selected_bundle = self.bundle_list.currentIndex().data()
-                
-                self.all_bundle_info_entities = self.templates.list_all_bundle_entity()
-                if selected_bundle:
-                    for _, bundle_entities in self.all_bundle_info_entities.items():
-                        for bundle_entity in bundle_entities:
-                            if bundle_entity['bundle_name'] == selected_bundle:
-                                project_versions.append(
-                                            {bundle_entity['version']: bundle_entity}
-                                )
-                                self.add_comments_and_infos(bundle_name=bundle_entity['bundle_name'])
-                          
-                self.append_items_to_list_view(self.version_model, 
-                                        self.version_list, 
-                                        project_versions,
-                                        metadata=True)
-
-            self.load_bundles()
+            self.start_removal(items)
         else:
             msg = f"The Bundle <b>{items['bundle_name']}</b> "
             msg +=f"created by <b>{items['user_name']}</b> "
@@ -1666,6 +2540,86 @@ class Importer(QtWidgets.QWidget):
             user_warning_msgbox.show_message()
 
     
+    def start_removal(self, 
+                      items: BundleVersion) -> None:
+        """
+        Remove the version in a RemoveFilesTask thread. The views 
+        updated by bundle_removed once the catalog updated, the actions
+        reading the templates model deferred meanwhile.
+
+        Args:
+            items (BundleVersion): bundle entity of the version
+        """
+        
+        if self.defer_while_busy(partial(self.start_removal, items)):
+            return
+        self.catalog_working = True
+        remove_files_task = RemoveFilesTask(self.templates, items, parent=self)
+        remove_files_task.removed.connect(self.bundle_removed)
+        remove_files_task.failed.connect(self.bundle_removal_failed)
+        remove_files_task.finished.connect(remove_files_task.deleteLater)
+        remove_files_task.start()
+    
+    def bundle_removed(self, 
+                       items: BundleVersion,
+                       clear_listview_enitities: bool) -> None:
+        """
+        Drop the removed entities and rows in place once the 
+        RemoveFilesTask updated the catalog, no catalog reload
+
+        Args:
+            items (BundleVersion): bundle entity of the removed version
+            clear_listview_enitities (bool): True if the entire bundle removed
+        """
+        
+        self.catalog_working = False
+        for project, bundle_entities in self.all_bundle_info_entities.items():
+            self.all_bundle_info_entities[project] = [
+                bundle_entity for bundle_entity in bundle_entities
+                if bundle_entity['config_path'] != items['config_path'] or
+                (not clear_listview_enitities and 
+                 bundle_entity['version'] != items['version'])
+            ]
+        self.version_index_dirty = True
+        # Version numbers freed by the removal may be published again
+        self.rendered_fragments = {
+            cache_key: fragments 
+            for cache_key, fragments in self.rendered_fragments.items()
+            if cache_key[0] != items['config_path']
+        }
+
+        if clear_listview_enitities:
+            self.add_comments_and_infos(clear=True)
+            self.version_model.clear()
+            self.domain_model.clear()
+            self.context_model.clear()
+            self.load_bundles()
+        else:
+            for row, record in enumerate(self.version_model.records):
+                if record is items:
+                    self.version_model.remove_row(row)
+                    break
+            self.listed_versions = [version for version in self.listed_versions
+                                    if version[1] is not items]
+            selected_bundle = self.bundle_list.currentIndex().data()
+            if selected_bundle:
+                self.add_comments_and_infos(bundle_name=selected_bundle)
+        self.release_catalog()
+    
+    def bundle_removal_failed(self, 
+                              message: str) -> None:
+        """Warn about a removal the RemoveFilesTask could not do, 
+        nothing removed
+
+        Args:
+            message (str): error message
+        """
+        
+        self.release_catalog()
+        user_warning_msgbox = utilMessageBox('warning', 
+                                             f"Remove failed!!\n{message}")
+        user_warning_msgbox.show_message()
+    
     def apply_bundle_buton_type(self, 
                                 index: QModelIndex) -> None:
         """
@@ -1693,7 +2647,7 @@ class Importer(QtWidgets.QWidget):
     
     def filter_items(self, 
                     listview: QtWidgets.QListView , 
-                    model: QStandardItemModel, 
+                    model: CatalogListModel, 
                     text: str, 
                     listview_name: str, 
                     items: list=[]) -> None:
@@ -1705,21 +2659,26 @@ class Importer(QtWidgets.QWidget):
 
         Args:
             listview (QtWidgets.QListView): qt list view widget
-            model (QStandardItemModel): model of the list view
+            model (CatalogListModel): model of the list view
             text (str): text string for filtering 
             listview_name (str): List view widget name
             items (list, optional): items list. context or domain Defaults to [].
         """
         
         if text != ALL_PROJECTS_KEY:
-            self.bundle_list_filter_proxy = QSortFilterProxyModel()
-            self.bundle_list_filter_proxy.setObjectName(listview_name)
-            self.bundle_list_filter_proxy.setDynamicSortFilter(True)
-            self.bundle_list_filter_proxy.setRecursiveFilteringEnabled(True)
-            self.bundle_list_filter_proxy.setSourceModel(model)
-            listview.setModel(self.bundle_list_filter_proxy)
+            # One proxy per list view, created on the first filter 
+            list_filter_proxy = self.list_filter_proxies.get(listview_name)
+            if list_filter_proxy is None:
+                list_filter_proxy = QSortFilterProxyModel(self)
+                list_filter_proxy.setObjectName(listview_name)
+                list_filter_proxy.setDynamicSortFilter(True)
+                list_filter_proxy.setRecursiveFilteringEnabled(True)
+                list_filter_proxy.setSourceModel(model)
+                self.list_filter_proxies[listview_name] = list_filter_proxy
+            if listview.model() is not list_filter_proxy:
+                listview.setModel(list_filter_proxy)
             pattern = QRegExp(text, Qt.CaseSensitive, QRegExp.RegExp)
-            self.bundle_list_filter_proxy.setFilterRegExp(pattern)
+            list_filter_proxy.setFilterRegExp(pattern)
         else:
             self.append_items_to_list_view(model, listview, items=items)
         self.bundle_type_label.setText('')
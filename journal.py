@@ -0,0 +1,403 @@
+#
+# Append-only publish journal for template pilot. Every publish and
+# removal appends a compact json line to a journal file at the root of
+# the bundles. Clients remember the byte offset they read up to and
+# replay only the new lines, instead of scanning the tree again.
+# The journal compacted into a snapshot file once it grows big, and a
+# new epoch of the journal begins.
+# A generation stamp file next to the journal rewritten after every 
+# publish and removal. One stat of it tells a client whether anything
+# changed since its last sync.
+#
+import os
+import json
+import uuid
+from helpers import (FileOperations,
+                     ShareLock,
+                     json_loads,
+                     ROOT_TEMPLATE_PATH,
+                     JOURNAL_FILE,
+                     JOURNAL_SNAPSHOT_FILE,
+                     JOURNAL_COMPACT_SIZE,
+                     JOURNAL_LOCK_FILE,
+                     GENERATION_FILE)
+
+BUNDLE_RECORD = 'bundle'
+VERSION_RECORD = 'version'
+REMOVE_VERSION_RECORD = 'remove_version'
+REMOVE_BUNDLE_RECORD = 'remove_bundle'
+
+
+class PublishJournal(FileOperations):
+
+    """
+    Publish journal of the catalog. The first line of the journal
+    holds the epoch. Each following line is a record
+    of one publish or removal.
+
+    Example:
+        {"epoch": "5f0c..."}
+        {"op": "bundle", "config": {...config.json datas}}
+        {"op": "version", "config_path": "...", "info": {...info.json datas}}
+        {"op": "remove_version", "config_path": "...", "version": 2}
+        {"op": "remove_bundle", "config_path": "..."}
+    """
+
+    def __init__(self,
+                 root_path: str = ROOT_TEMPLATE_PATH) -> None:
+        """
+        Initialize the journal and the compacted snapshot paths
+
+        Args:
+            root_path (str, optional): Root folder of the published bundles.
+                                        Defaults to ROOT_TEMPLATE_PATH.
+        """
+
+        super().__init__()
+        self.root_path = root_path
+        self.journal_path = os.path.join(root_path, JOURNAL_FILE)
+        self.snapshot_path = os.path.join(root_path, JOURNAL_SNAPSHOT_FILE)
+
+    def lock(self) -> ShareLock:
+
+        """Lock serializing the appends and the compaction of
+        the journal across workstations
+
+        Returns:
+            ShareLock: lock of the journal
+        """
+
+        return ShareLock(os.path.join(self.root_path, JOURNAL_LOCK_FILE))
+
+    def exists(self) -> bool:
+
+        """Check the journal file exist in the root
+
+        Returns:
+            bool: True if the journal exist
+        """
+
+        return os.path.isfile(self.journal_path)
+
+    @staticmethod
+    def encode(record: dict) -> str:
+
+        """Encode a record as one compact json line
+
+        Args:
+            record (dict): journal record
+
+        Returns:
+            str: json line
+        """
+
+        return json.dumps(record, separators=(',', ':')) + '\n'
+
+    def start_epoch(self,
+                    epoch: str = '') -> str:
+        """
+        Begin a new empty journal with a fresh epoch header.
+        The journal replaced atomically.
+
+        Args:
+            epoch (str, optional): epoch id. Defaults to a new random id.
+
+        Returns:
+            str: epoch id of the journal
+        """
+
+        epoch = epoch or uuid.uuid4().hex
+        self.set_file_path(self.root_path)
+        self.replace_file_datas(JOURNAL_FILE, self.encode({'epoch': epoch}))
+        return epoch
+
+    def append(self,
+               record: dict) -> None:
+        """
+        Append a record at the end of the journal. The line written
+        with a single write call in append mode while holding the 
+        journal lock, appends of other workstations never interleave.
+
+        Args:
+            record (dict): journal record
+        """
+
+        with self.lock():
+            if not self.exists():
+                self.start_epoch()
+            with open(self.journal_path, 'a') as journal_file:
+                journal_file.write(self.encode(record))
+
+    def publish_bundle(self,
+                       config: dict) -> None:
+        """Journal a new bundle
+
+        Args:
+            config (dict): config.json datas of the bundle
+        """
+
+        self.append({'op': BUNDLE_RECORD, 'config': config})
+
+    def publish_version(self,
+                        config_path: str,
+                        info: dict) -> None:
+        """Journal a new version of the bundle
+
+        Args:
+            config_path (str): config path of the bundle
+            info (dict): info.json datas of the version
+        """
+
+        self.append({'op': VERSION_RECORD,
+                     'config_path': config_path,
+                     'info': info})
+
+    def remove_version(self,
+                       config_path: str,
+                       version: int) -> None:
+        """Journal a removed version of the bundle
+
+        Args:
+            config_path (str): config path of the bundle
+            version (int): numeric version number
+        """
+
+        self.append({'op': REMOVE_VERSION_RECORD,
+                     'config_path': config_path,
+                     'version': int(version)})
+
+    def remove_bundle(self,
+                      config_path: str) -> None:
+        """Journal a removed bundle
+
+        Args:
+            config_path (str): config path of the bundle
+        """
+
+        self.append({'op': REMOVE_BUNDLE_RECORD,
+                     'config_path': config_path})
+
+    def needs_compaction(self) -> bool:
+
+        """Check the journal outgrown the compaction size
+
+        Returns:
+            bool: True if the journal should be compacted
+        """
+
+        try:
+            return os.path.getsize(self.journal_path) > JOURNAL_COMPACT_SIZE
+        except OSError:
+            return False
+
+    @staticmethod
+    def apply(snapshot,
+              record: dict) -> None:
+        """
+        Apply a journal record to the catalog snapshot. Every record
+        is idempotent, replaying it twice gives the same snapshot.
+
+        Args:
+            snapshot (CatalogSnapshot): catalog snapshot to update
+            record (dict): journal record
+        """
+
+        operation = record.get('op')
+        if operation == BUNDLE_RECORD:
+            snapshot.add_bundle(record['config'])
+        elif operation == VERSION_RECORD:
+            snapshot.add_version(record['config_path'], record['info'])
+        elif operation == REMOVE_VERSION_RECORD:
+            snapshot.remove_version(record['config_path'], record['version'])
+        elif operation == REMOVE_BUNDLE_RECORD:
+            snapshot.remove_bundle(record['config_path'])
+
+    @staticmethod
+    def apply_to_index(catalog_index,
+                       records: list) -> None:
+        """
+        Apply the replayed journal records to the local catalog index
+        row by row, in one transaction. A sync costs the records 
+        replayed, not the size of the catalog.
+
+        Args:
+            catalog_index (CatalogIndex): local catalog index to update
+            records (list): journal records in journal order
+        """
+
+        with catalog_index.connection() as connection:
+            for record in records:
+                operation = record.get('op')
+                if operation == BUNDLE_RECORD:
+                    catalog_index.register_bundle(record['config'], connection)
+                elif operation == VERSION_RECORD:
+                    catalog_index.register_version(record['config_path'], 
+                                                   record['info'], connection)
+                elif operation == REMOVE_VERSION_RECORD:
+                    catalog_index.unregister_version(record['config_path'], 
+                                                     record['version'], connection)
+                elif operation == REMOVE_BUNDLE_RECORD:
+                    catalog_index.unregister_bundle(record['config_path'], connection)
+
+    def load_compacted_snapshot(self,
+                                snapshot,
+                                epoch: str) -> bool:
+        """
+        Replace the bundles and versions of the snapshot with the
+        compacted snapshot of the given epoch.
+
+        Args:
+            snapshot (CatalogSnapshot): catalog snapshot to replace
+            epoch (str): epoch of the journal
+
+        Returns:
+            bool: False if no compacted snapshot found for the epoch
+        """
+
+        if not os.path.isfile(self.snapshot_path):
+            return False
+        compacted = self.load_file_datas(self.snapshot_path)
+        if compacted.get('epoch') != epoch:
+            return False
+        snapshot.clear()
+        for config in compacted['bundles']:
+            snapshot.add_bundle(config)
+        for config_path, info in compacted['versions']:
+            snapshot.add_version(config_path, info)
+        return True
+
+    def replay(self,
+               snapshot,
+               epoch: str = '',
+               offset: int = 0) -> tuple:
+        """
+        Apply the journal records written after the given offset to the
+        snapshot. If the journal moved into a new epoch, the compacted
+        snapshot of that epoch is loaded first when found and the whole 
+        journal replayed.
+        Only complete lines were replayed, a line being appended by another
+        workstation is picked up next time.
+
+        Args:
+            snapshot (CatalogSnapshot): catalog snapshot to update
+            epoch (str, optional): epoch of the last replay. Defaults to ''.
+            offset (int, optional): byte offset of the last replay. Defaults to 0.
+
+        Returns:
+            tuple:  epoch,
+                    byte offset read up to,
+                    records applied,
+                    True if the compacted snapshot of the epoch loaded
+        """
+
+        if not self.exists():
+            return epoch, offset, [], False
+        compacted = False
+        with open(self.journal_path, 'rb') as journal_file:
+            header = journal_file.readline()
+            if not header.endswith(b'\n'):
+                return epoch, offset, [], False
+            journal_epoch = json_loads(header)['epoch']
+            if journal_epoch != epoch:
+                compacted = self.load_compacted_snapshot(snapshot, journal_epoch)
+                epoch = journal_epoch
+                offset = len(header)
+            journal_file.seek(offset)
+            datas = journal_file.read()
+
+        complete = datas[:datas.rfind(b'\n') + 1]
+        records = []
+        for line in complete.splitlines():
+            if line.strip():
+                record = json_loads(line)
+                self.apply(snapshot, record)
+                records.append(record)
+        return epoch, offset + len(complete), records, compacted
+
+    def compact(self,
+                snapshot) -> str:
+        """
+        Write the snapshot as the compacted snapshot of a new epoch
+        and start the journal of that epoch empty. The snapshot must be
+        up to date with the share and the current journal, and the
+        journal lock held so no append lands in between.
+
+        Args:
+            snapshot (CatalogSnapshot): up to date catalog snapshot
+
+        Returns:
+            str: epoch id of the new journal
+        """
+
+        epoch = uuid.uuid4().hex
+        self.set_file_path(self.root_path)
+        self.replace_file_datas(
+            JOURNAL_SNAPSHOT_FILE,
+            json.dumps({'epoch': epoch,
+                        'bundles': list(snapshot.iter_bundles()),
+                        'versions': list(snapshot.iter_versions())})
+        )
+        return self.start_epoch(epoch)
+
+
+class GenerationStamp(FileOperations):
+
+    """
+    Generation stamp of the catalog. Publishers rewrite the stamp 
+    file with a new id once their journal records written, clients 
+    compare the stat signature of the file with the one seen at their
+    last sync. Atomic replace, a concurrent bump never leaves a half
+    written stamp and any bump changes the signature.
+    """
+
+    def __init__(self,
+                 root_path: str = ROOT_TEMPLATE_PATH) -> None:
+        """
+        Initialize the stamp file path
+
+        Args:
+            root_path (str, optional): Root folder of the published bundles.
+                                        Defaults to ROOT_TEMPLATE_PATH.
+        """
+
+        super().__init__()
+        self.root_path = root_path
+        self.stamp_path = os.path.join(root_path, GENERATION_FILE)
+
+    def bump(self) -> str:
+
+        """Write a new generation into the stamp file
+
+        Returns:
+            str: generation id
+        """
+
+        generation = uuid.uuid4().hex
+        self.set_file_path(self.root_path)
+        self.replace_file_datas(GENERATION_FILE, generation)
+        return generation
+
+    def signature(self) -> tuple:
+
+        """Stat signature of the stamp file, one stat call
+
+        Returns:
+            tuple: file id, modified time and size. None if no stamp exist
+        """
+
+        try:
+            stat = os.stat(self.stamp_path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+if __name__ == '__main__':
+
+    from catalog import CatalogSnapshot
+    publish_journal = PublishJournal()
+    snapshot = CatalogSnapshot()
+    print(publish_journal.replay(snapshot))
+    print(list(snapshot.iter_bundles()))
+    generation_stamp = GenerationStamp()
+    print(generation_stamp.signature())
@@ -3,29 +3,280 @@
 # the config and info json 
 import os
 import sys
-import re
 import json
+import uuid
 import shutil
+from itertools import islice
 from thadam_base import thadam_api
+from catalog import CatalogIndex, CatalogSnapshot, VERSION_FOLDER
+from journal import PublishJournal, GenerationStamp
+from catalog_client import CatalogClient, CatalogServerError
 from helpers import(FileOperations,
                     VersionOperations,
+                    BundleVersion,
+                    ShareLock,
                     Defaults,
+                    reserve_version_folder,
                     ROOT_DEFAULT_PATH,
                     ROOT_TEMPLATE_PATH,
+                    CATALOG_SERVER_URL,
                     CONFIG_FILE,
-                    INFO_FILE)
+                    INFO_FILE,
+                    VERSIONS_FILE,
+                    PUBLISH_LOCK_FILE)
 
 
 class Templates(FileOperations, VersionOperations):
     
     """
     Model class for Template view widget operations.
+    All queries answered from the in-memory catalog snapshot
+    loaded from the local catalog index. The snapshot kept up to date 
+    by replaying the publish journal. The network share walked 
+    only while rescan requested or no journal exist.
+    With a catalog service configured the snapshot fetched from the
+    service instead, and read from the share again while the service
+    is unreachable.
     """
-    def __init__(self) -> None:
+    def __init__(self,
+                 load: bool = True,
+                 root_path: str = ROOT_TEMPLATE_PATH,
+                 index_path: str = '',
+                 server_url: str = CATALOG_SERVER_URL) -> None:
         
-        """INitialization. calling super for file operations"""
+        """INitialization. calling super for file operations
+
+        Args:
+            load (bool, optional): Load the catalog right away. Views 
+                                    loading in a worker thread pass False 
+                                    and call load() from the worker. 
+                                    Defaults to True.
+            root_path (str, optional): Root folder of the published bundles.
+                                    Defaults to ROOT_TEMPLATE_PATH.
+            index_path (str, optional): Path of the local catalog index.
+                                    Defaults to '' for the catalog cache dir.
+            server_url (str, optional): url of the catalog service, '' to 
+                                    read the share directly. 
+                                    Defaults to CATALOG_SERVER_URL.
+        """
         FileOperations.__init__(self)
+        self.catalog_index = CatalogIndex(index_path, root_path)
+        self.catalog_client = CatalogClient(server_url) if server_url else None
+        # Generation of the snapshot served by the catalog service. 
+        # Empty while the snapshot read from the share
+        self.served_generation = ''
+        self.journal = PublishJournal(self.catalog_index.root_path)
+        self.generation_stamp = GenerationStamp(self.catalog_index.root_path)
+        # Stamp signature seen by the last sync. False until synced
+        self.generation = False
+        self.info_file_paths = []
+        self.info_records = []
+        self.snapshot = CatalogSnapshot()
+        if load:
+            self.load()
+    
+    def load(self) -> None:
+        
+        """Load the catalog snapshot from the catalog service if 
+        reachable. Otherwise from the local catalog index, the share 
+        walked only if the local catalog index is empty.
+        """
+        if not self.load_from_server():
+            self.load_local()
+    
+    def load_local(self) -> None:
+        
+        """Load the catalog snapshot from the local catalog index.
+        The share walked only if the local catalog index holds no 
+        complete catalog yet.
+        """
+        if not self.catalog_scanned():
+            self.rescan()
+        else:
+            self.refresh()
+            self.sync()
+    
+    def load_cached(self) -> bool:
         
+        """Load the catalog snapshot of the local catalog index as it
+        is, the share not looked at. Brought up to date by revalidate().
+        The catalog service, if reachable, answers instead.
+
+        Returns:
+            bool: False if no complete catalog cached on this workstation 
+                  yet and no service reachable
+        """
+        if self.load_from_server():
+            return True
+        if not self.catalog_scanned():
+            return False
+        self.refresh()
+        return True
+    
+    def catalog_scanned(self) -> bool:
+        
+        """
+        Check the local catalog index holds a complete catalog, walked
+        from the share or loaded from a compacted journal snapshot. 
+        The journal only holds the publishes since it was started, an 
+        index holding only the bundles published from this workstation 
+        is never brought up to date by replaying it.
+
+        Returns:
+            bool: True if the journal replay is enough to sync
+        """
+        return not self.catalog_index.is_empty() and \
+                bool(self.catalog_index.get_state('scanned'))
+    
+    def revalidate(self) -> tuple:
+        
+        """Merge the changes of the share into the cached catalog 
+        snapshot, as sync() does, and report the versions changed.
+
+        Returns:
+            tuple:  (config path, version number) keys of the added 
+                    or changed versions,
+                    keys of the removed versions
+        """
+        before = self.snapshot.version_state()
+        self.sync()
+        return CatalogSnapshot.diff_version_state(before, 
+                                                  self.snapshot.version_state())
+    
+    def load_from_server(self) -> bool:
+        
+        """Fetch the catalog snapshot from the catalog service. 
+        Nothing transferred if the service has no newer generation.
+        The served catalog merged into the held snapshot, the unchanged
+        versions kept as they are for revalidate().
+
+        Returns:
+            bool: False if no service configured or it is unreachable
+        """
+        if self.catalog_client is None:
+            return False
+        generation = self.generation_stamp.signature()
+        try:
+            served = self.catalog_client.snapshot(self.served_generation)
+        except CatalogServerError:
+            self.served_generation = ''
+            return False
+        
+        if not served.get('unchanged'):
+            self.snapshot.merge(served['bundles'], served['versions'])
+        self.served_generation = served['generation']
+        self.generation = generation
+        return True
+    
+    def rescan(self) -> None:
+        
+        """Rebuild the catalog index by walking the ROOT_TEMPLATE_PATH
+        once. Run only on demand. 
+        """
+        self.snapshot = self.catalog_index.rescan()
+        self.catalog_index.set_state('scanned', 1)
+        self.catalog_index.set_state('journal_epoch', '')
+        self.catalog_index.set_state('journal_offset', 0)
+        self.sync()
+    
+    def refresh(self) -> None:
+        
+        """Reload the catalog snapshot from the local catalog index.
+        Picks up the bundles published from this workstation.
+        A snapshot served by the catalog service fetched again instead,
+        the local catalog index never holds the served catalog.
+        """
+        if self.served_generation:
+            self.sync()
+            return
+        self.snapshot = self.catalog_index.snapshot()
+    
+    def sync(self) -> None:
+        
+        """Incrementally merge the changes of the share into the
+        catalog snapshot. Only the publish journal records written since
+        the last sync were replayed. Without a journal, only the 
+        directories modified since the last scan were listed and read again.
+        A snapshot served by the catalog service fetched again instead.
+        """
+        if self.served_generation:
+            if self.load_from_server():
+                return
+            # Service gone, back to the local index and the share
+            self.load_local()
+            return
+        # Stamp looked before the sync, a bump landing during the 
+        # sync seen by the next one
+        self.generation = self.generation_stamp.signature()
+        if not self.journal.exists():
+            self.snapshot = self.catalog_index.update(self.snapshot)
+            return
+        
+        epoch, offset, records, compacted = self.journal.replay(
+            self.snapshot,
+            self.catalog_index.get_state('journal_epoch'),
+            int(self.catalog_index.get_state('journal_offset', 0))
+        )
+        # A compacted snapshot replaces the whole catalog, the 
+        # records of a replay only touch their own rows
+        if compacted:
+            self.catalog_index.store(self.snapshot)
+            self.catalog_index.set_state('scanned', 1)
+        elif records:
+            self.journal.apply_to_index(self.catalog_index, records)
+        self.catalog_index.set_state('journal_epoch', epoch)
+        self.catalog_index.set_state('journal_offset', offset)
+    
+    def catalog_changed(self) -> bool:
+        
+        """Check the generation stamp moved since the last sync.
+        One stat of the stamp file. Without a stamp on the share 
+        every call reports a change.
+
+        Returns:
+            bool: True if a sync is needed
+        """
+        generation = self.generation_stamp.signature()
+        return generation is None or generation != self.generation
+    
+    def sync_if_changed(self) -> bool:
+        
+        """Sync only if the generation stamp moved
+
+        Returns:
+            bool: True if synced
+        """
+        if not self.catalog_changed():
+            return False
+        self.sync()
+        return True
+    
+    def bump_generation(self) -> None:
+        
+        """Tell the other clients the catalog changed. Called 
+        after the journal records of a publish or removal written.
+        """
+        self.generation_stamp.bump()
+    
+    def compact_journal(self) -> None:
+        
+        """Compact the publish journal into a snapshot of a new epoch.
+        The catalog snapshot brought up to date with the journal and
+        the share before written. The share walked before the journal
+        lock taken, the appends of the other publishers wait only for
+        the replay of the journal tail and the write of the snapshot.
+        Anything published during the walk is in that tail.
+        Left to the catalog service if the catalog is served, this 
+        workstation holds no walked catalog to compact.
+        """
+        if self.served_generation:
+            return
+        self.sync()
+        self.snapshot = self.catalog_index.update(self.snapshot)
+        with self.journal.lock():
+            self.sync()
+            self.journal.compact(self.snapshot)
+        self.sync()
         
     def get_all_bundles(self,
                         matching_text: str ='',
@@ -34,8 +285,8 @@ class Templates(FileOperations, VersionOperations):
                         return_with_project_name: bool=False) -> list | dict :
         """
         From bundle entity this method returns bundles list 
-        for given combination of conditions. The config.json file readed from here
-        to retrive bundles. 
+        for given combination of conditions. The config.json datas readed 
+        from the catalog snapshot to retrive bundles. 
 
         Few condition also works here. 
         1. the bundle name as key and project name as value returned.
@@ -55,37 +306,39 @@ class Templates(FileOperations, VersionOperations):
         
         self.bundles = set()
         self.bundle_with_project_dict = {}
-        for root,_,config_file in os.walk(ROOT_TEMPLATE_PATH):
-            if config_file:
-                if config_file[0] == CONFIG_FILE:
-                        self.set_file_path(root)
-                        read_config_file = self.read_file_datas(CONFIG_FILE)
-                        if all_mode and not project_name and not matching_text:
-                                self.bundles.add(
-                                    read_config_file['name']
-                                )
-                        elif all_mode and not project_name and matching_text:
-                            if matching_text in read_config_file['name']:
-                                self.bundles.add(
-                                    read_config_file['name']
-                                )
-                        elif project_name and not all_mode and not matching_text:
-                            if project_name == read_config_file['project']:
-                                self.bundles.add(
-                                    read_config_file['name']
-                                )
-                        elif project_name and not all_mode and matching_text:
-                            if project_name == read_config_file['project'] and \
-                                matching_text in read_config_file['name']:
-                                    self.bundles.add(
-                                        read_config_file['name']
-                                    )
-                        if all_mode and return_with_project_name:
-                            self.bundle_with_project_dict.update(
-                                {
-                                    read_config_file['name']:  read_config_file['project']
-                                }
-                            )
+        # Matching text looked up in the trigram index of the names.
+        # The project dict holds every bundle regardless of the text.
+        if return_with_project_name:
+            config_files = self.snapshot.iter_bundles()
+        else:
+            config_files = self.snapshot.search_bundles(matching_text)
+        for read_config_file in config_files:
+            if all_mode and not project_name and not matching_text:
+                    self.bundles.add(
+                        read_config_file['name']
+                    )
+            elif all_mode and not project_name and matching_text:
+                if matching_text in read_config_file['name']:
+                    self.bundles.add(
+                        read_config_file['name']
+                    )
+            elif project_name and not all_mode and not matching_text:
+                if project_name == read_config_file['project']:
+                    self.bundles.add(
+                        read_config_file['name']
+                    )
+            elif project_name and not all_mode and matching_text:
+                if project_name == read_config_file['project'] and \
+                    matching_text in read_config_file['name']:
+                        self.bundles.add(
+                            read_config_file['name']
+                        )
+            if all_mode and return_with_project_name:
+                self.bundle_with_project_dict.update(
+                    {
+                        read_config_file['name']:  read_config_file['project']
+                    }
+                )
         if return_with_project_name:
             return dict(sorted(self.bundle_with_project_dict.items()))
         else:                           
@@ -97,10 +350,10 @@ class Templates(FileOperations, VersionOperations):
                                context: str,
                                project: str ='') -> None:
         """
-        set the config path to the info_file_paths attribute by 
-        retriving the config_path  from the config_json. 
-        the config path combined with the latest version and
-        set the path
+        set the version folder paths to the info_file_paths attribute by 
+        retriving the config_path of the matching bundle from the 
+        catalog snapshot. The info.json datas of each version were 
+        set to the info_records attribute in the same order.
 
         Args:
             bundle (str): bundle name
@@ -111,100 +364,194 @@ class Templates(FileOperations, VersionOperations):
                                     deafult it set for all projects. Defaults to ''.
         """
         
-        def list_info_file_paths():
-            
-            if bundle == template_config_file['name']:
-                if domain == template_config_file['domain'] and \
-                    context == template_config_file['context']:
-                        filter_folders = list(
-                            filter(lambda x: re.findall('^v\d+', x), folders)
-                        )
-                        self.info_file_paths = list(
-                            map(
-                                lambda x: os.path.join(template_config_file['config_path'], x),
-                                filter_folders
-                            )
-                        )
-                    
-            elif not hasattr(self, 'info_file_paths'):
-                self.info_file_paths[:] = []
-            
         self.info_file_paths = []
-        for root,directories,config_file in os.walk(ROOT_TEMPLATE_PATH):
-            if config_file:
-                if config_file[0] == CONFIG_FILE:
-                    self.set_file_path(root)
-                    folders = directories
-                    template_config_file = self.read_file_datas(CONFIG_FILE)
-                    if project == template_config_file['project']:
-                        list_info_file_paths()
-                    if not project:
-                        list_info_file_paths()
+        self.info_records = []
+        for template_config_file in self.snapshot.iter_bundles():
+            if project and project != template_config_file['project']:
+                continue
+            if bundle == template_config_file['name'] and \
+                domain == template_config_file['domain'] and \
+                context == template_config_file['context']:
+                    for config_path, info in self.snapshot.iter_versions(
+                                template_config_file['config_path']):
+                        VersionOperations.__init__(self, info['version'])
+                        self.info_file_paths.append(
+                            os.path.join(config_path,
+                                         self.pad_version_identifier_to_number())
+                        )
+                        self.info_records.append(info)
+    
+    def search_comments(self,
+                        text: str) -> list:
+        """
+        Bundle entities of the versions whose comments contain 
+        the text. Case ignored.
+
+        Args:
+            text (str): text to search in the comments
+
+        Returns:
+            list: bundle entities of the matching versions
+        """
         
-    def list_all_bundle_entity(self) -> dict:
+        return [self.make_bundle_entity(self.snapshot.bundles[config_path],
+                                        self.snapshot.versions[config_path][version])
+                for config_path, version in self.snapshot.search_comments(text)]
+    
+    def make_bundle_entity(self,
+                           config: dict,
+                           info: dict) -> BundleVersion:
+        """
+        Combine the config.json and info.json datas of a version
+        into a bundle entity
 
+        Args:
+            config (dict): config.json datas of the bundle
+            info (dict): info.json datas of the version
+
+        Returns:
+            BundleVersion: bundle entity of the version
+        """
+        
+        return BundleVersion.from_datas(config, info)
+        
+    def list_all_bundle_entity(self,
+                               bundle_name: str = '',
+                               project_name: str = '') -> dict:
         """
-        Retrive all entities from the config.json and info.json 
-        and make a dictionary.
+        Retrive all entities of config.json and info.json 
+        from the catalog snapshot and make a dictionary.
+
+        Args:
+            bundle_name (str, optional): Only the entities of the bundles
+                                        with this name. Defaults to '' for all.
+            project_name (str, optional): Only the entities of the project.
+                                        Defaults to '' for all.
 
         Returns:
             dict:   The returned dict project is the key and 
                     bundle info entities were values
         """
         
-        raw_project_bundle_dicts = []
-        for root,directories,config_file in os.walk(ROOT_TEMPLATE_PATH):
-            if config_file:
-                if config_file[0] == CONFIG_FILE:
-                    self.set_file_path(root)
-                    config_info_datas = self.read_file_datas(CONFIG_FILE)
-                    project_name = config_info_datas['project']
-                    domain = config_info_datas['domain']
-                    context = config_info_datas['context']
-                    bundle_name = config_info_datas['name']
-                    config_path = config_info_datas['config_path']
-                    for directory in directories:
-                        verison_folders = os.path.join(
-                            root,directory
-                        )
-                        self.set_file_path(verison_folders)
-                        version_info_datas = self.read_file_datas(INFO_FILE)
-                        version_no = version_info_datas['version']
-                        user_name = version_info_datas['user_name']
-                        comments = version_info_datas['comments']
-                        node_count = version_info_datas['node_count']
-                        bundle_type = version_info_datas['type']
-                        file_size = version_info_datas['file_size']
-                        created_on = version_info_datas['Created On']
-                        module_path = version_info_datas['module_path']
-                        VersionOperations.__init__(self, version_no)
-                        version = self.pad_version_identifier_to_number()
-                        raw_project_bundle_dicts.append(
-                                        {project_name:  dict(bundle_name=bundle_name,
-                                                            project_name = project_name,
-                                                            user_name=user_name,
-                                                            node_count=node_count,
-                                                            domain=domain, 
-                                                            context=context,
-                                                            bundle_type=bundle_type,
-                                                            file_size=file_size,
-                                                            created_on=created_on,
-                                                            version=version,
-                                                            module_path=module_path,
-                                                            config_path=config_path,
-                                                            comments=comments)
-                                                    }
-                        )
-
-        all_projects_entities = {}           
-        for raw_project_bundle_dict in raw_project_bundle_dicts:
-            for project, _ in raw_project_bundle_dict.items():
-                    all_projects_entities[project] = []
-        for raw_project_bundle_dict in raw_project_bundle_dicts:
-            for project, bundles in raw_project_bundle_dict.items():
-                if project in all_projects_entities:
-                     all_projects_entities[project].append(bundles) 
+        all_projects_entities = {}
+        for bundle_entity in self.query(project=project_name, bundle=bundle_name):
+            all_projects_entities.setdefault(bundle_entity['project_name'], []).append(
+                bundle_entity
+            )
         return all_projects_entities
+    
+    def query(self,
+              project: str = '',
+              domain: str = '',
+              context: str = '',
+              bundle: str = '',
+              text: str = '',
+              user: str = '',
+              since: int = None,
+              limit: int = None,
+              offset: int = 0):
+        """
+        Stream the bundle entities of the versions matching every 
+        given filter, in catalog order: project, bundle name, version.
+        Lazy, each entity made as the caller asks for it. A caller 
+        stopping after the first page makes no other entity, a script
+        walking the whole catalog holds one entity at a time.
+        With text only the bundles matched by the name index visited.
+
+        Example:
+            next(templates.query(domain='Magical', text='fog', limit=1))
+
+        Args:
+            project (str, optional): project name. Defaults to '' for all.
+            domain (str, optional): domain name. Defaults to '' for all.
+            context (str, optional): context name. Defaults to '' for all.
+            bundle (str, optional): bundle name. Defaults to '' for all.
+            text (str, optional): substring of the bundle name. Defaults to ''.
+            user (str, optional): user name of the publisher. Defaults to ''.
+            since (int, optional): earliest creation epoch. Defaults to None.
+            limit (int, optional): number of entities at most. Defaults to 
+                                    None for all.
+            offset (int, optional): matching entities skipped first. 
+                                    Defaults to 0.
+
+        Yields:
+            BundleVersion: bundle entity of each matching version
+        """
+        
+        configs = self.snapshot.search_bundles(text) if text else \
+                    self.snapshot.iter_bundles()
+        bundle_entities = self.iter_matching_entities(configs, project, domain, 
+                                                      context, bundle, user, since)
+        stop = None if limit is None else offset + limit
+        yield from islice(bundle_entities, offset, stop)
+    
+    def iter_matching_entities(self,
+                               configs,
+                               project: str,
+                               domain: str,
+                               context: str,
+                               bundle: str,
+                               user: str,
+                               since: int):
+        """Bundle entities of the versions of the given bundles 
+        matching the filters of query()
+
+        Args:
+            configs (iterable): config.json datas of the bundles to visit
+
+        Yields:
+            BundleVersion: bundle entity of each matching version
+        """
+        
+        for config in configs:
+            if project and config['project'] != project or \
+                domain and config['domain'] != domain or \
+                context and config['context'] != context or \
+                bundle and config['name'] != bundle:
+                continue
+            versions = self.snapshot.versions.get(config['config_path'], {})
+            for version in sorted(versions):
+                info = versions.get(version)
+                # Removed by a sync while the caller iterated
+                if info is None:
+                    continue
+                if user and info.get('user_name') != user or \
+                    since is not None and info.get('created_epoch', 0) < since:
+                    continue
+                yield self.make_bundle_entity(config, info)
+    
+    def make_bundle_entities(self,
+                             version_keys: list) -> list:
+        """
+        Bundle entities of the given versions of the catalog snapshot
+
+        Args:
+            version_keys (list): (config path, version number) keys
+
+        Returns:
+            list: (project name, bundle entity) tuples
+        """
+        
+        bundle_entities = []
+        for config_path, version in version_keys:
+            config = self.snapshot.bundles.get(config_path)
+            info = self.snapshot.versions.get(config_path, {}).get(version)
+            if config is not None and info is not None:
+                bundle_entities.append((config['project'],
+                                        self.make_bundle_entity(config, info)))
+        return bundle_entities
+    
+    def list_all_bundle_config(self) -> list:
+        
+        """
+        Retrive the config.json datas of all the bundles from the 
+        catalog snapshot, without any version.
+
+        Returns:
+            list: config.json datas sorted by project and bundle name
+        """
+        
+        return list(self.snapshot.iter_bundles())
         
     def get_versions(self,
                      text_mode: str =True) -> list:
@@ -223,9 +570,7 @@ class Templates(FileOperations, VersionOperations):
         
         version_nos = set()
         versions = set()
-        for info_file_path in self.info_file_paths:
-            self.set_file_path(info_file_path)
-            version_file_config = self.read_file_datas(INFO_FILE)
+        for version_file_config in self.info_records:
             version_nos.add(version_file_config['version'])
         
         for version_no in version_nos:
@@ -241,7 +586,7 @@ class Templates(FileOperations, VersionOperations):
                 version: str) -> tuple:
         """
         Retrive info, comments and bundle type of the bundles for 
-        versions from the info.json file
+        versions from the info.json datas
 
         Args:
             version (str): version label Example:v001
@@ -253,13 +598,11 @@ class Templates(FileOperations, VersionOperations):
                     current module_path 
         """
         
-        info_file_path = [info_file_path 
-                          for info_file_path in self.info_file_paths 
-                          if version in info_file_path
-                         ]
-
-        self.set_file_path(info_file_path[0])
-        read_file_data = self.read_file_datas(INFO_FILE)
+        read_file_data = [dict(info_record)
+                          for info_file_path, info_record 
+                          in zip(self.info_file_paths, self.info_records)
+                          if os.path.basename(info_file_path) == version
+                         ][0]
         comments = read_file_data['comments']
         bundle_type = read_file_data['type']
         module_path = read_file_data['module_path']
@@ -269,6 +612,27 @@ class Templates(FileOperations, VersionOperations):
         infos = read_file_data
         return comments, bundle_type, infos, module_path
 
+    def bundle_name_conflict(self,
+                             bundle_name: str,
+                             project_name: str) -> str:
+        """
+        Validate the bundle name is not used in other projects.
+        The catalog synced with the publish journal first if the 
+        generation stamp moved, the lookup itself is a hash lookup. 
+
+        Args:
+            bundle_name (str): bundle name to publish
+            project_name (str): project name to publish
+
+        Returns:
+            str: other project name already using the bundle name.
+                 Empty if the bundle name is free to use
+        """
+        
+        self.sync_if_changed()
+        return self.snapshot.name_used_in_other_project(bundle_name,
+                                                        project_name)
+
     def all_project_bundle(self) -> dict:
         """
         Returns Dict of project name as key and bundle name as value
@@ -277,38 +641,99 @@ class Templates(FileOperations, VersionOperations):
             dict: project name as key and bundle name as value
         """
         
-        template_config_files = []
-        for root,directories,config_file in os.walk(ROOT_TEMPLATE_PATH):
-            if config_file:
-                if config_file[0] == CONFIG_FILE:
-                    self.set_file_path(root)
-                    template_config_file = self.read_file_datas(CONFIG_FILE)
-                    template_config_files.append(template_config_file)
         all_project_bundle ={}
-        filtered_bundles = []
-        for template_config_file in template_config_files:
-            filtered_bundles.append({template_config_file['project']: template_config_file['name']})
-        for filtered_bundle in filtered_bundles:
-            for project,_ in filtered_bundle.items():
-                all_project_bundle[project] = []
-        for filtered_bundle in filtered_bundles:
-            for project,bundle in filtered_bundle.items():
-                all_project_bundle[project].append(bundle)
+        for template_config_file in self.snapshot.iter_bundles():
+            all_project_bundle.setdefault(
+                template_config_file['project'], []
+            ).append(template_config_file['name'])
         return all_project_bundle
     
+    @staticmethod
+    def move_aside(folder_path: str) -> str:
+        
+        """
+        Rename the folder into a hidden folder of the same parent. 
+        The name is free again at once and the scans skip the hidden 
+        folder, while the slow delete over the share runs later.
+        Folders locked by other sessions were deleted in place.
+
+        Args:
+            folder_path (str): folder to remove
+
+        Returns:
+            str: path of the folder to delete
+        """
+        
+        removed_path = os.path.join(
+            os.path.dirname(folder_path),
+            f".{os.path.basename(folder_path)}.removed.{uuid.uuid4().hex[:8]}"
+        )
+        try:
+            os.rename(folder_path, removed_path)
+        except OSError:
+            return folder_path
+        return removed_path
+    
+    def unregister_removal(self,
+                           bundle_metadata: BundleVersion) -> tuple:
+        """
+        Unpublish the version of the bundle straight from the config 
+        and module paths of the metadata. if only one version of the 
+        bundle left then the entire bundle unpublished. The manifest, 
+        journal, catalog index and snapshot were updated in place, no 
+        walk of the share. The files were only moved aside, deleting 
+        them is left to the caller.
+
+        Args:
+            bundle_metadata (BundleVersion): userrole entity of the version
+
+        Returns:
+            tuple:  path of the folder to delete,
+                    True if the entire bundle removed
+        """
+        
+        config_path = bundle_metadata['config_path']
+        version_no = int(VersionOperations(
+            bundle_metadata['version']).trim_version_identifier_from_number()
+        )
+        self.sync()
+        
+        if len(self.snapshot.versions.get(config_path, {})) > 1:
+            removed_path = self.move_aside(
+                os.path.dirname(bundle_metadata['module_path'])
+            )
+            bundle_operations = BundleOpearations(config_path,
+                                                  version_no,
+                                                  self.catalog_index,
+                                                  self.journal)
+            bundle_operations.unregister_version_from_manifest(version_no)
+            self.journal.remove_version(config_path, version_no)
+            self.catalog_index.unregister_version(config_path, version_no)
+            self.snapshot.remove_version(config_path, version_no)
+            self.bump_generation()
+            return removed_path, False
+        
+        removed_path = self.move_aside(config_path)
+        self.journal.remove_bundle(config_path)
+        self.catalog_index.unregister_bundle(config_path)
+        self.snapshot.remove_bundle(config_path)
+        self.bump_generation()
+        return removed_path, True
+    
     def remove_bundle(self,
-                      bundle_metadata: dict) -> bool:
+                      bundle_metadata: BundleVersion) -> bool:
         """
         Remove the specific version bundle from the file system.
         if only one version of the bundle found then remove entire 
         bundle name structure from the root. For more than one versions
-        remove only those versions for selected bundle.
+        remove only those versions for selected bundle. The catalog 
+        index updated as well.
 
         Args:
-            bundle_metadata (dict): each version label holds a dict as 
-                                    metadata. version label as dispaly role 
+            bundle_metadata (BundleVersion): each version label holds a bundle 
+                                    entity as metadata. version label as dispaly role 
                                     metadata as user role. bundle_metadata is 
-                                    the userrole dict sent from a version. 
+                                    the userrole entity sent from a version. 
 
         Returns:
             bool:   Remove entire config and bundle if false else remove
@@ -316,25 +741,9 @@ class Templates(FileOperations, VersionOperations):
         """
         
         
-        VersionOperations.__init__(self, 
-                                   bundle_metadata['version'])
-        version_no = int(self.trim_version_identifier_from_number())
-        
-        self.get_version_info_paths(bundle_metadata['bundle_name'],
-                                    bundle_metadata['domain'],
-                                    bundle_metadata['context'], 
-                                    project=bundle_metadata['project_name'])
-        
-        if len(self.get_versions()) > 1:
-            shutil.rmtree(
-                os.path.dirname(bundle_metadata['module_path'])
-            )
-            return False
-        else:
-            shutil.rmtree(
-                bundle_metadata['config_path']
-            )
-            return True
+        removed_path, bundle_removed = self.unregister_removal(bundle_metadata)
+        shutil.rmtree(removed_path)
+        return bundle_removed
             
 
 class BundleOpearations(FileOperations,
@@ -343,11 +752,14 @@ class BundleOpearations(FileOperations,
     """
     Generate config.json and info.json. simply this method
     Create folders for bundles and take care bundle related file and 
-    folder creation operations 
+    folder creation operations. The versions.json manifest next to 
+    config.json holds the info of every version of the bundle.
     """
     def __init__(self, 
                  bundle_folder_path: str,
-                 version: str
+                 version: str,
+                 catalog_index: CatalogIndex = None,
+                 journal: PublishJournal = None
                  ) -> None:
 
         """Initialize of version and file operations.
@@ -357,6 +769,12 @@ class BundleOpearations(FileOperations,
         Args:
             bundle_folder_path (str): Bundle folder path
             version (str): Numeric version number
+            catalog_index (CatalogIndex, optional): catalog index of the 
+                                    Templates model kept up to date.
+                                    Defaults to None for the default index.
+            journal (PublishJournal, optional): publish journal of the 
+                                    Templates model. Defaults to None for
+                                    the journal of the catalog index root.
         """
         
         VersionOperations.__init__(self, version)
@@ -372,6 +790,8 @@ class BundleOpearations(FileOperations,
                                         CONFIG_FILE)
         self.info_file_path = os.path.join(self.folder_path,
                                       INFO_FILE)
+        self.catalog_index = catalog_index or CatalogIndex()
+        self.journal = journal or PublishJournal(self.catalog_index.root_path)
         
     @staticmethod
     def create_directory(dir_path: str) -> None:
@@ -401,6 +821,30 @@ class BundleOpearations(FileOperations,
              return self.bundle_folder_path
              
     
+    @classmethod
+    def allocate_version(cls,
+                         bundle_folder_path: str,
+                         catalog_index: CatalogIndex = None,
+                         journal: PublishJournal = None):
+        """
+        Reserve the next version of the bundle and its version folder.
+
+        Args:
+            bundle_folder_path (str): Bundle folder path
+            catalog_index (CatalogIndex, optional): catalog index kept up 
+                                    to date. Defaults to None.
+            journal (PublishJournal, optional): publish journal. 
+                                    Defaults to None.
+
+        Returns:
+            BundleOpearations: operations of the reserved version
+        """
+        
+        return cls(bundle_folder_path,
+                   reserve_version_folder(bundle_folder_path),
+                   catalog_index,
+                   journal)
+    
     def make_info_file_path_directory(self) -> str:
 
         """
@@ -419,7 +863,9 @@ class BundleOpearations(FileOperations,
                            datas: dict,
                            file_type: str='') -> None:
         """
-        Write datas into info.json and config.json
+        Write datas into info.json and config.json.
+        The versions.json manifest, the publish journal and the 
+        catalog index kept up to date with the written datas.
 
         Args:
             datas (dict): dict entitiy contains for config and info datas
@@ -430,10 +876,83 @@ class BundleOpearations(FileOperations,
             self.set_file_path(self.folder_path)
             json_object = json.dumps(datas, indent=4)
             self.write_file_datas(INFO_FILE, json_object)
+            self.register_version_in_manifest(datas)
+            self.journal.publish_version(self.bundle_folder_path, datas)
+            self.catalog_index.register_version(self.bundle_folder_path,
+                                                datas)
         if file_type == CONFIG_FILE:
             self.set_file_path(self.bundle_folder_path)
             json_object = json.dumps(datas, indent=4)
             self.write_file_datas(CONFIG_FILE, json_object)
+            self.journal.publish_bundle(datas)
+            self.catalog_index.register_bundle(datas)
+    
+    def read_versions_manifest(self) -> dict:
+        
+        """
+        Read the versions.json manifest of the bundle. Legacy bundles
+        without the manifest seeded from the info.json of each version folder.
+
+        Returns:
+            dict: version number as key and info.json datas as value
+        """
+        
+        manifest_path = os.path.join(self.bundle_folder_path, VERSIONS_FILE)
+        if os.path.isfile(manifest_path):
+            return {int(info['version']): info 
+                    for info in self.load_file_datas(manifest_path)['versions']}
+        
+        versions = {}
+        with os.scandir(self.bundle_folder_path) as entries:
+            for entry in entries:
+                info_file_path = os.path.join(entry.path, INFO_FILE)
+                if VERSION_FOLDER.match(entry.name) and entry.is_dir() and \
+                    os.path.isfile(info_file_path):
+                    info = self.load_file_datas(info_file_path)
+                    versions[int(info['version'])] = info
+        return versions
+    
+    def write_versions_manifest(self,
+                                versions: dict) -> None:
+        """
+        Atomically replace the versions.json manifest of the bundle
+
+        Args:
+            versions (dict): version number as key and info.json datas as value
+        """
+        
+        self.set_file_path(self.bundle_folder_path)
+        json_object = json.dumps(
+            {'versions': [versions[version] for version in sorted(versions)]},
+            indent=4
+        )
+        self.replace_file_datas(VERSIONS_FILE, json_object)
+    
+    def register_version_in_manifest(self, 
+                                     datas: dict) -> None:
+        """Add the published version info into versions.json
+
+        Args:
+            datas (dict): info.json datas of the version
+        """
+        
+        with ShareLock(os.path.join(self.bundle_folder_path, PUBLISH_LOCK_FILE)):
+            versions = self.read_versions_manifest()
+            versions[int(datas['version'])] = datas
+            self.write_versions_manifest(versions)
+    
+    def unregister_version_from_manifest(self, 
+                                         version: int) -> None:
+        """Remove the version info from versions.json
+
+        Args:
+            version (int): numeric version number
+        """
+        
+        with ShareLock(os.path.join(self.bundle_folder_path, PUBLISH_LOCK_FILE)):
+            versions = self.read_versions_manifest()
+            versions.pop(int(version), None)
+            self.write_versions_manifest(versions)
 
         
         
@@ -21,7 +21,7 @@ from helpers import (ConfigFormat,
                      HIP_EXTENSION,
                      INFO_FILE,
                      CONFIG_FILE,
-                     ROOT_TEMPLATE_PATH)
+                     CREATED_ON_FORMAT)
 from helper_msgboxes import utilMessageBox
 import houdini_ops 
 
@@ -51,7 +51,10 @@ class Saver(QtWidgets.QWidget):
         self.thadam_db = ThadamDB()
         self.projects = self.thadam_db.get_projects()
         
-        self.templates = Templates()
+        # Catalog loaded the first time a bundle name validated, 
+        # opening the saver reads nothing from the share
+        self.templates = Templates(load=False)
+        self.templates_loaded = False
         # self.available_project_bundles = self.templates.all_project_bundle()
         
         self.houdini_node_ops = houdini_ops.HoudiniOPs()
@@ -260,57 +263,37 @@ class Saver(QtWidgets.QWidget):
             node_path = model.item(index).text()
             self.houdini_node_ops.enable_selection_on_selected_nodes(node_path)
           
+    def loaded_templates(self) -> Templates:
+        
+        """Templates model with its catalog loaded, loaded on the 
+        first call
+
+        Returns:
+            Templates: loaded templates model
+        """
+        
+        if not self.templates_loaded:
+            self.templates.load()
+            self.templates_loaded = True
+        return self.templates
+    
     def bundle_validation(self,
                           project_name):
         
-        self.available_project_bundles = self.templates.all_project_bundle()
-        
-        list_bundles = []
-        for _, bundles in self.available_project_bundles.items():
-            for bundle in bundles:
-                list_bundles.append(bundle)
-        
-        matched_bundle = []
-        if self.bundle_name_ldt.text() in list_bundles:
-            matched_bundle.append(self.bundle_name_ldt.text())
+        bundle_name = self.bundle_name_ldt.text()
+        used_project = self.loaded_templates().bundle_name_conflict(bundle_name,
+                                                                    project_name)
+        if not used_project:
+            return True
         
-        if project_name in self.available_project_bundles:
-            if not matched_bundle:
-                return True
-                
-            elif matched_bundle[0] in list_bundles and matched_bundle[0] in \
-                            self.available_project_bundles[project_name]:
-                return True
-                
-            else:
-                for project, bundle in self.available_project_bundles.items():
-                    if matched_bundle[0] in bundle:
-                        self.project_cbx.setCurrentIndex(-1)
-                        self.bundle_name_ldt.clear()
-                        msg = self.bundle_validation_message(matched_bundle[0],
-                                                             project)
-                        util_messagebox = utilMessageBox('warning',
-                                            msg)
-                        util_messagebox.show_message()
-                        return False
-       
-        elif project_name not in self.available_project_bundles:
-            
-            if not matched_bundle:
-                return True
-                
-            elif matched_bundle[0] in list_bundles:
-                for project, bundle in self.available_project_bundles.items():
-                    if matched_bundle[0] in bundle:
-                        self.project_cbx.setCurrentIndex(-1)
-                        self.bundle_name_ldt.clear()
-                        msg = self.bundle_validation_message(matched_bundle[0],
-                                                             project)
-                        util_messagebox = utilMessageBox('warning',
-                                            msg)
-                        util_messagebox.show_message()
-                        return False
-                        
+        self.project_cbx.setCurrentIndex(-1)
+        self.bundle_name_ldt.clear()
+        msg = self.bundle_validation_message(bundle_name,
+                                             used_project)
+        util_messagebox = utilMessageBox('warning',
+                            msg)
+        util_messagebox.show_message()
+        return False
         
     def create_bundle_directory_path(self):
         
@@ -321,7 +304,7 @@ class Saver(QtWidgets.QWidget):
             self.bundle_name_ldt.text(),
         )
         return os.path.join(
-            ROOT_TEMPLATE_PATH,bundle
+            self.templates.catalog_index.root_path,bundle
         )
     
     def add_selected_node_from_context(self):
@@ -380,6 +363,7 @@ class Saver(QtWidgets.QWidget):
                 self.uti_houdini_ops.save_node_snippets()
                 node_count = self.uti_houdini_ops.node_count()
                 file_size = os.stat(uti_file_path).st_size
+                date_now = datetime.now()
                 
                 self.uti_config_formates = InfoFormat(os.environ['USERNAME'],
                                                     self.context_cbx.currentText(),
@@ -388,8 +372,10 @@ class Saver(QtWidgets.QWidget):
                                                     self.bundle_type_cbx.currentText(),
                                                     uti_file_path,
                                                     str(round(file_size/1024**2, 2))+"Mb",
-                                                    datetime.now().strftime('%d-%m-%Y %H:%M'),
-                                                    self.comments_tedt.toPlainText())
+                                                    date_now.strftime(CREATED_ON_FORMAT),
+                                                    self.comments_tedt.toPlainText(),
+                                                    file_bytes=file_size,
+                                                    created_epoch=int(date_now.timestamp()))
                 bundle_operations.generate_info_file(self.uti_config_formates.data(),
                                                      file_type = INFO_FILE)
 
@@ -401,6 +387,7 @@ class Saver(QtWidgets.QWidget):
                 self.hip_houdini_ops = houdini_ops.HoudiniOPs(file_path=hip_file_path)
                 self.hip_houdini_ops.save_hip()
                 file_size = os.stat(hip_file_path).st_size
+                date_now = datetime.now()
                 
                 self.hip_config_formates = InfoFormat(os.environ['USERNAME'],
                                                     self.context_cbx.currentText(),
@@ -409,8 +396,10 @@ class Saver(QtWidgets.QWidget):
                                                     self.bundle_type_cbx.currentText(),
                                                     hip_file_path,
                                                     str(round(file_size/1024**2, 2))+"Mb",
-                                                    datetime.now().strftime('%d-%m-%Y %H:%M'),
-                                                    self.comments_tedt.toPlainText())
+                                                    date_now.strftime(CREATED_ON_FORMAT),
+                                                    self.comments_tedt.toPlainText(),
+                                                    file_bytes=file_size,
+                                                    created_epoch=int(date_now.timestamp()))
                 bundle_operations.generate_info_file(self.hip_config_formates.data(),
                                                      file_type = INFO_FILE)
                 pass
@@ -418,25 +407,11 @@ class Saver(QtWidgets.QWidget):
         bundle_directory = self.create_bundle_directory_path()
         bundle_dict = self.bundle_validation(self.project_cbx.currentText())
         if bundle_dict:
-            if os.path.exists(bundle_directory):
-                self.templates.get_version_info_paths(self.bundle_name_ldt.text(),
-                                                      self.domain_cbx.currentText(),
-                                                      self.context_cbx.currentText(),
-                                                      project=self.project_cbx.currentText()
-                                                    )
-                max_version= max(
-                            self.templates.get_versions(text_mode=False)
-                )
-                latest_version = self.next_version(max_version)
-                display_publish_message(latest_version)
-                
-                bundle_operations = BundleOpearations(bundle_directory, latest_version)
-                latest_version_path = bundle_operations.make_info_file_path_directory()
-                helper(latest_version)
-
-            else:
+            if not os.path.exists(bundle_directory):
                 first_version = self.next_version()
-                bundle_operations = BundleOpearations(bundle_directory, first_version)
+                bundle_operations = BundleOpearations(bundle_directory, first_version,
+                                                      self.templates.catalog_index,
+                                                      self.templates.journal)
                 first_config_bundle_path = bundle_operations.make_config_file_path_directory()
                 self.bundle_config_formate = ConfigFormat(
                                 self.bundle_name_ldt.text(),
@@ -448,9 +423,17 @@ class Saver(QtWidgets.QWidget):
                 )
                 bundle_operations.generate_info_file(self.bundle_config_formate.data(),
                                                      file_type=CONFIG_FILE)
-                latest_version_path = bundle_operations.make_info_file_path_directory()
-                display_publish_message(first_version)
-                helper(first_version)
+            
+            # Next vNNN reserved under the publish lock of the bundle
+            bundle_operations = BundleOpearations.allocate_version(bundle_directory,
+                                                                   self.templates.catalog_index,
+                                                                   self.templates.journal)
+            latest_version = bundle_operations.version
+            latest_version_path = bundle_operations.folder_path
+            display_publish_message(latest_version)
+            helper(latest_version)
+            # Journal records written, let the other clients know
+            self.templates.bump_generation()
 
           
     def publish(self):
@@ -491,6 +474,10 @@ class Saver(QtWidgets.QWidget):
                 display_messages(msg)
         else:
             self.create_bundles()
+            # pick up the published bundle into the catalog snapshot
+            self.loaded_templates().refresh()
+            if self.templates.journal.needs_compaction():
+                self.templates.compact_journal()
             self.bundle_name_ldt.clear()
             self.project_cbx.setCurrentIndex(-1)
             self.domain_cbx.setCurrentIndex(-1)
@@ -0,0 +1,247 @@
+#
+# In-memory search indexes over the catalog snapshot for template
+# pilot. Keeps the importer search box, filters and the saver 
+# validation instant on catalogs with hundreds of thousands of entries.
+#
+from collections import defaultdict
+
+# Grams up to this length were indexed. Longer queries intersect
+# the postings of their grams and verify the candidates.
+GRAM_SIZE = 3
+
+
+class TrigramIndex:
+
+    """
+    Substring index of texts. Every 1, 2 and 3 character gram of
+    the text is posted against the key of the text. Query of 3 or
+    less characters answered with one posting lookup, longer queries
+    intersect the trigram postings and check the few candidates left.
+
+    Example:
+        index.add('/Magical/Obj/aln/fog_rig', 'fog_rig')
+        index.search('g_r') -> {'/Magical/Obj/aln/fog_rig'}
+    """
+
+    def __init__(self) -> None:
+
+        """Initialize empty postings"""
+        self.texts = {}
+        self.postings = defaultdict(set)
+
+    @staticmethod
+    def grams(text: str) -> set:
+
+        """All the grams of the text up to GRAM_SIZE
+
+        Args:
+            text (str): text to split
+
+        Returns:
+            set: grams of the text
+        """
+
+        return {text[start:start + size]
+                for size in range(1, GRAM_SIZE + 1)
+                for start in range(len(text) - size + 1)}
+
+    def add(self,
+            key,
+            text: str) -> None:
+        """Index the text for the key. Re-indexed if the key exist.
+
+        Args:
+            key (hashable): key returned by the search
+            text (str): text to index
+        """
+
+        if key in self.texts:
+            if self.texts[key] == text:
+                return
+            self.remove(key)
+        self.texts[key] = text
+        for gram in self.grams(text):
+            self.postings[gram].add(key)
+
+    def remove(self,
+               key) -> None:
+        """Remove the key from the index
+
+        Args:
+            key (hashable): key of the text
+        """
+
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self.grams(text):
+            keys = self.postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[gram]
+
+    def search(self,
+               query: str) -> set:
+        """Keys of the texts containing the query
+
+        Args:
+            query (str): substring to look for
+
+        Returns:
+            set: matching keys
+        """
+
+        if not query:
+            return set(self.texts)
+        if len(query) <= GRAM_SIZE:
+            return set(self.postings.get(query, ()))
+
+        postings = []
+        for start in range(len(query) - GRAM_SIZE + 1):
+            keys = self.postings.get(query[start:start + GRAM_SIZE])
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return candidates
+        return {key for key in candidates if query in self.texts[key]}
+
+    def __len__(self) -> int:
+
+        return len(self.texts)
+
+
+
+class FacetIndex:
+
+    """
+    Inverted index of records over categorical fields. Every
+    (field, value) pair posted against the ids of the records holding
+    it. Any combination of field filters answered by intersecting the
+    postings, smallest first.
+
+    Example:
+        index.add(7, project='aln', domain='Magical', context='Sop', bundle='fog_rig')
+        index.lookup(domain='Magical', context='Sop') -> {7}
+    """
+
+    def __init__(self) -> None:
+
+        """Initialize empty postings"""
+        self.records = {}
+        self.postings = defaultdict(set)
+
+    def add(self,
+            record_id,
+            **facets) -> None:
+        """Index the record under each of its field values
+
+        Args:
+            record_id (hashable): id returned by the lookups
+            facets (str): field name and value pairs of the record
+        """
+
+        self.remove(record_id)
+        self.records[record_id] = facets
+        for facet in facets.items():
+            self.postings[facet].add(record_id)
+
+    def remove(self,
+               record_id) -> None:
+        """Remove the record from the index
+
+        Args:
+            record_id (hashable): id of the record
+        """
+
+        facets = self.records.pop(record_id, None)
+        if facets is None:
+            return
+        for facet in facets.items():
+            record_ids = self.postings.get(facet)
+            if record_ids is not None:
+                record_ids.discard(record_id)
+                if not record_ids:
+                    del self.postings[facet]
+
+    def lookup(self,
+               **facets) -> set:
+        """Ids of the records matching every given field value
+
+        Args:
+            facets (str): field name and value pairs to match
+
+        Returns:
+            set: matching record ids, every record if no field given
+        """
+
+        if not facets:
+            return set(self.records)
+        postings = sorted((self.postings.get(facet, set()) for facet in facets.items()),
+                          key=len)
+        record_ids = set(postings[0])
+        for other_ids in postings[1:]:
+            if not record_ids:
+                break
+            record_ids &= other_ids
+        return record_ids
+
+    def union(self,
+              field: str,
+              values) -> set:
+        """Ids of the records holding any of the values in the field
+
+        Args:
+            field (str): field name
+            values (iterable): field values
+
+        Returns:
+            set: matching record ids
+        """
+
+        record_ids = set()
+        for value in values:
+            record_ids |= self.postings.get((field, value), set())
+        return record_ids
+
+    def values(self,
+               field: str) -> set:
+        """Distinct values of the field
+
+        Args:
+            field (str): field name
+
+        Returns:
+            set: field values
+        """
+
+        return {value for posted_field, value in self.postings if posted_field == field}
+
+    def __len__(self) -> int:
+
+        return len(self.records)
+
+
+if __name__ == '__main__':
+
+    trigram_index = TrigramIndex()
+    trigram_index.add(1, 'fog_rig_a')
+    trigram_index.add(2, 'water_splash')
+    trigram_index.add(3, 'fog_volume')
+    print(trigram_index.search('fog'))
+    print(trigram_index.search('g_ri'))
+    trigram_index.remove(1)
+    print(trigram_index.search('fog_'))
+
+    facet_index = FacetIndex()
+    facet_index.add(1, project='aln', domain='Magical', context='Sop', bundle='fog_rig_a')
+    facet_index.add(2, project='aln', domain='Water', context='Sop', bundle='water_splash')
+    facet_index.add(3, project='bk', domain='Magical', context='Dop', bundle='fog_volume')
+    print(facet_index.lookup(domain='Magical'))
+    print(facet_index.lookup(project='aln', context='Sop'))
+    print(facet_index.values('bundle'))